@@ -0,0 +1,140 @@
+"""
+CLI 시작 시간 회귀 벤치마크.
+
+git hook에서 매번 실행되는 `gen-readme`의 시작 비용을 측정한다. 시나리오마다 새 인터프리터를
+`python -X importtime`으로 여러 번 실행해 경과 시간 중앙값과 gen_readme 모듈 import 시간을 구하고,
+--help 경로에서 불러오면 안 되는 모듈(halo, asyncio, 제공자 구현 등)이 import되었는지 확인한다.
+예산을 넘거나 금지 모듈이 import되면 종료 코드 1을 반환하므로 CI에서 그대로 사용할 수 있다.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 20 --budget-ms 80 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+# --help가 이 시간(중앙값, 인터프리터 시작 포함) 안에 끝나야 한다.
+DEFAULT_BUDGET_MS = 100.0
+# --help와 인자 오류 경로에서 import되면 안 되는 모듈 (LLM을 호출할 때만 필요)
+FORBIDDEN_ON_HELP = (
+    "halo",
+    "asyncio",
+    "ssl",
+    "http.client",
+    "gen_readme.app",
+    "gen_readme.providers.gemini.gemini",
+    "gen_readme.providers.openai_compat.openai_compat",
+)
+SCENARIOS = {
+    "python": ["-c", "pass"],
+    "help": ["-m", "gen_readme", "--help"],
+    "bad-args": ["-m", "gen_readme", "--no-such-option"],
+    "import-app": ["-c", "import gen_readme.app"],
+}
+# 예산을 적용하는 시나리오 (python은 비교용 기준선)
+BUDGETED = ("help", "bad-args")
+
+
+def _parse_importtime(stderr: str) -> tuple[dict[str, int], int]:
+    """
+    -X importtime 출력에서 모듈별 누적 import 시간(us)과,
+    최상위에서 import된 gen_readme 모듈들의 누적 시간 합(us)을 꺼낸다.
+    """
+    modules = {}
+    own = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, raw_name = line[len("import time:"):].split("|")
+            us = int(cumulative)
+        except ValueError:
+            continue  # 머리글 줄
+        name = raw_name.strip()
+        modules[name] = us
+        if name.startswith("gen_readme") and len(raw_name) - len(raw_name.lstrip()) == 1:
+            own += us
+    return modules, own
+
+
+def run_scenario(args: list[str], repeat: int) -> dict:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")]))}
+    env.pop("PYTHONSTARTUP", None)
+    wall, own = [], []
+    modules: dict[str, int] = {}
+    for i in range(repeat + 1):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        if i == 0:
+            continue  # 첫 실행은 .pyc 생성과 디스크 캐시 때문에 버린다.
+        modules, own_us = _parse_importtime(proc.stderr)
+        wall.append(elapsed)
+        own.append(own_us / 1000)
+    slowest = sorted(
+        ((name, us) for name, us in modules.items() if not name.startswith("encodings")),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:8]
+    return {
+        "wall_ms": round(statistics.median(wall), 1),
+        "wall_ms_min": round(min(wall), 1),
+        "gen_readme_import_ms": round(statistics.median(own), 1),
+        "modules": len(modules),
+        "forbidden": [name for name in FORBIDDEN_ON_HELP if name in modules],
+        "slowest": [{"module": name, "cumulative_ms": round(us / 1000, 1)} for name, us in slowest],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="gen-readme CLI 시작 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10, help="시나리오별 반복 횟수 (기본값: 10)")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"--help/인자 오류 경로의 경과 시간 중앙값 상한(ms) (기본값: {DEFAULT_BUDGET_MS:.0f})",
+    )
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="쉼표로 구분한 시나리오")
+    parser.add_argument("--output", default=None, help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    results = {}
+    failures = []
+    for name in args.scenarios.split(","):
+        result = results[name] = run_scenario(SCENARIOS[name], args.repeat)
+        print(
+            f"{name:<11} wall {result['wall_ms']:>7.1f}ms (min {result['wall_ms_min']:.1f})  "
+            f"gen_readme import {result['gen_readme_import_ms']:>6.1f}ms  modules {result['modules']}"
+        )
+        for row in result["slowest"][:5]:
+            print(f"    {row['cumulative_ms']:>7.1f}ms  {row['module']}")
+        if name in BUDGETED:
+            if result["wall_ms"] > args.budget_ms:
+                failures.append(f"{name}: {result['wall_ms']:.1f}ms > 예산 {args.budget_ms:.0f}ms")
+            if result["forbidden"]:
+                failures.append(f"{name}: 불필요한 모듈 import {', '.join(result['forbidden'])}")
+
+    if args.output:
+        report = {"python": sys.version.split()[0], "budget_ms": args.budget_ms, "results": results}
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    for failure in failures:
+        print(f"[실패] {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+gemini stream-json 파서 마이크로 벤치마크.
+
+기록된(또는 합성한) 수 MB 크기의 stream-json 출력을 기존 방식(줄마다 str로 디코딩 후 json.loads)과
+GeminiStreamParser.feed_bytes(접두사 판별 + orjson/json)로 각각 파싱해 시간을 비교한다.
+
+    python benchmarks/bench_stream_parser.py                 # 합성 스트림(약 8MB)
+    python benchmarks/bench_stream_parser.py --input rec.jsonl  # 실제 gemini 출력 기록
+    python benchmarks/bench_stream_parser.py --record rec.jsonl # 합성 스트림을 파일로 저장
+"""
+
+import argparse
+import io
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from gen_readme.providers.gemini import gemini_parser  # noqa: E402
+from gen_readme.providers.gemini.gemini_parser import GeminiStreamParser, RateLimitedLog  # noqa: E402
+
+
+def synthesize_stream(target_bytes: int, seed: int = 0) -> bytes:
+    """도구 호출, thought, 응답 조각이 섞인 stream-json 출력을 만든다. (gemini CLI처럼 공백 없는 JSON)"""
+    rng = random.Random(seed)
+    words = ["context", "module", "function", "README", "패키지", "설정", "파일", "의존성"]
+
+    def text(n: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(n))
+
+    lines = [json.dumps({"type": "init", "session_id": "bench-session"}, separators=(",", ":"))]
+    size = len(lines[0])
+    while size < target_bytes:
+        roll = rng.random()
+        if roll < 0.45:
+            event = {
+                "type": "tool_result",
+                "tool_id": f"read-{len(lines)}",
+                "status": "success",
+                "output": text(rng.randint(200, 2000)),
+            }
+        elif roll < 0.6:
+            event = {"type": "tool_use", "tool_name": "read_file", "parameters": {"path": f"src/m{len(lines)}.py"}}
+        elif roll < 0.85:
+            event = {"type": "thought", "content": text(rng.randint(10, 60))}
+        else:
+            event = {"type": "message", "role": "assistant", "content": text(rng.randint(5, 40)), "delta": True}
+        line = json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+        lines.append(line)
+        size += len(line.encode("utf-8")) + 1
+    lines.append(json.dumps({"type": "result", "status": "success"}, separators=(",", ":")))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def parse_baseline(data: bytes, sink: io.StringIO) -> str:
+    """변경 전 방식: 줄마다 str로 디코딩하고 모든 이벤트를 json.loads, thought는 바로 출력."""
+    parts = []
+    for raw in data.splitlines():
+        line = raw.decode("utf-8", errors="replace")
+        try:
+            event = json.loads(line)
+            if event.get("type") == "thought" and "content" in event:
+                print(f"[CoT] {event['content']}", file=sink, flush=True)
+            elif event.get("type") == "message" and event.get("role") == "assistant" and "content" in event:
+                parts.append(event["content"])
+        except (json.JSONDecodeError, KeyError, AttributeError):
+            pass
+    return "".join(parts).strip()
+
+
+def parse_fast(data: bytes, sink: io.StringIO) -> str:
+    parser = GeminiStreamParser(log=RateLimitedLog(stream=sink))
+    for line in data.split(b"\n"):
+        parser.feed_bytes(line)
+    return parser.result()[1] or ""
+
+
+def measure(func, data: bytes, repeat: int) -> tuple[float, str]:
+    best = float("inf")
+    result = ""
+    for _ in range(repeat):
+        sink = io.StringIO()
+        start = time.perf_counter()
+        result = func(data, sink)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="stream-json 파서 마이크로 벤치마크")
+    parser.add_argument("--input", help="기록된 gemini stream-json 출력 파일")
+    parser.add_argument("--record", help="합성한 스트림을 저장할 경로")
+    parser.add_argument("--size-mb", type=float, default=8.0, help="합성 스트림 크기(MB, 기본값: 8)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값을 보고)")
+    args = parser.parse_args()
+
+    if args.input:
+        data = Path(args.input).read_bytes()
+    else:
+        data = synthesize_stream(int(args.size_mb * 1024 * 1024))
+        if args.record:
+            Path(args.record).write_bytes(data)
+
+    baseline_time, baseline_result = measure(parse_baseline, data, args.repeat)
+    fast_time, fast_result = measure(parse_fast, data, args.repeat)
+    if baseline_result != fast_result:
+        print("[에러] 두 파서의 결과가 다릅니다.", file=sys.stderr)
+        return 1
+
+    mb = len(data) / (1024 * 1024)
+    line_count = data.count(b"\n")
+    backend = "orjson" if gemini_parser._loads is not json.loads else "json"
+    print(f"stream: {mb:.1f}MB, {line_count:,} lines, decoder: {backend}")
+    print(f"baseline: {baseline_time * 1000:8.1f} ms ({mb / baseline_time:7.1f} MB/s)")
+    print(f"fast:     {fast_time * 1000:8.1f} ms ({mb / fast_time:7.1f} MB/s)  x{baseline_time / fast_time:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
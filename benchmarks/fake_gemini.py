@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 gemini CLI 대역.
+
+기록된 stream-json 대화(JSONL)를 그대로 stdout에 다시 내보낸다. 실제 CLI처럼 프롬프트의
+`@경로` 파일을 모두 읽으므로 컨텍스트 샤드를 읽는 비용도 측정에 포함된다.
+표준 라이브러리만 사용하며, 다음 환경 변수로 동작을 바꾼다.
+
+    GEN_README_BENCH_TRANSCRIPT   재생할 JSONL 파일 (기본값: transcripts/default.jsonl)
+    GEN_README_BENCH_LATENCY      첫 이벤트 전 대기 시간(초, 모델 왕복 지연)
+    GEN_README_BENCH_CHUNK_DELAY  이벤트 사이 대기 시간(초)
+    GEN_README_BENCH_CALL_LOG     호출마다 한 줄씩 JSON 기록을 덧붙일 파일
+
+섹션 병렬 생성(--parallel-sections)의 목차/섹션 프롬프트에는 기록의 message 이벤트 대신
+그에 맞는 응답을 내보낸다. 섹션 응답은 분석(thought/tool) 이벤트와 message 이벤트를 섹션 수로 나눈
+만큼만 내보내므로, 이벤트 사이 지연을 주면 섹션 하나의 시간이 전체 README의 약 1/섹션 수가 된다.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+DEFAULT_TRANSCRIPT = Path(__file__).resolve().parent / "transcripts" / "default.jsonl"
+_FILE_REFERENCE = re.compile(r"@(\S+)")
+_FILE_HEADER = b"\n===== FILE: "
+_OUTLINE_PROMPT = "목차만 정하라"
+_SECTION_TITLE = re.compile(r'"## (.+?)" 제목으로 시작하는')
+_OTHER_SECTIONS = re.compile(r"다른 섹션\((.*?)\)은")
+_OUTLINE = "# sample-service\n\n## 개요\n서비스 소개\n## 구성\n모듈 구조\n파일: *.py\n## 사용법\n설치와 실행\n## 설정\n환경 변수\n"
+
+
+def _read_context(prompt: str) -> tuple[int, int]:
+    """프롬프트가 참조하는 파일을 읽고 (파일 헤더 수, 읽은 바이트 수)를 반환한다."""
+    files = total = 0
+    for path in _FILE_REFERENCE.findall(prompt):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+        files += data.count(_FILE_HEADER)
+        total += len(data)
+    return files, total
+
+
+def _message(content: str) -> bytes:
+    return json.dumps({"type": "message", "role": "assistant", "content": content}, ensure_ascii=False).encode() + b"\n"
+
+
+def _events(transcript: Path, prompt: str) -> list[bytes]:
+    """재생할 이벤트 줄. 목차/섹션 프롬프트이면 message 이벤트를 그에 맞는 응답으로 바꾼다."""
+    with open(transcript, "rb") as f:
+        events = [line if line.endswith(b"\n") else line + b"\n" for line in f if line.strip()]
+    section = _SECTION_TITLE.search(prompt)
+    if _OUTLINE_PROMPT not in prompt and section is None:
+        return events
+    messages = [i for i, line in enumerate(events) if b'"type":"message"' in line.replace(b" ", b"")]
+    if not messages:
+        return events
+    # 목차 호출은 핵심 파일만 읽고, 섹션 호출은 전체의 1/섹션 수만큼 읽고 쓴다.
+    analysis = events[1 : messages[0]]
+    if section is None:
+        analysis, replies = [], [_message(_OUTLINE)]
+    else:
+        others = _OTHER_SECTIONS.search(prompt)
+        count = 1 + (others.group(1).count('"') // 2 if others else 0)
+        analysis = analysis[: -(-len(analysis) // count)]
+        title = section.group(1)
+        replies = [_message(f"## {title}\n\n")] + [
+            _message(f"- {title} 항목 {n}: 섹션별 컨텍스트로 작성한 내용입니다.\n")
+            for n in range(1, -(-len(messages) // count))
+        ]
+    return events[:1] + analysis + replies + events[messages[-1] + 1 :]
+
+
+def main(argv: list[str]) -> int:
+    if "--version" in argv:
+        print("0.0.0-bench")
+        return 0
+    prompt = argv[-1] if argv else ""
+    started = time.time()
+    context_files, context_bytes = _read_context(prompt)
+
+    latency = float(os.environ.get("GEN_README_BENCH_LATENCY", "0") or 0)
+    chunk_delay = float(os.environ.get("GEN_README_BENCH_CHUNK_DELAY", "0") or 0)
+    transcript = Path(os.environ.get("GEN_README_BENCH_TRANSCRIPT") or DEFAULT_TRANSCRIPT)
+
+    if latency:
+        time.sleep(latency)
+    out = sys.stdout.buffer
+    for line in _events(transcript, prompt):
+        out.write(line)
+        if chunk_delay:
+            out.flush()
+            time.sleep(chunk_delay)
+    out.flush()
+
+    call_log = os.environ.get("GEN_README_BENCH_CALL_LOG")
+    if call_log:
+        record = {
+            "pid": os.getpid(),
+            "resume": "--resume" in argv,
+            "prompt_bytes": len(prompt.encode("utf-8")),
+            "context_files": context_files,
+            "context_bytes": context_bytes,
+            "seconds": round(time.time() - started, 4),
+        }
+        with open(call_log, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+openai 제공자 테스트/벤치마크용 OpenAI 호환 API 대역 서버.
+
+POST /v1/chat/completions 요청에 기록된 대화(transcripts/*.jsonl)의 README 조각을
+Server-Sent Events로 스트리밍한다. HTTP/1.1 keep-alive를 지원하므로 연결 재사용을 확인할 수 있고,
+처음 몇 번의 요청을 429/503으로 거절해 재시도와 백오프를 시험할 수 있다. 표준 라이브러리만 사용한다.
+
+    python benchmarks/fake_openai_server.py --port 8765 --fail-first 2 --log /tmp/requests.jsonl
+    GEN_README_MODEL=bench gen-readme -p openai --api-base http://127.0.0.1:8765/v1 --stdout
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+DEFAULT_TRANSCRIPT = Path(__file__).resolve().parent / "transcripts" / "default.jsonl"
+
+
+def load_chunks(transcript: Path) -> list[str]:
+    """stream-json 대화 기록에서 assistant 메시지 조각만 꺼낸다."""
+    chunks = []
+    with open(transcript, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            if event.get("type") == "message" and event.get("role") == "assistant" and event.get("content"):
+                chunks.append(event["content"])
+    return chunks
+
+
+class _State:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.chunks = load_chunks(Path(args.transcript))
+        self.requests = 0
+        self.connection_ids = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def next_request(self) -> int:
+        with self.lock:
+            self.requests += 1
+            return self.requests
+
+    def log(self, record: dict) -> None:
+        if not self.args.log:
+            return
+        with self.lock, open(self.args.log, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: _State
+
+    def setup(self):
+        super().setup()
+        self.connection_id = next(self.state.connection_ids)
+
+    def log_message(self, format, *args):
+        if self.state.args.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, body: dict, headers: dict | None = None) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        args = self.state.args
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        number = self.state.next_request()
+        try:
+            request = json.loads(body)
+        except ValueError:
+            self._send_json(400, {"error": {"message": "invalid JSON"}})
+            return
+        record = {
+            "request": number,
+            "connection": self.connection_id,
+            "path": self.path,
+            "model": request.get("model"),
+            "messages": len(request.get("messages") or []),
+            "request_bytes": len(body),
+            "authorized": self.headers.get("Authorization", "").startswith("Bearer "),
+        }
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+            self.state.log({**record, "status": 404})
+            return
+        if number <= args.fail_first:
+            self._send_json(
+                args.fail_status,
+                {"error": {"message": "rate limited by stand-in server"}},
+                {"Retry-After": str(args.retry_after)} if args.retry_after is not None else None,
+            )
+            self.state.log({**record, "status": args.fail_status})
+            return
+
+        if args.latency:
+            time.sleep(args.latency)
+        chunks = self.state.chunks
+        if args.chatty_first and request.get("messages") and len(request["messages"]) == 1:
+            chunks = ["네, 알겠습니다. 코드를 분석한 뒤 README를 작성하겠습니다."]
+        if not request.get("stream") or args.no_stream:
+            self._send_json(
+                200,
+                {"choices": [{"index": 0, "message": {"role": "assistant", "content": "".join(chunks)}}]},
+            )
+            self.state.log({**record, "status": 200, "stream": False})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in chunks:
+            event = {"choices": [{"index": 0, "delta": {"content": chunk}}]}
+            self._write_chunk(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+            if args.chunk_delay:
+                time.sleep(args.chunk_delay)
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
+        self.state.log({**record, "status": 200, "stream": True})
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="OpenAI 호환 API 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0이면 빈 포트를 골라 stdout에 출력")
+    parser.add_argument("--transcript", default=str(DEFAULT_TRANSCRIPT), help="README 조각을 가져올 stream-json 기록")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 전 대기 시간(초)")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="조각 사이 대기 시간(초)")
+    parser.add_argument("--fail-first", type=int, default=0, help="처음 N개 요청을 --fail-status로 거절")
+    parser.add_argument("--fail-status", type=int, default=429)
+    parser.add_argument("--retry-after", type=float, default=None, help="거절 응답에 붙일 Retry-After(초)")
+    parser.add_argument("--chatty-first", action="store_true", help="대화의 첫 턴에는 README 대신 대화 문장으로 응답")
+    parser.add_argument("--no-stream", action="store_true", help="스트리밍 없이 JSON 한 번으로 응답")
+    parser.add_argument("--log", default=None, help="요청마다 한 줄씩 JSON 기록을 덧붙일 파일")
+    parser.add_argument("--verbose", action="store_true", help="요청 로그를 stderr에 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    handler = type("Handler", (_Handler,), {"state": _State(args)})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    print(f"http://{args.host}:{server.server_address[1]}/v1", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
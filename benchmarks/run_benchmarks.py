@@ -0,0 +1,413 @@
+"""
+gen-readme 벤치마크 스위트.
+
+합성 저장소(1k/10k/100k 파일, git/비 git)를 만들고 단계별(collect, shard, prompt, parse)과
+전체 실행(e2e, e2e-warm, 섹션 병렬 생성 e2e-sections)을 각각 새 프로세스에서 측정해 JSON 보고서로 남긴다.
+LLM 호출은 기록된 stream-json 대화를 재생하는 fake_gemini.py로 대신한다.
+
+    python benchmarks/run_benchmarks.py                           # 1k/10k, git/plain, 모든 단계
+    python benchmarks/run_benchmarks.py --sizes 100000 --kinds git --phases collect,e2e
+    python benchmarks/run_benchmarks.py --latency 2 --chunk-delay 0.05 --output report.json
+    python benchmarks/run_benchmarks.py --baseline old-report.json  # 이전 릴리스와 비교
+    python benchmarks/run_benchmarks.py --sizes 1000 --phases e2e,e2e-sections --chunk-delay 0.5
+
+측정 항목: 경과 시간, 최대 RSS(본 프로세스/자식 프로세스), 파일 수/초, 바이트/초,
+실행한 하위 프로세스 수(git, gemini 등), gemini 호출 수.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from synthetic_repo import ensure_repo  # noqa: E402
+
+PHASES = ("collect", "shard", "prompt", "parse", "e2e", "e2e-warm", "e2e-sections")
+DEFAULT_SIZES = (1_000, 10_000)
+DEFAULT_KINDS = ("git", "plain")
+# parse 단계는 한 번이 너무 짧으므로 대화 기록을 여러 번 파싱한다.
+PARSE_REPEAT = 200
+
+
+# ---------------------------------------------------------------------------
+# 측정 대상 단계 (자식 프로세스에서 실행)
+# ---------------------------------------------------------------------------
+
+
+def _collect_stream(repo: Path, jobs: int | None):
+    from gen_readme import dir_text_collector, git_utils
+    from gen_readme.noise_filter import NoiseFilter
+
+    repo_ctx = git_utils.resolve_repo_context(repo)
+    stats = dir_text_collector.CollectionStats()
+    stream = dir_text_collector.stream_all_files(
+        str(repo),
+        repo_ctx=repo_ctx,
+        jobs=jobs,
+        stats=stats,
+        dedupe=True,
+        noise=NoiseFilter.from_directories(repo_ctx.git_root, repo),
+    )
+    return stream, stats
+
+
+def _phase_collect(repo: Path, options: dict) -> dict:
+    stream, stats = _collect_stream(repo, options["jobs"])
+    for _ in stream:
+        pass
+    return {"files": stats.files, "bytes": stats.bytes_read}
+
+
+def _phase_shard(repo: Path, options: dict) -> dict:
+    from gen_readme.temp_utils import TempDirManager
+
+    # 수집은 측정에서 제외하고, 메모리에 모은 스트림을 샤드로 쓰는 시간만 잰다.
+    stream, stats = _collect_stream(repo, options["jobs"])
+    chunks = list(stream)
+    start = time.perf_counter()
+    with TempDirManager(shard_size=options["shard_size"]) as temp_manager:
+        paths = temp_manager.save_content_to_temp_files(iter(chunks))
+        written = sum(os.path.getsize(p) for p in paths)
+    return {"files": stats.files, "bytes": written, "timed_from": start, "shards": len(paths)}
+
+
+def _phase_prompt(repo: Path, options: dict) -> dict:
+    from gen_readme.prompting import GeminiPromptBuilder
+    from gen_readme.temp_utils import TempDirManager
+
+    stream, stats = _collect_stream(repo, options["jobs"])
+    with TempDirManager(shard_size=options["shard_size"]) as temp_manager:
+        paths = temp_manager.save_content_to_temp_files(stream)
+        builder = GeminiPromptBuilder()
+        start = time.perf_counter()
+        prompt = ""
+        for _ in range(PARSE_REPEAT):
+            prompt = builder.build_prompt_new(paths, "벤치마크 요청")
+    return {"files": stats.files, "bytes": len(prompt.encode("utf-8")) * PARSE_REPEAT, "timed_from": start}
+
+
+def _phase_parse(repo: Path, options: dict) -> dict:
+    from gen_readme.providers.gemini.gemini_parser import GeminiStreamParser, RateLimitedLog
+
+    data = Path(options["transcript"]).read_bytes()
+    lines = data.split(b"\n")
+    with open(os.devnull, "w") as sink:
+        start = time.perf_counter()
+        for _ in range(PARSE_REPEAT):
+            parser = GeminiStreamParser(log=RateLimitedLog(stream=sink))
+            for line in lines:
+                parser.feed_bytes(line)
+            parser.result()
+    return {"bytes": len(data) * PARSE_REPEAT, "timed_from": start}
+
+
+def _run_app(repo: Path, options: dict, cache_dir: str, extra_args: tuple[str, ...] = ()) -> None:
+    from gen_readme import app
+
+    argv = [
+        "gen-readme",
+        str(repo),
+        "--stdout",
+        "--no-response-cache",
+        "--cache-dir",
+        cache_dir,
+        "--shard-size",
+        str(options["shard_size"] // 1024),
+    ]
+    if options["jobs"]:
+        argv += ["-j", str(options["jobs"])]
+    argv += extra_args
+    saved_argv = sys.argv
+    sys.argv = argv
+    try:
+        app.run()
+    finally:
+        sys.argv = saved_argv
+
+
+def _phase_e2e(repo: Path, options: dict) -> dict:
+    with tempfile.TemporaryDirectory(prefix="gen-readme-bench-cache-") as cache_dir:
+        _run_app(repo, options, cache_dir)
+    return {}
+
+
+def _phase_e2e_warm(repo: Path, options: dict) -> dict:
+    # 같은 수집 캐시로 한 번 실행해 둔 뒤 두 번째 실행만 잰다.
+    with tempfile.TemporaryDirectory(prefix="gen-readme-bench-cache-") as cache_dir:
+        _run_app(repo, options, cache_dir)
+        _reset_counters()
+        start = time.perf_counter()
+        _run_app(repo, options, cache_dir)
+    return {"timed_from": start}
+
+
+def _phase_e2e_sections(repo: Path, options: dict) -> dict:
+    # --parallel-sections: 목차 호출 한 번과 섹션별 동시 호출. --chunk-delay를 주면 e2e와 지연 시간을 비교할 수 있다.
+    with tempfile.TemporaryDirectory(prefix="gen-readme-bench-cache-") as cache_dir:
+        _run_app(repo, options, cache_dir, ("--parallel-sections",))
+    return {}
+
+
+_PHASE_FUNCS = {
+    "collect": _phase_collect,
+    "shard": _phase_shard,
+    "prompt": _phase_prompt,
+    "parse": _phase_parse,
+    "e2e": _phase_e2e,
+    "e2e-warm": _phase_e2e_warm,
+    "e2e-sections": _phase_e2e_sections,
+}
+_spawned = 0
+
+
+def _count_subprocesses() -> None:
+    """subprocess.Popen(asyncio 하위 프로세스 포함) 생성 횟수를 센다."""
+    original_init = subprocess.Popen.__init__
+
+    def counting_init(self, *args, **kwargs):
+        global _spawned
+        _spawned += 1
+        original_init(self, *args, **kwargs)
+
+    subprocess.Popen.__init__ = counting_init
+
+
+def _reset_counters() -> None:
+    global _spawned
+    _spawned = 0
+    call_log = os.environ.get("GEN_README_BENCH_CALL_LOG")
+    if call_log:
+        Path(call_log).write_text("", encoding="utf-8")
+
+
+def _max_rss_mb(who: int) -> float:
+    rss = resource.getrusage(who).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def measure_phase(phase: str, repo: Path, options: dict, result_file: Path) -> None:
+    """자식 프로세스에서 한 단계를 실행하고 측정값을 result_file에 JSON으로 쓴다."""
+    _count_subprocesses()
+    _reset_counters()
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull:
+        saved = sys.stdout, sys.stderr
+        # 진행 메시지와 README 출력은 측정 결과에 섞이지 않도록 버린다.
+        sys.stdout = sys.stderr = devnull
+        try:
+            info = _PHASE_FUNCS[phase](repo, options)
+        finally:
+            sys.stdout, sys.stderr = saved
+    end = time.perf_counter()
+    wall = end - info.pop("timed_from", start)
+
+    calls = []
+    call_log = os.environ.get("GEN_README_BENCH_CALL_LOG")
+    if call_log and Path(call_log).exists():
+        calls = [json.loads(line) for line in Path(call_log).read_text(encoding="utf-8").splitlines() if line]
+    if calls and "files" not in info:
+        # 전체 실행은 gemini가 받은 컨텍스트(첫 호출)를 처리량 기준으로 삼는다.
+        info.update(files=calls[0]["context_files"], bytes=calls[0]["context_bytes"])
+    result = {
+        "wall_seconds": round(wall, 4),
+        "peak_rss_mb": _max_rss_mb(resource.RUSAGE_SELF),
+        "children_peak_rss_mb": _max_rss_mb(resource.RUSAGE_CHILDREN),
+        "subprocesses": _spawned,
+        "llm_calls": len(calls),
+        **info,
+    }
+    result_file.write_text(json.dumps(result), encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# 드라이버
+# ---------------------------------------------------------------------------
+
+
+def _write_gemini_launcher(bin_dir: Path) -> None:
+    """PATH 맨 앞에 둘 gemini 실행 파일. 현재 인터프리터로 fake_gemini.py를 실행한다."""
+    launcher = bin_dir / "gemini"
+    launcher.write_text(
+        f'#!/bin/sh\nexec "{sys.executable}" "{BENCH_DIR / "fake_gemini.py"}" "$@"\n',
+        encoding="utf-8",
+    )
+    launcher.chmod(0o755)
+
+
+def _run_child(phase: str, repo: Path, options: dict, env: dict, scratch: Path) -> dict:
+    result_file = scratch / "result.json"
+    result_file.unlink(missing_ok=True)
+    command = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "_measure",
+        phase,
+        str(repo),
+        str(result_file),
+        json.dumps(options),
+    ]
+    completed = subprocess.run(command, env=env, capture_output=True, text=True)
+    if completed.returncode != 0 or not result_file.exists():
+        return {"error": (completed.stderr.strip().splitlines() or ["알 수 없는 오류"])[-1]}
+    return json.loads(result_file.read_text(encoding="utf-8"))
+
+
+def _with_rates(result: dict) -> dict:
+    wall = result.get("wall_seconds") or 0
+    if wall and "files" in result:
+        result["files_per_sec"] = round(result["files"] / wall, 1)
+    if wall and "bytes" in result:
+        result["bytes_per_sec"] = round(result["bytes"] / wall, 1)
+    return result
+
+
+def _git_revision() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCH_DIR.parent,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    return completed.stdout.strip() or None
+
+
+def _compare(results: list[dict], baseline_path: str) -> None:
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    previous = {(r["repo"], r["phase"]): r for r in baseline.get("results", [])}
+    print(
+        f"\n기준 보고서와 비교: {baseline_path} ({baseline.get('meta', {}).get('revision')})",
+        file=sys.stderr,
+    )
+    for result in results:
+        old = previous.get((result["repo"], result["phase"]))
+        if not old or "wall_seconds" not in old or "wall_seconds" not in result:
+            continue
+        ratio = result["wall_seconds"] / old["wall_seconds"] if old["wall_seconds"] else float("inf")
+        rss = result["peak_rss_mb"] - old["peak_rss_mb"]
+        print(
+            f"  {result['repo']:<16} {result['phase']:<9} "
+            f"{old['wall_seconds']:8.3f}s -> {result['wall_seconds']:8.3f}s (x{ratio:.2f}), "
+            f"RSS {rss:+.1f}MB",
+            file=sys.stderr,
+        )
+
+
+def _parse_list(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["_measure"]:
+        phase, repo, result_file, options = argv[1:5]
+        measure_phase(phase, Path(repo), json.loads(options), Path(result_file))
+        return 0
+
+    parser = argparse.ArgumentParser(description="gen-readme 벤치마크 스위트")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="저장소 파일 수 목록 (예: 1000,10000,100000)")
+    parser.add_argument("--kinds", default=",".join(DEFAULT_KINDS), help="저장소 종류: git, plain")
+    parser.add_argument("--phases", default=",".join(PHASES), help=f"측정할 단계 ({', '.join(PHASES)})")
+    parser.add_argument("--repeat", type=int, default=1, help="단계별 반복 횟수 (가장 빠른 실행을 보고)")
+    parser.add_argument("--jobs", type=int, default=None, help="파일 수집 스레드 수 (기본값: 도구 기본값)")
+    parser.add_argument("--shard-size", type=int, default=256, help="샤드 크기(KB, 기본값: 256)")
+    parser.add_argument("--transcript", default=str(BENCH_DIR / "transcripts" / "default.jsonl"), help="fake gemini가 재생할 stream-json 기록")
+    parser.add_argument("--latency", type=float, default=0.0, help="gemini 호출마다 첫 응답 전 지연(초)")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="stream-json 이벤트 사이 지연(초)")
+    parser.add_argument("--workdir", default=str(Path(tempfile.gettempdir()) / "gen-readme-bench"), help="합성 저장소를 만들어 둘 디렉터리")
+    parser.add_argument("--regenerate", action="store_true", help="합성 저장소를 다시 만든다")
+    parser.add_argument("--seed", type=int, default=0, help="합성 저장소 seed")
+    parser.add_argument("--output", default=None, help="JSON 보고서 경로 (기본값: stdout)")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 JSON 보고서")
+    args = parser.parse_args(argv)
+
+    phases = _parse_list(args.phases)
+    unknown = set(phases) - set(PHASES)
+    if unknown:
+        parser.error(f"알 수 없는 단계: {', '.join(sorted(unknown))}")
+    options = {
+        "jobs": args.jobs,
+        "shard_size": args.shard_size * 1024,
+        "transcript": str(Path(args.transcript).resolve()),
+    }
+
+    workdir = Path(args.workdir)
+    workdir.mkdir(parents=True, exist_ok=True)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="gen-readme-bench-") as scratch_name:
+        scratch = Path(scratch_name)
+        bin_dir = scratch / "bin"
+        bin_dir.mkdir()
+        _write_gemini_launcher(bin_dir)
+        env = {
+            **os.environ,
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")])),
+            "GEN_README_BENCH_TRANSCRIPT": options["transcript"],
+            "GEN_README_BENCH_LATENCY": str(args.latency),
+            "GEN_README_BENCH_CHUNK_DELAY": str(args.chunk_delay),
+            "GEN_README_BENCH_CALL_LOG": str(scratch / "calls.jsonl"),
+        }
+
+        for kind in _parse_list(args.kinds):
+            for size in map(int, _parse_list(args.sizes)):
+                started = time.perf_counter()
+                repo = ensure_repo(workdir, size, git=kind == "git", seed=args.seed, regenerate=args.regenerate)
+                print(f"[정보] 저장소 준비: {repo} ({time.perf_counter() - started:.1f}초)", file=sys.stderr)
+                for phase in phases:
+                    runs = [_run_child(phase, repo, options, env, scratch) for _ in range(max(1, args.repeat))]
+                    ok = [run for run in runs if "error" not in run]
+                    best = min(ok, key=lambda run: run["wall_seconds"]) if ok else runs[0]
+                    result = _with_rates({"repo": repo.name, "kind": kind, "size": size, "phase": phase, **best})
+                    results.append(result)
+                    if "error" in result:
+                        print(f"[에러] {repo.name} {phase}: {result['error']}", file=sys.stderr)
+                    else:
+                        files_rate = f"{result['files_per_sec']:>10,.0f}" if "files_per_sec" in result else f"{'-':>10}"
+                        bytes_rate = result.get("bytes_per_sec", 0) / (1024 * 1024)
+                        print(
+                            f"  {repo.name:<16} {phase:<9} {result['wall_seconds']:8.3f}s "
+                            f"RSS {result['peak_rss_mb']:7.1f}MB "
+                            f"subprocs {result['subprocesses']:>3} "
+                            f"{files_rate} files/s {bytes_rate:>8.1f} MB/s",
+                            file=sys.stderr,
+                        )
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "options": {**vars(args), "transcript": options["transcript"]},
+        },
+        "results": results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2) + "\n"
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+        print(f"[정보] 보고서를 저장했습니다: {args.output}", file=sys.stderr)
+    else:
+        sys.stdout.write(text)
+    if args.baseline:
+        _compare(results, args.baseline)
+    return 1 if any("error" in result for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+벤치마크용 합성 저장소 생성기.
+
+소스 파일 외에 README 작성에 방해가 되는 파일(바이너리, lockfile, minified/생성 파일,
+.gitignore로 제외되는 빌드 결과물, 서로 거의 같은 파일)을 섞어 실제 모노레포와 비슷한
+구성을 만든다. 같은 (파일 수, 종류, seed)이면 항상 같은 내용이 만들어진다.
+"""
+
+import json
+import os
+import random
+import shutil
+import subprocess
+from pathlib import Path
+
+WORDS = [
+    "order", "payment", "settlement", "report", "client", "config", "event", "queue",
+    "retry", "cache", "user", "account", "invoice", "schema", "handler", "service",
+]
+# 전체 파일 수에 대한 종류별 비율 (나머지는 Python 소스)
+_MIX = {
+    "doc": 0.08,
+    "binary": 0.05,
+    "data": 0.04,
+    "generated": 0.03,
+    "duplicate": 0.05,
+    "ignored": 0.05,
+}
+_LOCK_FILES = ("poetry.lock", "package-lock.json", "yarn.lock")
+_GIT_ENV = {
+    "GIT_AUTHOR_NAME": "bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+
+def _identifier(rng: random.Random) -> str:
+    return "_".join(rng.sample(WORDS, 2))
+
+
+def _python_module(rng: random.Random, index: int) -> str:
+    lines = [f'"""{_identifier(rng)} 모듈 {index}."""', "", "import json", "import os", ""]
+    for _ in range(rng.randint(2, 12)):
+        name = _identifier(rng)
+        lines += [
+            f"class {name.title().replace('_', '')}:",
+            f'    """{" ".join(rng.choices(WORDS, k=8))}"""',
+            "",
+            "    def __init__(self, value):",
+            "        self.value = value",
+            "",
+        ]
+        for _ in range(rng.randint(1, 4)):
+            method = _identifier(rng)
+            lines += [
+                f"    def {method}(self, payload: dict) -> dict:",
+                f"        result = {{k: v for k, v in payload.items() if k != '{rng.choice(WORDS)}'}}",
+                f"        result['{rng.choice(WORDS)}'] = self.value * {rng.randint(1, 99)}",
+                "        return result",
+                "",
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def _markdown(rng: random.Random, index: int) -> str:
+    parts = [f"# {_identifier(rng)} {index}", ""]
+    for _ in range(rng.randint(2, 6)):
+        parts += [f"## {rng.choice(WORDS)}", "", " ".join(rng.choices(WORDS, k=rng.randint(30, 120))), ""]
+    return "\n".join(parts)
+
+
+def _binary(rng: random.Random) -> bytes:
+    return b"\x89PNG\r\n\x1a\n" + rng.randbytes(rng.randint(2 * 1024, 64 * 1024))
+
+
+def _data(rng: random.Random) -> str:
+    rows = [{"id": i, "name": _identifier(rng), "amount": rng.randint(0, 10**6)} for i in range(rng.randint(50, 2000))]
+    return json.dumps(rows, indent=1)
+
+
+def _generated(rng: random.Random, index: int) -> tuple[str, str]:
+    if index % 2:
+        body = ";".join(f"var {_identifier(rng)}{i}=function(a){{return a*{i}}}" for i in range(rng.randint(200, 800)))
+        return f"static/js/bundle{index}.min.js", body
+    lines = ["# Generated by the protocol buffer compiler.  DO NOT EDIT!", "from google.protobuf import descriptor", ""]
+    lines += [f"_{_identifier(rng).upper()}{i} = descriptor.FieldDescriptor(name='{rng.choice(WORDS)}', index={i})" for i in range(rng.randint(50, 300))]
+    return f"proto/{_identifier(rng)}_{index}_pb2.py", "\n".join(lines) + "\n"
+
+
+def _lock_file(rng: random.Random, name: str) -> str:
+    entries = [f'[[package]]\nname = "{_identifier(rng)}-{i}"\nversion = "1.{i}.0"\n' for i in range(rng.randint(300, 1200))]
+    return "\n".join(entries) if name.endswith(".lock") else json.dumps({"packages": entries}, indent=2)
+
+
+def _write(root: Path, relative: str, content: str | bytes) -> None:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content, encoding="utf-8")
+
+
+def generate_repo(root: Path, file_count: int, git: bool = True, seed: int = 0) -> Path:
+    """
+    root에 file_count개 내외의 파일로 이루어진 합성 저장소를 만든다.
+    git이 True이면 저장소로 초기화하고 추적 대상 파일을 모두 커밋한다.
+    """
+    rng = random.Random(seed * 1_000_003 + file_count)
+    if root.exists():
+        shutil.rmtree(root)
+    root.mkdir(parents=True)
+
+    counts = {kind: max(1, int(file_count * ratio)) for kind, ratio in _MIX.items()}
+    source_count = max(1, file_count - sum(counts.values()) - len(_LOCK_FILES) - 2)
+
+    _write(root, ".gitignore", "build/\n*.log\n__pycache__/\n")
+    _write(root, "pyproject.toml", f'[project]\nname = "synthetic-{file_count}"\nversion = "0.1.0"\n')
+    for name in _LOCK_FILES:
+        _write(root, name, _lock_file(rng, name))
+
+    sources = []
+    for i in range(source_count):
+        relative = f"src/pkg_{i // 200:03d}/{_identifier(rng)}_{i}.py"
+        content = _python_module(rng, i)
+        sources.append(content)
+        _write(root, relative, content)
+    for i in range(counts["duplicate"]):
+        # 다른 모듈을 그대로 또는 한 줄만 바꿔 복사한 파일 (벤더링/복붙 코드)
+        content = rng.choice(sources)
+        if i % 2:
+            content += f"\nVERSION = {i}\n"
+        _write(root, f"vendor/copy_{i // 200:03d}/module_{i}.py", content)
+    for i in range(counts["doc"]):
+        _write(root, f"docs/{i // 200:03d}/{_identifier(rng)}_{i}.md", _markdown(rng, i))
+    for i in range(counts["binary"]):
+        _write(root, f"assets/{i // 200:03d}/image_{i}.png", _binary(rng))
+    for i in range(counts["data"]):
+        _write(root, f"fixtures/{i // 200:03d}/data_{i}.json", _data(rng))
+    for i in range(counts["generated"]):
+        relative, content = _generated(rng, i)
+        _write(root, relative, content)
+    for i in range(counts["ignored"]):
+        # .gitignore로 제외되는 빌드 결과물 (git 저장소가 아니면 수집 대상이 된다)
+        _write(root, f"build/lib/{i // 200:03d}/module_{i}.py", rng.choice(sources))
+
+    if git:
+        env = {**os.environ, **_GIT_ENV}
+        for cmd in (
+            ["git", "init", "-q"],
+            ["git", "add", "-A"],
+            ["git", "-c", "commit.gpgsign=false", "commit", "-q", "-m", "synthetic repository"],
+        ):
+            subprocess.run(cmd, cwd=root, env=env, check=True)
+    return root
+
+
+def ensure_repo(workdir: Path, file_count: int, git: bool, seed: int = 0, regenerate: bool = False) -> Path:
+    """이미 만들어 둔 같은 구성의 저장소가 있으면 재사용한다. (10만 개 저장소는 생성에 수십 초가 걸린다)"""
+    name = f"{'git' if git else 'plain'}-{file_count}-s{seed}"
+    root = workdir / name
+    marker = workdir / f"{name}.done"
+    if regenerate or not marker.exists() or not root.is_dir():
+        marker.unlink(missing_ok=True)
+        generate_repo(root, file_count, git=git, seed=seed)
+        marker.write_text("ok\n", encoding="utf-8")
+    return root
@@ -3,8 +3,8 @@
 """
 import sys
 
-from gen_readme.app import main
+from gen_readme.cli import main
 
 if __name__ == "__main__":
-    # gen_readme.main.main()은 종료 코드를 반환하므로 sys.exit()로 전달합니다.
+    # gen_readme.cli.main()은 종료 코드를 반환하므로 sys.exit()로 전달합니다.
     sys.exit(main())
@@ -1,6 +1,12 @@
+import contextlib
+import functools
+import os
 import pathlib
 import sys
-from typing import Iterator
+import threading
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 from . import dir_text_collector, temp_utils
 from .providers import get_provider
@@ -26,20 +32,37 @@ def combine_streams(
 ) -> Iterator[str]:
     """기존 README 및 템플릿 내용을 파일 내용 스트림에 추가합니다."""
     if template_content and template_path:
-        yield f"===== FILE: {template_path} (README 템플릿) =====\n\n"
+        title = f"{template_path} (README 템플릿)"
+        yield FileHeader(f"{FILE_HEADER_PREFIX}{title} =====\n\n", title)
         yield template_content
 
     if existing_readme_content:
-        yield f"===== FILE: {readme_path} (기존 README) =====\n\n"
+        title = f"{readme_path} (기존 README)"
+        yield FileHeader(f"{FILE_HEADER_PREFIX}{title} =====\n\n", title)
         yield existing_readme_content
 
     yield from file_stream
 
 
-from . import dir_text_collector
-from .providers import get_provider
+from . import context_planner, dir_text_collector, git_utils, incremental, profiling
+from .collect_cache import CollectionCache
+from .noise_filter import NoiseFilter
+from .response_cache import (
+    ContextFingerprint,
+    ResponseCache,
+    response_key,
+)
+from .providers import LLMCallStats, ReadmeProvider, get_provider
+from .readme_output import ReadmeOutput, open_readme_output
+from .readme_validator import get_validator
+from .summary_cache import SummaryCache
 from .config import parse_args, DEFAULT_README_NAME
-from .temp_utils import TempDirManager, read_content_from_files
+from .temp_utils import FILE_HEADER_PREFIX, FileHeader, TempDirManager, read_content_from_files
+from .tree_snapshot import TreeSnapshot
+
+if TYPE_CHECKING:
+    # 시작 시간을 줄이기 위해 실행 시에는 필요한 함수 안에서만 import한다.
+    import asyncio
 
 
 def load_template(template_path: pathlib.Path) -> str:
@@ -61,26 +84,45 @@ def combine_streams(
 ) -> Iterator[str]:
     """기존 README 및 템플릿 내용을 파일 내용 스트림에 추가합니다."""
     if template_content and template_path:
-        yield f"===== FILE: {template_path} (README 템플릿) =====\n\n"
+        title = f"{template_path} (README 템플릿)"
+        yield FileHeader(f"{FILE_HEADER_PREFIX}{title} =====\n\n", title)
         yield template_content
 
     if existing_readme_content:
-        yield f"===== FILE: {readme_path} (기존 README) =====\n\n"
+        title = f"{readme_path} (기존 README)"
+        yield FileHeader(f"{FILE_HEADER_PREFIX}{title} =====\n\n", title)
         yield existing_readme_content
 
     yield from file_stream
 
 
-def run() -> int:
-    """애플리케이션의 메인 실행 로직"""
-    args = parse_args()
+@dataclass
+class GenerationResult:
+    """패키지 하나의 README 생성 결과."""
 
-    provider = get_provider(args.provider)
+    action: str  # "new", "update", "incremental", "unchanged"
+    context_bytes: int = 0
+    readme_bytes: int = 0
+    cached: bool = False  # 응답 캐시에서 가져왔는지 여부
+    llm_turns: int = 0  # LLM 대화 턴 수 (캐시를 사용했으면 0)
+
+
+@dataclass
+class _PackageJob:
+    """패키지 하나의 README 생성에 필요한, 컨텍스트 수집 전에 준비되는 정보."""
+
+    readme_path: pathlib.Path
+    readme_exists: bool
+    existing_readme_content: str | None
+    template_content: str | None
+    template_path: pathlib.Path | None
+    incremental_plan: incremental.IncrementalPlan | None
 
-    pkg = pathlib.Path(args.package_path).resolve()
-    if not pkg.exists() or not pkg.is_dir():
-        raise RuntimeError(f"패키지 경로가 존재하지 않거나 디렉터리가 아닙니다: {pkg}")
 
+def _prepare_job(
+    args, pkg: pathlib.Path, repo_ctx: git_utils.RepoContext
+) -> _PackageJob | None:
+    """템플릿과 기존 README를 읽고 증분 갱신 여부를 정한다. 갱신할 필요가 없으면 None."""
     # 템플릿 처리
     template_content: str | None = None
     template_path: pathlib.Path | None = None
@@ -98,56 +140,729 @@ def run() -> int:
         except Exception as e:
             print(f"[경고] 기존 README 파일을 읽는 데 실패했습니다: {e}", file=sys.stderr)
 
-    with TempDirManager(root_dir=str(pkg)) as temp_manager:
-        # 모든 컨텍스트(템플릿, 기존 README, 파일 목록)를 스트림으로 결합
-        file_content_stream = dir_text_collector.stream_all_files(str(pkg))
-        full_content_stream = combine_streams(
-            file_stream=file_content_stream,
-            existing_readme_content=existing_readme_content,
-            readme_path=str(readme_path),
-            template_content=template_content,
-            template_path=str(template_path) if template_path else None,
+    # 증분 갱신 가능 여부 판단 (불가능하면 전체 재생성)
+    incremental_plan: incremental.IncrementalPlan | None = None
+    if args.incremental and existing_readme_content:
+        incremental_plan = incremental.plan_incremental(
+            repo_ctx,
+            args.diff_base,
+            args.incremental_max_ratio,
+            noise=_noise_filter(args, pkg, repo_ctx),
         )
+        if incremental_plan and not incremental_plan.diff:
+            print("[정보] 변경 사항이 없어 README를 갱신하지 않습니다.")
+            if args.stdout:
+                sys.stdout.write(existing_readme_content)
+            return None
+
+    return _PackageJob(
+        readme_path=readme_path,
+        readme_exists=readme_exists,
+        existing_readme_content=existing_readme_content,
+        template_content=template_content,
+        template_path=template_path,
+        incremental_plan=incremental_plan,
+    )
+
+
+@dataclass
+class _PreparedContext:
+    """임시 샤드로 저장한 컨텍스트와 그에 맞춰 만든 프롬프트."""
+
+    action: str
+    prompt: str
+    context_bytes: int
+    response_key: str | None = None  # 응답 캐시를 쓰지 않으면 None
+
+
+def _noise_filter(args, pkg: pathlib.Path, repo_ctx: git_utils.RepoContext) -> NoiseFilter | None:
+    """--no-noise-filter가 아니면 저장소 루트와 패키지의 .gen-readme-ignore를 반영한 NoiseFilter."""
+    if args.no_noise_filter:
+        return None
+    return NoiseFilter.from_directories(repo_ctx.git_root, pkg, root=pkg)
+
 
-        # 스트림을 임시 파일로 저장
-        temp_file_paths = temp_manager.save_content_to_temp_files(
-            full_content_stream
+def _collector_options(
+    args,
+    pkg: pathlib.Path,
+    repo_ctx: git_utils.RepoContext,
+    cache: CollectionCache | None = None,
+    listing: git_utils.RepoListing | None = None,
+    snapshot: TreeSnapshot | None = None,
+) -> dict:
+    """CLI 인자에 따른 collect_files/stream_all_files 옵션."""
+    skeleton = None
+    if args.context_mode == "skeleton":
+        skeleton = dir_text_collector.SkeletonOptions(keep_full=tuple(args.full_text))
+    return {
+        "repo_ctx": repo_ctx,
+        "jobs": args.jobs,
+        "cache": cache,
+        "skeleton": skeleton,
+        "dedupe": not args.no_dedupe,
+        "noise": _noise_filter(args, pkg, repo_ctx),
+        "listing": listing,
+        "snapshot": snapshot,
+    }
+
+
+def _fingerprint_sources(
+    files: Iterable[tuple[str, str]], context_fingerprint: ContextFingerprint
+) -> Iterator[tuple[str, str]]:
+    """
+    files를 그대로 흘려보내면서 README.md를 뺀 파일 내용을 fingerprint에 넣는다.
+    README.md는 생성 결과라 실행마다 바뀔 수 있으므로, 응답 캐시가 기존 README와 따로 비교한다.
+    """
+    for relative_path, text in files:
+        if relative_path != DEFAULT_README_NAME:
+            for _ in context_fingerprint.wrap(dir_text_collector.format_file_stream([(relative_path, text)])):
+                pass
+        yield relative_path, text
+
+
+def _source_fingerprint(files: list[tuple[str, str]]) -> str:
+    """README.md를 뺀 수집 파일 내용의 Merkle fingerprint."""
+    context_fingerprint = ContextFingerprint()
+    for _ in _fingerprint_sources(files, context_fingerprint):
+        pass
+    return context_fingerprint.hexdigest()
+
+
+def _provider_key(args) -> str:
+    """응답 캐시 키에 쓰는 제공자 이름. 모델을 지정했으면 모델까지 구분한다."""
+    return f"{args.provider}:{args.model}" if args.model else args.provider
+
+
+def _write_context(
+    args,
+    job: _PackageJob,
+    pkg: pathlib.Path,
+    provider: ReadmeProvider,
+    repo_ctx: git_utils.RepoContext,
+    temp_manager: TempDirManager,
+    cache: CollectionCache | None = None,
+    listing: git_utils.RepoListing | None = None,
+    fingerprint: bool = False,
+    snapshot: TreeSnapshot | None = None,
+    files: list[tuple[str, str]] | None = None,
+    source_fingerprint: str | None = None,
+    token_limit: int | None = None,
+) -> _PreparedContext:
+    """
+    컨텍스트를 수집해 임시 샤드 파일로 저장하고 프롬프트를 만든다.
+    fingerprint가 True이면 수집한 파일 내용의 Merkle fingerprint로 응답 캐시 키도 만든다.
+    (기존 README와 수집 대상의 README.md는 생성 결과로 매번 바뀌므로 fingerprint에 포함하지 않는다.)
+    snapshot을 넘기면 디스크를 다시 탐색하지 않고 메모리에 보관한 파일 내용을 사용한다.
+    files를 넘기면 수집하지 않고 그 (경로, 내용) 목록을 사용한다. (미리 수집했거나 디렉터리별로 요약한 경우)
+    source_fingerprint를 넘기면 files 대신 그 값을 응답 캐시 키에 쓴다. (요약 전 원본 파일의 fingerprint)
+    token_limit을 넘기면 수집하면서 원본 토큰 수를 세고, 넘으면 _ContextOverflow를 발생시킨다. (--summarize auto)
+    """
+    context_fingerprint = ContextFingerprint() if fingerprint and source_fingerprint is None else None
+    # 모든 컨텍스트(템플릿, 기존 README, 파일 목록)를 스트림으로 결합
+    if job.incremental_plan:
+        collector_options = _collector_options(args, pkg, repo_ctx)
+        file_content_stream = incremental.stream_incremental_context(
+            repo_ctx,
+            job.incremental_plan,
+            jobs=args.jobs,
+            skeleton=collector_options["skeleton"],
+            noise=collector_options["noise"],
         )
-        if not temp_file_paths:
-            raise RuntimeError("컨텍스트를 임시 파일에 저장하지 못했습니다.")
+        if context_fingerprint is not None:
+            file_content_stream = context_fingerprint.wrap(file_content_stream)
+    else:
+        if files is None:
+            collector_options = _collector_options(args, pkg, repo_ctx, cache, listing, snapshot)
+            files = dir_text_collector.collect_files(str(pkg), **collector_options)
+            if token_limit is not None:
+                files = _limit_tokens(files, token_limit)
+        if context_fingerprint is not None:
+            files = _fingerprint_sources(files, context_fingerprint)
+        if args.max_context_tokens:
+            file_content_stream = context_planner.stream_planned_files(
+                files,
+                args.max_context_tokens,
+                context_planner.load_entry_point_modules(pkg),
+            )
+        else:
+            file_content_stream = dir_text_collector.format_file_stream(files)
+    full_content_stream = combine_streams(
+        file_stream=file_content_stream,
+        existing_readme_content=job.existing_readme_content,
+        readme_path=str(job.readme_path),
+        template_content=job.template_content,
+        template_path=str(job.template_path) if job.template_path else None,
+    )
+
+    # 스트림을 임시 파일로 저장
+    temp_file_paths = temp_manager.save_content_to_temp_files(full_content_stream)
+    if not temp_file_paths:
+        raise RuntimeError("컨텍스트를 임시 파일에 저장하지 못했습니다.")
+    context_bytes = sum(os.path.getsize(path) for path in temp_file_paths)
 
-        action = "new" if not readme_exists else "update"
-        print(f"'{action}' 액션을 시작합니다.")
+    if job.incremental_plan:
+        action = "incremental"
+    else:
+        action = "new" if not job.readme_exists else "update"
+    print(f"'{action}' 액션을 시작합니다.")
 
-        # 프롬프트 생성 및 LLM 호출
-        generated_prompt = ""
+    # 프롬프트 생성
+    with profiling.span("prompt.build", cat="prompt", action=action) as prompt_span:
         if action == "new":
-            generated_prompt = provider.build_prompt_new(
-                temp_file_paths, args.request
-            )
+            generated_prompt = provider.build_prompt_new(temp_file_paths, args.request)
+        elif action == "incremental":
+            generated_prompt = provider.build_prompt_incremental(temp_file_paths, args.request)
         else:  # update
-            generated_prompt = provider.build_prompt_update(
-                temp_file_paths, args.request
+            generated_prompt = provider.build_prompt_update(temp_file_paths, args.request)
+        prompt_span.set(bytes=len(generated_prompt.encode("utf-8")))
+
+    key = None
+    if fingerprint:
+        key = _context_response_key(
+            args, job, action == "incremental", source_fingerprint or context_fingerprint.hexdigest()
+        )
+    return _PreparedContext(action, generated_prompt, context_bytes, key)
+
+
+def _context_response_key(args, job: _PackageJob, incremental_update: bool, context_fingerprint: str) -> str:
+    """
+    한 번의 대화로 생성하는 README의 응답 캐시 키.
+    new/update 프롬프트는 README 파일이 있는지에 따라 바뀌므로 키에는 액션과 무관한 값을 쓴다.
+    (기존 README가 캐시된 결과와 같은지는 응답 캐시가 따로 비교한다)
+    """
+    if incremental_update:
+        key_prompt = "incremental"
+    else:
+        key_prompt = f"full:max_context_tokens={args.max_context_tokens or 0}"
+    return response_key(
+        provider=_provider_key(args),
+        prompt=key_prompt,
+        request=args.request,
+        template=job.template_content,
+        context_fingerprint=context_fingerprint,
+    )
+
+
+def _lookup_response(
+    args,
+    job: _PackageJob,
+    key: str | None,
+    responses: ResponseCache | None,
+) -> str | None:
+    """응답 캐시에서 같은 컨텍스트로 생성했던 README를 찾는다. (--refresh이면 찾지 않음)"""
+    if responses is None or key is None or args.refresh:
+        return None
+    readme_content = responses.get(key, job.existing_readme_content)
+    if readme_content is not None:
+        print("[정보] 컨텍스트가 바뀌지 않아 캐시된 README를 사용합니다. (다시 생성하려면 --refresh)")
+    return readme_content
+
+
+def _open_output(args, job: _PackageJob) -> ReadmeOutput:
+    """
+    README를 내보낼 출력 대상. (--stdout 또는 README 옆 임시 파일)
+    LLM 응답 조각은 도착하는 대로 쓰고, commit할 때 확정한다.
+    """
+    return open_readme_output(job.readme_path, args.stdout, job.existing_readme_content)
+
+
+def _open_temp_manager(args) -> TempDirManager:
+    return TempDirManager(scratch_dir=args.scratch_dir, shard_size=args.shard_size * 1024)
+
+
+def _uses_sections(args, job: _PackageJob) -> bool:
+    if not args.parallel_sections:
+        return False
+    if job.incremental_plan:
+        print("[정보] 증분 갱신은 섹션 병렬 생성 대신 한 번의 대화로 진행합니다.")
+        return False
+    return True
+
+
+async def _generate_by_sections_async(
+    args,
+    job: _PackageJob,
+    pkg: pathlib.Path,
+    provider: ReadmeProvider,
+    repo_ctx: git_utils.RepoContext,
+    cache: CollectionCache | None = None,
+    listing: git_utils.RepoListing | None = None,
+    llm_slots: "asyncio.Semaphore | None" = None,
+    executor: Executor | None = None,
+    responses: ResponseCache | None = None,
+    snapshot: TreeSnapshot | None = None,
+) -> GenerationResult:
+    """
+    --parallel-sections: 목차(템플릿의 "## " 제목 또는 짧은 계획 호출)를 정하고, 섹션마다 관련 파일만 담은
+    컨텍스트로 LLM을 동시에 호출한 뒤 목차 순서대로 합친다.
+    """
+    import asyncio
+
+    from . import sections
+
+    loop = asyncio.get_running_loop()
+    collector_options = _collector_options(args, pkg, repo_ctx, cache, listing, snapshot)
+    files = await loop.run_in_executor(
+        executor, lambda: list(dir_text_collector.collect_files(str(pkg), **collector_options))
+    )
+    if not files:
+        raise RuntimeError("README를 생성할 파일이 없습니다.")
+    action = "new" if not job.readme_exists else "update"
+    print(f"'{action}' 액션을 섹션 병렬 생성으로 시작합니다.")
+
+    key = None
+    if responses is not None:
+        key = response_key(
+            provider=_provider_key(args),
+            prompt=f"parallel-sections:max_context_tokens={args.max_context_tokens or 0}",
+            request=args.request,
+            template=job.template_content,
+            context_fingerprint=_source_fingerprint(files),
+        )
+    context_bytes = sum(len(text.encode("utf-8")) for _, text in files)
+    readme_content = _lookup_response(args, job, key, responses)
+    cached = readme_content is not None
+    stats = LLMCallStats()
+    with _open_output(args, job) as output:
+        if not cached:
+            entry_modules = context_planner.load_entry_point_modules(pkg)
+            with _open_temp_manager(args) as temp_manager:
+                if job.template_content:
+                    outline = sections.outline_from_template(job.template_content)
+                else:
+                    outline = await sections.plan_outline(
+                        provider,
+                        files,
+                        args.request,
+                        job.readme_exists,
+                        temp_manager,
+                        stats,
+                        entry_modules,
+                        llm_slots,
+                    )
+                existing_title = None
+                if job.existing_readme_content:
+                    existing_title, _ = sections.split_markdown_sections(job.existing_readme_content)
+                readme_content = await sections.generate_sections_async(
+                    provider,
+                    outline,
+                    files,
+                    args.request,
+                    temp_manager,
+                    stats,
+                    title=outline.title or existing_title or pkg.name,
+                    existing_readme=job.existing_readme_content,
+                    entry_modules=entry_modules,
+                    max_tokens=args.max_context_tokens,
+                    jobs=args.section_jobs,
+                    llm_slots=llm_slots,
+                )
+        output.commit(readme_content)
+    if not cached and responses is not None and key:
+        responses.put(key, readme_content)
+
+    return GenerationResult(
+        action=action,
+        context_bytes=context_bytes,
+        readme_bytes=len(readme_content.encode("utf-8")),
+        cached=cached,
+        llm_turns=stats.turns,
+    )
+
+
+def _may_summarize(args, job: _PackageJob) -> bool:
+    """--summarize를 적용할지. 증분 갱신은 변경분만 보내므로 요약하지 않는다."""
+    return args.summarize != "never" and not job.incremental_plan
+
+
+def _summary_window(args, provider: ReadmeProvider) -> int:
+    return args.context_window or provider.context_window_tokens
+
+
+class _ContextOverflow(Exception):
+    """--summarize auto: 수집 중인 컨텍스트가 요약 없이 보낼 수 있는 한도를 넘었다."""
+
+    def __init__(self, limit: int):
+        super().__init__(f"컨텍스트가 {limit}토큰을 넘습니다.")
+        self.limit = limit
+
+
+def _limit_tokens(files: Iterable[tuple[str, str]], limit: int) -> Iterator[tuple[str, str]]:
+    """files를 그대로 흘려보내면서 원본 토큰 수를 세고, limit을 넘는 파일이 나오면 _ContextOverflow를 발생시킨다."""
+    total = 0
+    for relative_path, text in files:
+        total += context_planner.estimate_tokens(text)
+        if total > limit:
+            raise _ContextOverflow(limit)
+        yield relative_path, text
+
+
+def _streaming_token_limit(args, provider: ReadmeProvider, job: _PackageJob) -> int | None:
+    """스트리밍으로 생성하면서 지켜야 할 원본 토큰 한도. auto가 아니면 None."""
+    if args.summarize != "auto" or not _may_summarize(args, job):
+        return None
+    return context_planner.context_limit(_summary_window(args, provider))
+
+
+def _summarizes_first(args, job: _PackageJob) -> bool:
+    """--summarize always: 스트리밍 없이 처음부터 요약한다."""
+    return args.summarize == "always" and _may_summarize(args, job)
+
+
+async def _generate_summarized_async(
+    args,
+    job: _PackageJob,
+    pkg: pathlib.Path,
+    provider: ReadmeProvider,
+    repo_ctx: git_utils.RepoContext,
+    cache: CollectionCache | None = None,
+    listing: git_utils.RepoListing | None = None,
+    llm_slots: "asyncio.Semaphore | None" = None,
+    executor: Executor | None = None,
+    responses: ResponseCache | None = None,
+    snapshot: TreeSnapshot | None = None,
+) -> GenerationResult:
+    """
+    --summarize: 파일을 모두 수집해 디렉터리별로 요약한 뒤, 그 요약으로 README를 생성한다.
+    응답 캐시는 요약하기 전에 원본 파일의 fingerprint로 찾으므로, 적중하면 요약 호출도 하지 않는다.
+    """
+    import asyncio
+
+    from . import summarize
+
+    loop = asyncio.get_running_loop()
+    window = _summary_window(args, provider)
+    collector_options = _collector_options(args, pkg, repo_ctx, cache, listing, snapshot)
+    files = await loop.run_in_executor(
+        executor, lambda: list(dir_text_collector.collect_files(str(pkg), **collector_options))
+    )
+    if not files:
+        raise RuntimeError("README를 생성할 파일이 없습니다.")
+
+    source_fingerprint = None
+    if responses is not None:
+        # 컨텍스트 창 크기에 따라 요약 결과가 달라지므로 키에 포함한다.
+        source_fingerprint = f"summarized:{window}:{_source_fingerprint(files)}"
+        readme_content = _lookup_response(
+            args, job, _context_response_key(args, job, False, source_fingerprint), responses
+        )
+        if readme_content is not None:
+            with _open_output(args, job) as output:
+                output.commit(readme_content)
+            return GenerationResult(
+                action="new" if not job.readme_exists else "update",
+                context_bytes=sum(len(text.encode("utf-8")) for _, text in files),
+                readme_bytes=len(readme_content.encode("utf-8")),
+                cached=True,
             )
 
-        readme_content = provider.call_llm(generated_prompt)
+    summary_cache = None if args.no_summary_cache else SummaryCache(args.cache_dir)
+    with _open_temp_manager(args) as temp_manager:
+        summary = await summarize.summarize_files(
+            provider,
+            files,
+            args.request,
+            temp_manager,
+            window,
+            context_planner.load_entry_point_modules(pkg),
+            jobs=args.summary_jobs,
+            llm_slots=llm_slots,
+            cache=summary_cache,
+            cache_prefix=_provider_key(args),
+        )
+    if summary_cache is not None:
+        summary_cache.prune()
+    del files  # 원본은 더 쓰지 않으므로 README 대화 동안 메모리에 두지 않는다.
 
-        # 결과 출력/저장
-        if args.stdout:
-            sys.stdout.write(readme_content)
-        else:
-            readme_path.write_text(readme_content, encoding="utf-8")
-            print(f"[정보] README 갱신 완료: {readme_path}")
+    with _open_temp_manager(args) as temp_manager:
+        prepared = await loop.run_in_executor(
+            executor,
+            functools.partial(
+                _write_context,
+                args,
+                job,
+                pkg,
+                provider,
+                repo_ctx,
+                temp_manager,
+                fingerprint=responses is not None,
+                files=summary.files,
+                source_fingerprint=source_fingerprint,
+            ),
+        )
+        stats = LLMCallStats()
+        with _open_output(args, job) as output:
+            async with llm_slots or contextlib.nullcontext():
+                readme_content = await provider.call_llm_async(
+                    prepared.prompt,
+                    context_dirs=[temp_manager.temp_dir],
+                    output=output,
+                    stats=stats,
+                )
+            output.commit(readme_content)
+        if responses is not None and prepared.response_key:
+            responses.put(prepared.response_key, readme_content)
+
+    return GenerationResult(
+        action=prepared.action,
+        context_bytes=prepared.context_bytes,
+        readme_bytes=len(readme_content.encode("utf-8")),
+        llm_turns=stats.turns + summary.turns,
+    )
+
+
+def _generate_streamed(
+    args,
+    job: _PackageJob,
+    pkg: pathlib.Path,
+    provider: ReadmeProvider,
+    repo_ctx: git_utils.RepoContext,
+    cache: CollectionCache | None = None,
+    listing: git_utils.RepoListing | None = None,
+    llm_slots: threading.Semaphore | None = None,
+    responses: ResponseCache | None = None,
+    snapshot: TreeSnapshot | None = None,
+) -> GenerationResult:
+    """
+    수집한 컨텍스트를 스트림으로 임시 샤드에 저장하고 한 번의 대화로 README를 생성한다.
+    --summarize auto에서 원본이 한도를 넘으면 LLM을 호출하기 전에 _ContextOverflow를 발생시킨다.
+    """
+    with _open_temp_manager(args) as temp_manager:
+        prepared = _write_context(
+            args,
+            job,
+            pkg,
+            provider,
+            repo_ctx,
+            temp_manager,
+            cache,
+            listing,
+            fingerprint=responses is not None,
+            snapshot=snapshot,
+            token_limit=_streaming_token_limit(args, provider, job),
+        )
+        readme_content = _lookup_response(args, job, prepared.response_key, responses)
+        cached = readme_content is not None
+        stats = LLMCallStats()
+        with _open_output(args, job) as output:
+            if not cached:
+                with llm_slots or contextlib.nullcontext():
+                    readme_content = provider.call_llm(
+                        prepared.prompt,
+                        context_dirs=[temp_manager.temp_dir],
+                        output=output,
+                        stats=stats,
+                    )
+            output.commit(readme_content)
+        if not cached and responses is not None and prepared.response_key:
+            responses.put(prepared.response_key, readme_content)
+
+    return GenerationResult(
+        action=prepared.action,
+        context_bytes=prepared.context_bytes,
+        readme_bytes=len(readme_content.encode("utf-8")),
+        cached=cached,
+        llm_turns=stats.turns,
+    )
+
+
+def generate_readme(
+    args,
+    pkg: pathlib.Path,
+    provider: ReadmeProvider,
+    repo_ctx: git_utils.RepoContext,
+    cache: CollectionCache | None = None,
+    listing: git_utils.RepoListing | None = None,
+    llm_slots: threading.Semaphore | None = None,
+    responses: ResponseCache | None = None,
+    snapshot: TreeSnapshot | None = None,
+) -> GenerationResult:
+    """
+    패키지 하나의 컨텍스트를 수집하고 LLM을 호출하여 README를 생성/수정합니다.
+    여러 패키지를 처리할 때는 provider, cache, listing을 공유하고,
+    llm_slots로 동시에 실행되는 LLM 호출 수를 제한합니다.
+    responses를 넘기면 컨텍스트가 같을 때 LLM을 호출하지 않고 캐시된 README를 사용합니다.
+    snapshot을 넘기면 메모리에 보관한 파일 내용으로 컨텍스트를 만듭니다. (감시 모드)
+    """
+    job = _prepare_job(args, pkg, repo_ctx)
+    if job is None:
+        return GenerationResult(action="unchanged")
+    if _uses_sections(args, job):
+        import asyncio
+
+        return asyncio.run(
+            _generate_by_sections_async(
+                args, job, pkg, provider, repo_ctx, cache, listing, responses=responses, snapshot=snapshot
+            )
+        )
+
+    if not _summarizes_first(args, job):
+        try:
+            return _generate_streamed(
+                args, job, pkg, provider, repo_ctx, cache, listing, llm_slots, responses, snapshot
+            )
+        except _ContextOverflow as overflow:
+            print(f"[정보] 수집한 컨텍스트가 한도({overflow.limit}토큰)를 넘어 디렉터리별 요약으로 전환합니다.")
+
+    # asyncio는 import 비용이 크므로 요약할 때만 불러온다.
+    import asyncio
+
+    with llm_slots or contextlib.nullcontext():
+        return asyncio.run(
+            _generate_summarized_async(
+                args, job, pkg, provider, repo_ctx, cache, listing, responses=responses, snapshot=snapshot
+            )
+        )
+
+
+async def _generate_streamed_async(
+    args,
+    job: _PackageJob,
+    pkg: pathlib.Path,
+    provider: ReadmeProvider,
+    repo_ctx: git_utils.RepoContext,
+    cache: CollectionCache | None = None,
+    listing: git_utils.RepoListing | None = None,
+    llm_slots: "asyncio.Semaphore | None" = None,
+    executor: Executor | None = None,
+    responses: ResponseCache | None = None,
+) -> GenerationResult:
+    """_generate_streamed의 비동기 버전. 컨텍스트 저장은 executor의 스레드에서 실행한다."""
+    import asyncio
 
+    loop = asyncio.get_running_loop()
+    with _open_temp_manager(args) as temp_manager:
+        prepared = await loop.run_in_executor(
+            executor,
+            functools.partial(
+                _write_context,
+                args,
+                job,
+                pkg,
+                provider,
+                repo_ctx,
+                temp_manager,
+                cache,
+                listing,
+                fingerprint=responses is not None,
+                token_limit=_streaming_token_limit(args, provider, job),
+            ),
+        )
+        readme_content = _lookup_response(args, job, prepared.response_key, responses)
+        cached = readme_content is not None
+        stats = LLMCallStats()
+        with _open_output(args, job) as output:
+            if not cached:
+                async with llm_slots or contextlib.nullcontext():
+                    readme_content = await provider.call_llm_async(
+                        prepared.prompt,
+                        context_dirs=[temp_manager.temp_dir],
+                        output=output,
+                        stats=stats,
+                    )
+            output.commit(readme_content)
+        if not cached and responses is not None and prepared.response_key:
+            responses.put(prepared.response_key, readme_content)
+
+    return GenerationResult(
+        action=prepared.action,
+        context_bytes=prepared.context_bytes,
+        readme_bytes=len(readme_content.encode("utf-8")),
+        cached=cached,
+        llm_turns=stats.turns,
+    )
+
+
+async def generate_readme_async(
+    args,
+    pkg: pathlib.Path,
+    provider: ReadmeProvider,
+    repo_ctx: git_utils.RepoContext,
+    cache: CollectionCache | None = None,
+    listing: git_utils.RepoListing | None = None,
+    llm_slots: "asyncio.Semaphore | None" = None,
+    executor: Executor | None = None,
+    responses: ResponseCache | None = None,
+) -> GenerationResult:
+    """
+    generate_readme의 비동기 버전. 컨텍스트 수집은 executor의 스레드에서 실행하고,
+    LLM 대화는 provider.call_llm_async로 현재 이벤트 루프에서 실행합니다.
+    """
+    # asyncio는 import 비용이 크므로 batch 모드(와 asyncio를 사용하는 제공자)에서만 불러온다.
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    job = await loop.run_in_executor(executor, _prepare_job, args, pkg, repo_ctx)
+    if job is None:
+        return GenerationResult(action="unchanged")
+    if _uses_sections(args, job):
+        return await _generate_by_sections_async(
+            args, job, pkg, provider, repo_ctx, cache, listing, llm_slots, executor, responses
+        )
+
+    if not _summarizes_first(args, job):
+        try:
+            return await _generate_streamed_async(
+                args, job, pkg, provider, repo_ctx, cache, listing, llm_slots, executor, responses
+            )
+        except _ContextOverflow as overflow:
+            print(f"[정보] 수집한 컨텍스트가 한도({overflow.limit}토큰)를 넘어 디렉터리별 요약으로 전환합니다.")
+    return await _generate_summarized_async(
+        args, job, pkg, provider, repo_ctx, cache, listing, llm_slots, executor, responses
+    )
+
+
+def open_response_cache(args) -> ResponseCache | None:
+    """CLI 인자에 따라 응답 캐시를 만든다. (--no-response-cache이면 None)"""
+    if args.no_response_cache:
+        return None
+    return ResponseCache(args.cache_dir, ttl_seconds=args.response_cache_ttl * 3600)
+
+
+def provider_options(args) -> dict:
+    """CLI 인자에서 제공자 생성 옵션을 만든다. (0초는 제한 없음)"""
+    return {
+        "turn_timeout": args.turn_timeout or None,
+        "total_timeout": args.total_timeout or None,
+        "validator": get_validator(args.readme_validator),
+        "api_base": args.api_base,
+        "model": args.model,
+    }
+
+
+def run(args=None) -> int:
+    """애플리케이션의 메인 실행 로직. args를 넘기지 않으면 명령행 인자를 해석한다."""
+    args = args if args is not None else parse_args()
+    with profiling.session(args.profile):
+        return _run(args)
+
+
+def _run(args) -> int:
+    provider = get_provider(args.provider, **provider_options(args))
+
+    pkg = pathlib.Path(args.package_path).resolve()
+    if not pkg.exists() or not pkg.is_dir():
+        raise RuntimeError(f"패키지 경로가 존재하지 않거나 디렉터리가 아닙니다: {pkg}")
+
+    # git 루트는 실행당 한 번만 탐색하고 이후 단계에 전달
+    repo_ctx = git_utils.resolve_repo_context(pkg)
+
+    if args.watch:
+        from .watch import watch_package
+
+        return watch_package(args, pkg, provider, repo_ctx, responses=open_response_cache(args))
+
+    cache = None if args.no_cache else CollectionCache(args.cache_dir)
+    result = generate_readme(
+        args, pkg, provider, repo_ctx, cache, responses=open_response_cache(args)
+    )
+    if result.llm_turns:
+        print(f"[정보] LLM 대화 턴: {result.llm_turns}회", file=sys.stderr)
     return 0
 
 
 def main() -> int:
-    try:
-        return run()
-    except (ValueError, RuntimeError) as e:
-        print(f"[에러] {e}", file=sys.stderr)
-        return 1
-    except Exception as e:
-        print(f"[치명적 에러] 예상치 못한 오류가 발생했습니다: {e}", file=sys.stderr)
-        return 1
+    """이전 진입점(gen_readme.app:main)과의 호환을 위해 남겨 둔 함수. gen_readme.cli.main과 같다."""
+    from .cli import main as cli_main
+
+    return cli_main()
@@ -0,0 +1,242 @@
+import asyncio
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from . import git_utils, profiling
+from .app import generate_readme_async, open_response_cache, provider_options
+from .collect_cache import CollectionCache
+from .config import parse_batch_args
+from .providers import get_provider
+from .response_cache import ResponseCache
+
+
+@dataclass
+class PackageResult:
+    """batch 모드에서 패키지 하나의 처리 결과."""
+
+    package: str
+    status: str  # "ok", "cached", "unchanged", "failed"
+    action: str | None = None
+    seconds: float = 0.0
+    context_bytes: int = 0
+    readme_bytes: int = 0
+    llm_turns: int = 0
+    error: str | None = None
+
+
+def _read_package_list(path: str) -> list[str]:
+    """한 줄에 하나씩 적힌 패키지 경로 목록. 빈 줄과 '#' 주석은 무시한다."""
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        try:
+            lines = Path(path).read_text(encoding="utf-8").splitlines()
+        except OSError as e:
+            raise RuntimeError(f"패키지 목록 파일을 읽지 못했습니다: {path} ({e})") from e
+    return [line.strip() for line in lines if line.strip() and not line.strip().startswith("#")]
+
+
+def expand_packages(patterns: list[str], from_file: str | None = None) -> list[Path]:
+    """
+    경로/glob 패턴과 목록 파일을 패키지 디렉터리 목록으로 펼친다.
+    디렉터리가 아닌 항목은 경고 후 건너뛰고, 중복은 처음 나온 순서대로 한 번만 남긴다.
+    """
+    candidates: list[str] = []
+    if from_file:
+        candidates.extend(_read_package_list(from_file))
+    for pattern in patterns:
+        if any(ch in pattern for ch in "*?["):
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                print(f"[경고] 패턴과 일치하는 경로가 없습니다: {pattern}")
+            candidates.extend(matches)
+        else:
+            candidates.append(pattern)
+
+    packages: list[Path] = []
+    seen = set()
+    for candidate in candidates:
+        path = Path(candidate).resolve()
+        if path in seen:
+            continue
+        seen.add(path)
+        if not path.is_dir():
+            print(f"[경고] 디렉터리가 아니므로 건너뜁니다: {candidate}")
+            continue
+        packages.append(path)
+    return packages
+
+
+def _display_path(path: Path) -> str:
+    try:
+        return os.path.relpath(path)
+    except ValueError:
+        return str(path)
+
+
+def print_summary(results: list[PackageResult], elapsed: float) -> None:
+    """패키지별 결과 표와 합계를 출력한다."""
+    counts = {status: 0 for status in ("ok", "cached", "unchanged", "failed")}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    print(
+        f"[정보] batch 결과: 성공 {counts['ok']}개, 캐시 사용 {counts['cached']}개, "
+        f"변경 없음 {counts['unchanged']}개, "
+        f"실패 {counts['failed']}개, LLM 대화 턴 {sum(r.llm_turns for r in results)}회 "
+        f"(총 {elapsed:.1f}초)"
+    )
+    for result in results:
+        line = (
+            f"  {result.status:<9} {result.seconds:7.1f}s "
+            f"context {result.context_bytes:>11,}B readme {result.readme_bytes:>9,}B "
+            f"turns {result.llm_turns}  "
+            f"{result.package}"
+        )
+        if result.error:
+            line += f"  ({result.error})"
+        print(line)
+
+
+async def _process_packages(
+    args,
+    packages: list[Path],
+    contexts: list[git_utils.RepoContext],
+    provider,
+    cache: CollectionCache | None,
+    listings: dict[Path, git_utils.RepoListing],
+    responses: ResponseCache | None = None,
+) -> list[PackageResult]:
+    """
+    모든 패키지를 하나의 이벤트 루프에서 처리한다.
+    컨텍스트 수집은 --package-jobs개의 스레드에서, LLM 대화는 이벤트 루프에서 실행한다.
+    """
+    package_slots = asyncio.Semaphore(max(1, args.package_jobs))
+    llm_slots = asyncio.Semaphore(max(1, args.max_llm_concurrency))
+
+    with ThreadPoolExecutor(max_workers=max(1, args.package_jobs)) as executor:
+
+        async def process(pkg: Path, repo_ctx: git_utils.RepoContext) -> PackageResult:
+            name = _display_path(pkg)
+            # 동시에 진행 중인 패키지 수를 제한해 임시 샤드가 한꺼번에 쌓이지 않게 한다.
+            async with package_slots:
+                start = time.perf_counter()
+                try:
+                    with profiling.span("package", cat="batch", concurrent=True, package=name):
+                        result = await generate_readme_async(
+                            args,
+                            pkg,
+                            provider,
+                            repo_ctx,
+                            cache=cache,
+                            listing=listings.get(repo_ctx.git_root),
+                            llm_slots=llm_slots,
+                            executor=executor,
+                            responses=responses,
+                        )
+                except Exception as e:
+                    print(f"[에러] {name}: {e}", file=sys.stderr)
+                    return PackageResult(
+                        package=name,
+                        status="failed",
+                        seconds=time.perf_counter() - start,
+                        error=str(e),
+                    )
+            if result.action == "unchanged":
+                status = "unchanged"
+            else:
+                status = "cached" if result.cached else "ok"
+            return PackageResult(
+                package=name,
+                status=status,
+                action=result.action,
+                seconds=time.perf_counter() - start,
+                context_bytes=result.context_bytes,
+                readme_bytes=result.readme_bytes,
+                llm_turns=result.llm_turns,
+            )
+
+        return await asyncio.gather(
+            *(process(pkg, repo_ctx) for pkg, repo_ctx in zip(packages, contexts))
+        )
+
+
+def run_batch(argv: list[str] | None = None) -> int:
+    """
+    여러 패키지의 README를 생성/수정한다.
+    git 루트 탐색과 추적 파일 목록 조회는 저장소당 한 번만 수행해 모든 패키지가 공유하고,
+    패키지는 --package-jobs개씩 병렬로 수집하되 LLM 호출은 --max-llm-concurrency개로 제한한다.
+    한 패키지의 실패는 기록만 하고 나머지 패키지는 계속 처리한다.
+
+    :return: 실패한 패키지가 없으면 0, 있으면 1
+    """
+    args = parse_batch_args(argv)
+    with profiling.session(args.profile):
+        return _run_batch(args)
+
+
+def _run_batch(args) -> int:
+    packages = expand_packages(args.packages, args.from_file)
+    if not packages:
+        raise ValueError("처리할 패키지가 없습니다. 패키지 경로나 --from-file을 지정하세요.")
+
+    provider = get_provider(args.provider, **provider_options(args))
+    cache = None
+    if not args.no_cache:
+        # 패키지마다 캐시 디렉터리를 훑지 않도록 정리는 마지막에 한 번만 한다.
+        cache = CollectionCache(args.cache_dir, auto_prune=False)
+
+    base_ctx = git_utils.resolve_repo_context(packages[0])
+    contexts = [git_utils.derive_repo_context(base_ctx, pkg) for pkg in packages]
+    listings: dict[Path, git_utils.RepoListing] = {}
+    for git_root in {ctx.git_root for ctx in contexts if ctx.is_git}:
+        listing = git_utils.list_repo_files(
+            [ctx for ctx in contexts if ctx.git_root == git_root]
+        )
+        if listing is not None:
+            listings[git_root] = listing
+
+    print(
+        f"[정보] {len(packages)}개 패키지를 처리합니다. "
+        f"(동시 패키지 {args.package_jobs}개, 동시 LLM 호출 {args.max_llm_concurrency}개)"
+    )
+    batch_start = time.perf_counter()
+    results = asyncio.run(
+        _process_packages(
+            args,
+            packages,
+            contexts,
+            provider,
+            cache,
+            listings,
+            responses=open_response_cache(args),
+        )
+    )
+    elapsed = time.perf_counter() - batch_start
+
+    if cache is not None:
+        cache.prune()
+
+    print_summary(results, elapsed)
+    if args.summary:
+        summary = {
+            "elapsed_seconds": round(elapsed, 3),
+            "packages": [
+                {**asdict(result), "seconds": round(result.seconds, 3)}
+                for result in results
+            ],
+        }
+        try:
+            Path(args.summary).write_text(
+                json.dumps(summary, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+            )
+            print(f"[정보] batch 결과를 저장했습니다: {args.summary}")
+        except OSError as e:
+            print(f"[경고] batch 결과를 저장하지 못했습니다: {e}", file=sys.stderr)
+
+    return 1 if any(result.status == "failed" for result in results) else 0
@@ -0,0 +1,65 @@
+import time
+from pathlib import Path
+
+from . import collect_cache, response_cache, summary_cache
+from .collect_cache import CollectionCache, default_cache_dir
+from .config import parse_cache_args
+from .summary_cache import SummaryCache
+
+# (이름, 기본 크기 상한). 각 캐시가 실행 중에 쓰는 상한과 같다.
+NAMESPACES = (
+    ("collect", collect_cache.DEFAULT_MAX_BYTES),
+    ("responses", response_cache.DEFAULT_MAX_BYTES),
+    (summary_cache.NAMESPACE, summary_cache.DEFAULT_MAX_BYTES),
+)
+# --verbose에서 출력할 최대 요약 항목 수 (최근 사용 순)
+MAX_LISTED_SUMMARIES = 50
+
+_MB = 1024 * 1024
+
+
+def _format_time(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(timestamp))
+
+
+def _print_summaries(cache_dir: Path) -> None:
+    entries = sorted(SummaryCache(cache_dir).entries(), key=lambda e: e.last_used, reverse=True)
+    for entry in entries[:MAX_LISTED_SUMMARIES]:
+        print(
+            f"    {_format_time(entry.last_used)} {entry.kind:<5} "
+            f"입력 {entry.tokens:>9,}토큰 {entry.files:>5}개  {entry.scope}"
+        )
+    if len(entries) > MAX_LISTED_SUMMARIES:
+        print(f"    ... 외 {len(entries) - MAX_LISTED_SUMMARIES}개")
+
+
+def run_cache(argv: list[str] | None = None) -> int:
+    """
+    캐시 디렉터리의 캐시별 항목 수와 크기를 출력하거나(info), 크기 상한을 넘는 오래된 항목을 지운다(prune).
+    prune은 실행 중 자동 정리와 같은 LRU 기준(마지막 사용 시각)을 따른다.
+    """
+    args = parse_cache_args(argv)
+    cache_dir = Path(args.cache_dir) if args.cache_dir else default_cache_dir()
+    print(f"[정보] 캐시 디렉터리: {cache_dir}")
+
+    for name, default_limit in NAMESPACES:
+        if args.namespace not in ("all", name):
+            continue
+        limit = default_limit if args.max_size is None else int(args.max_size * _MB)
+        store = CollectionCache(cache_dir, max_bytes=limit, namespace=name, auto_prune=False)
+        if args.action == "prune":
+            before = len(store.entries())
+            freed = store.prune(force=True)
+            removed = before - len(store.entries())
+            print(f"  {name:<10} {removed:>7,}개 삭제 ({freed / _MB:.1f}MB, 상한 {limit / _MB:g}MB)")
+            continue
+
+        entries = store.entries()
+        total = sum(size for _, size, _ in entries)
+        line = f"  {name:<10} {len(entries):>7,}개 {total / _MB:>9.1f}MB / 상한 {default_limit / _MB:g}MB"
+        if entries:
+            line += f"  마지막 사용 {_format_time(max(used for _, _, used in entries))}"
+        print(line)
+        if args.verbose and name == summary_cache.NAMESPACE:
+            _print_summaries(cache_dir)
+    return 0
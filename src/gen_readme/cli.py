@@ -0,0 +1,45 @@
+"""
+`gen-readme` 명령의 진입점.
+
+인자 해석에 필요한 config만 먼저 import하고, 수집/LLM 호출 모듈(app, batch)은 실제로 실행할 때 불러온다.
+git hook처럼 자주 호출되는 환경에서 --help나 인자 오류가 전체 모듈을 불러오는 비용을 내지 않도록 하기 위함이다.
+"""
+import sys
+
+from .config import parse_args
+
+SUBCOMMANDS = ("batch", "cache")
+
+
+def _subcommand(argv: list[str]) -> str | None:
+    """
+    첫 인자가 하위 명령이면 그 이름을 반환한다.
+    batch, cache는 디스크의 디렉터리와 관계없이 항상 하위 명령이며,
+    같은 이름의 디렉터리를 패키지로 지정하려면 `./cache`처럼 경로로 적는다.
+    """
+    if argv and argv[0] in SUBCOMMANDS:
+        return argv[0]
+    return None
+
+
+def main() -> int:
+    try:
+        command = _subcommand(sys.argv[1:])
+        if command == "batch":
+            from . import batch
+
+            return batch.run_batch(sys.argv[2:])
+        if command == "cache":
+            from . import cache_admin
+
+            return cache_admin.run_cache(sys.argv[2:])
+        args = parse_args()
+        from . import app
+
+        return app.run(args)
+    except (ValueError, RuntimeError) as e:
+        print(f"[에러] {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"[치명적 에러] 예상치 못한 오류가 발생했습니다: {e}", file=sys.stderr)
+        return 1
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# 저장 형식이나 정규화 규칙이 바뀌면 올려서 이전 캐시를 무효화한다.
+CACHE_VERSION = "1"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512MB
+MISS = object()
+
+
+def default_cache_dir() -> Path:
+    """XDG_CACHE_HOME을 존중하는 기본 캐시 디렉터리 (~/.cache/gen-readme)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "gen-readme"
+
+
+def blob_key(blob_id: str) -> str:
+    """git blob ID 기반 키. 내용이 같으면 경로가 달라도 같은 키가 된다."""
+    return f"blob:{blob_id}"
+
+
+def stat_key(st: os.stat_result) -> str:
+    """git이 아닌 디렉터리용 키. (장치, inode, mtime, 크기)가 모두 같으면 같은 파일로 본다."""
+    return f"stat:{st.st_dev}:{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+
+
+class CollectionCache:
+    """
+    파일별로 디코딩·필터링을 마친 컨텍스트 텍스트를 디스크에 보관하는 캐시.
+    키마다 파일 하나를 쓰고, 마지막 사용 시각(mtime) 기준 LRU로 전체 크기를 제한한다.
+    여러 스레드에서 동시에 get/put을 호출해도 안전하다.
+    auto_prune이 False이면 수집이 끝날 때마다 정리하지 않고, 호출자가 prune을 직접 호출한다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        namespace: str = "collect",
+        auto_prune: bool = True,
+    ):
+        self.root = Path(cache_dir or default_cache_dir()) / namespace
+        self.max_bytes = max_bytes
+        self.auto_prune = auto_prune
+        self._written = False
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha256(f"{CACHE_VERSION}\0{key}".encode("utf-8")).hexdigest()
+        return self.root / digest[:2] / digest
+
+    def get(self, key: str):
+        """
+        키에 해당하는 (메타데이터, 본문)을 반환한다. 값이 없으면 MISS를 반환한다.
+        메타데이터는 JSON 값이고 본문은 문자열 또는 None이다.
+        """
+        path = self._path_for(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            header, sep, body = data.partition(b"\n")
+            if not sep:
+                return MISS
+            meta = json.loads(header)
+            text = body.decode("utf-8") if meta.get("has_text") else None
+        except (OSError, ValueError, AttributeError):
+            return MISS
+        try:
+            # LRU 갱신
+            os.utime(path)
+        except OSError:
+            pass
+        return meta, text
+
+    def put(self, key: str, meta: dict, text: Optional[str] = None) -> None:
+        """
+        메타데이터(JSON 직렬화 가능한 dict)와 본문을 저장한다.
+        본문은 JSON 인코딩 없이 그대로 저장해 큰 텍스트도 빠르게 읽는다.
+        쓰기 실패는 경고 없이 무시한다.
+        """
+        path = self._path_for(key)
+        header = json.dumps({**meta, "has_text": text is not None}, ensure_ascii=False)
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(header.encode("utf-8") + b"\n")
+                if text is not None:
+                    f.write(text.encode("utf-8"))
+            os.replace(tmp_path, path)
+            self._written = True
+        except OSError:
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def entries(self) -> list[tuple[Path, int, float]]:
+        """(경로, 크기, 마지막 사용 시각) 목록을 반환한다."""
+        result = []
+        if not self.root.is_dir():
+            return result
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                path = Path(dirpath) / name
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                result.append((path, st.st_size, st.st_mtime))
+        return result
+
+    def prune(self, max_bytes: Optional[int] = None, force: bool = False) -> int:
+        """
+        전체 크기가 max_bytes 이하가 될 때까지 오래 사용되지 않은 항목부터 삭제한다.
+        이번 실행에서 쓴 항목이 없으면 (force가 아닌 한) 디렉터리를 훑지 않는다.
+        :return: 삭제한 바이트 수
+        """
+        if not self._written and not force:
+            return 0
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        freed = 0
+        for path, size, _ in sorted(entries, key=lambda e: e[2]):
+            if total <= limit:
+                break
+            try:
+                path.unlink()
+            except OSError as e:
+                print(f"[경고] 캐시 항목 삭제 실패: {path} ({e})", file=sys.stderr)
+                continue
+            total -= size
+            freed += size
+        return freed
@@ -1,11 +1,38 @@
 import argparse
 
 DEFAULT_README_NAME = "README.md"
+# --readme-validator 선택지. readme_validator.VALIDATORS의 키와 같아야 한다.
+# (--help가 검증기 모듈을 불러오지 않도록 이름만 둔다)
+README_VALIDATOR_NAMES = ("heading", "heuristic")
+DEFAULT_README_VALIDATOR = "heuristic"
+# batch 모드에서 동시에 처리하는 패키지 수와 동시에 실행하는 LLM 호출 수 기본값
+DEFAULT_PACKAGE_JOBS = 4
+DEFAULT_MAX_LLM_CONCURRENCY = 2
+# --parallel-sections에서 동시에 생성하는 섹션 수 기본값
+DEFAULT_SECTION_JOBS = 4
+# --summarize에서 동시에 요약하는 디렉터리(파일 묶음) 수 기본값
+DEFAULT_SUMMARY_JOBS = 4
+# --watch에서 변경을 확인하는 간격과, 변경이 멈춘 뒤 재생성까지 기다리는 시간 (초)
+DEFAULT_WATCH_POLL_INTERVAL = 1.0
+DEFAULT_WATCH_DEBOUNCE = 0.5
 
 
-def parse_args() -> argparse.Namespace:
+def _positive_int(value: str) -> int:
+    """argparse type: 1 이상의 정수."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"0보다 커야 합니다: {value}")
+    return number
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="패키지 경로를 기반으로 README.md를 생성/수정하는 도구"
+        description="패키지 경로를 기반으로 README.md를 생성/수정하는 도구",
+        epilog=(
+            "여러 패키지를 한 번에 처리하려면 'gen-readme batch --help'를, "
+            "캐시를 확인하거나 정리하려면 'gen-readme cache --help'를 참고하세요. "
+            "batch나 cache라는 디렉터리를 패키지로 지정하려면 './cache'처럼 경로로 적으세요."
+        ),
     )
     parser.add_argument(
         "package_path",
@@ -13,7 +40,122 @@ def parse_args() -> argparse.Namespace:
         default=".",
         help="분석할 도메인/서비스 패키지 루트 디렉터리 경로 (기본값: 현재 디렉터리 './')",
     )
-    
+    parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="README.md 파일로 저장하지 않고 결과를 stdout으로만 출력",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="종료하지 않고 패키지를 감시하면서 코드가 바뀔 때마다 README를 다시 생성 (Ctrl+C로 종료)",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_WATCH_DEBOUNCE,
+        metavar="SECONDS",
+        help=f"--watch에서 마지막 변경 후 이 시간 동안 추가 변경이 없으면 재생성 (기본값: {DEFAULT_WATCH_DEBOUNCE})",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_WATCH_POLL_INTERVAL,
+        metavar="SECONDS",
+        help=f"--watch에서 파일 변경을 확인하는 간격 (기본값: {DEFAULT_WATCH_POLL_INTERVAL})",
+    )
+    _add_generation_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.watch and (args.poll_interval <= 0 or args.debounce < 0):
+        parser.error("--poll-interval은 0보다 크고 --debounce는 0 이상이어야 합니다.")
+    return args
+
+
+def parse_batch_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="gen-readme batch",
+        description="모노레포의 여러 패키지에 대해 README.md를 한 번에 생성/수정하는 도구",
+    )
+    parser.add_argument(
+        "packages",
+        nargs="*",
+        metavar="PACKAGE",
+        help="패키지 루트 디렉터리 경로 또는 glob 패턴 (예: 'services/*')",
+    )
+    parser.add_argument(
+        "--from-file",
+        default=None,
+        metavar="FILE",
+        help="패키지 루트 경로를 한 줄에 하나씩 적은 파일 ('-'이면 stdin)",
+    )
+    parser.add_argument(
+        "--package-jobs",
+        type=int,
+        default=DEFAULT_PACKAGE_JOBS,
+        help=f"동시에 처리할 패키지 수 (기본값: {DEFAULT_PACKAGE_JOBS})",
+    )
+    parser.add_argument(
+        "--max-llm-concurrency",
+        type=int,
+        default=DEFAULT_MAX_LLM_CONCURRENCY,
+        help=f"동시에 실행할 LLM(gemini) 호출 수 상한 (기본값: {DEFAULT_MAX_LLM_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--summary",
+        default=None,
+        metavar="FILE",
+        help="패키지별 결과(상태, 소요 시간, 바이트 수)를 JSON으로 저장할 경로",
+    )
+    _add_generation_arguments(parser)
+    args = parser.parse_args(argv)
+    args.stdout = False
+    return args
+
+
+def parse_cache_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="gen-readme cache",
+        description="수집 캐시, LLM 응답 캐시, 디렉터리 요약 캐시를 확인하거나 정리하는 도구",
+    )
+    parser.add_argument(
+        "action",
+        nargs="?",
+        choices=["info", "prune"],
+        default="info",
+        help="info: 캐시별 항목 수와 크기 출력, prune: 크기 상한을 넘는 오래된 항목 삭제 (기본값: info)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="캐시 디렉터리 (기본값: ~/.cache/gen-readme)",
+    )
+    parser.add_argument(
+        "--namespace",
+        choices=["collect", "responses", "summaries", "all"],
+        default="all",
+        help="대상 캐시 (기본값: all)",
+    )
+    parser.add_argument(
+        "--max-size",
+        type=float,
+        default=None,
+        metavar="MB",
+        help="prune 후 남길 캐시별 최대 크기(MB). 0이면 모두 삭제 (기본값: 캐시별 기본 상한)",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="info에서 디렉터리 요약 캐시 항목(범위, 입력 토큰 수, 마지막 사용 시각)도 출력",
+    )
+    args = parser.parse_args(argv)
+    if args.max_size is not None and args.max_size < 0:
+        parser.error("--max-size는 0 이상이어야 합니다.")
+    return args
+
+
+def _add_generation_arguments(parser: argparse.ArgumentParser) -> None:
+    """단일 패키지 모드와 batch 모드가 공유하는 옵션."""
     parser.add_argument(
         "-t",
         "--template",
@@ -30,11 +172,193 @@ def parse_args() -> argparse.Namespace:
         "-p",
         "--provider",
         default="gemini",
-        help=f"사용할 LLM 제공자 (기본값: gemini)",
+        help=(
+            "사용할 LLM 제공자: gemini, openai, 'gen_readme.providers' 진입점으로 설치된 제공자 이름 "
+            "또는 '모듈 경로:클래스 이름' (기본값: gemini)"
+        ),
     )
     parser.add_argument(
-        "--stdout",
+        "--api-base",
+        default=None,
+        metavar="URL",
+        help=(
+            "openai 제공자가 호출할 OpenAI 호환 API 주소 (예: http://localhost:8000/v1). "
+            "지정하지 않으면 GEN_README_API_BASE, OPENAI_BASE_URL, https://api.openai.com/v1 순으로 사용. "
+            "API 키는 GEN_README_API_KEY, OPENAI_API_KEY, GEMINI_API_KEY 환경 변수로 전달"
+        ),
+    )
+    parser.add_argument(
+        "--model",
+        default=None,
+        help="openai 제공자가 사용할 모델 이름 (기본값: GEN_README_MODEL 환경 변수)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="파일 수집 시 동시에 읽을 스레드 수 (기본값: 8, 1이면 순차 처리)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="수집 캐시를 저장할 디렉터리 (기본값: ~/.cache/gen-readme)",
+    )
+    parser.add_argument(
+        "--no-cache",
         action="store_true",
-        help="README.md 파일로 저장하지 않고 결과를 stdout으로만 출력",
+        help="수집 캐시를 사용하지 않고 모든 파일을 다시 읽음",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="응답 캐시를 무시하고 항상 LLM을 호출해 README를 다시 생성 (결과는 캐시에 저장)",
+    )
+    parser.add_argument(
+        "--no-response-cache",
+        action="store_true",
+        help="LLM 응답 캐시를 읽지도 저장하지도 않음",
+    )
+    parser.add_argument(
+        "--response-cache-ttl",
+        type=float,
+        default=168,
+        metavar="HOURS",
+        help="캐시된 LLM 응답을 재사용할 최대 기간(시간) (기본값: 168 = 7일)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="README.md가 이미 있으면 전체 코드 대신 git diff와 변경된 파일만 보내 갱신",
+    )
+    parser.add_argument(
+        "--diff-base",
+        default=None,
+        help="--incremental에서 비교할 기준 ref (예: HEAD~1, origin/main). 지정하지 않으면 staged, 없으면 워킹트리 변경분을 사용",
+    )
+    parser.add_argument(
+        "--incremental-max-ratio",
+        type=float,
+        default=0.3,
+        help="변경분이 저장소 크기의 이 비율을 넘으면 전체 재생성으로 전환 (기본값: 0.3)",
+    )
+    parser.add_argument(
+        "--parallel-sections",
+        action="store_true",
+        help=(
+            "README를 섹션별로 나누어 동시에 생성한 뒤 목차 순서대로 합침. 목차는 --template의 '## ' 제목, "
+            "없으면 짧은 LLM 호출로 정하며, 섹션마다 관련 파일만 전달 (--incremental 갱신에는 적용하지 않음)"
+        ),
+    )
+    parser.add_argument(
+        "--section-jobs",
+        type=int,
+        default=DEFAULT_SECTION_JOBS,
+        metavar="N",
+        help=f"--parallel-sections에서 동시에 생성할 섹션 수 (기본값: {DEFAULT_SECTION_JOBS})",
+    )
+    parser.add_argument(
+        "--max-context-tokens",
+        type=int,
+        default=None,
+        help=(
+            "LLM에 전달할 코드 컨텍스트의 최대 토큰 수. 초과하면 중요도가 낮은 파일부터 축약/제외 "
+            "(--parallel-sections에서는 섹션마다 적용, 기본값: 제한 없음)"
+        ),
+    )
+    parser.add_argument(
+        "--summarize",
+        choices=["auto", "always", "never"],
+        default="auto",
+        help=(
+            "auto: 수집한 컨텍스트가 컨텍스트 창보다 크면 디렉터리별 요약을 모아 README를 생성, "
+            "always: 항상 요약, never: 요약하지 않음 (--incremental, --parallel-sections에는 적용하지 않음, 기본값: auto)"
+        ),
+    )
+    parser.add_argument(
+        "--context-window",
+        type=int,
+        default=None,
+        metavar="TOKENS",
+        help="--summarize auto의 기준이 되는 LLM 컨텍스트 창 크기(토큰) (기본값: 제공자별 값, gemini 1000000, openai 128000)",
+    )
+    parser.add_argument(
+        "--no-summary-cache",
+        action="store_true",
+        help="디렉터리 요약 캐시를 사용하지 않고 모든 디렉터리를 다시 요약",
+    )
+    parser.add_argument(
+        "--summary-jobs",
+        type=int,
+        default=DEFAULT_SUMMARY_JOBS,
+        metavar="N",
+        help=f"디렉터리 요약에서 동시에 실행할 LLM 호출 수 (기본값: {DEFAULT_SUMMARY_JOBS})",
+    )
+    parser.add_argument(
+        "--context-mode",
+        choices=["full", "skeleton"],
+        default="full",
+        help="full: 파일 전체 내용 전달, skeleton: 소스 파일은 시그니처/docstring/CLI 정의만 전달 (기본값: full)",
+    )
+    parser.add_argument(
+        "--full-text",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="skeleton 모드에서도 전체 내용을 유지할 파일의 glob 패턴 (반복 지정 가능)",
+    )
+    parser.add_argument(
+        "--no-dedupe",
+        action="store_true",
+        help="동일/유사 파일을 참조나 diff로 대체하지 않고 모두 그대로 전달",
+    )
+    parser.add_argument(
+        "--no-noise-filter",
+        action="store_true",
+        help="lockfile, minified/생성 파일, 대용량 데이터 파일도 요약하지 않고 그대로 전달",
+    )
+    parser.add_argument(
+        "--scratch-dir",
+        default=None,
+        help="컨텍스트 샤드 파일을 임시로 저장할 디렉터리 (기본값: /dev/shm, 없으면 시스템 임시 디렉터리)",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=_positive_int,
+        default=256,
+        metavar="KB",
+        help="컨텍스트 샤드 파일 하나의 최대 크기(KB). 파일 경계에서만 나눔 (기본값: 256)",
     )
-    return parser.parse_args()
\ No newline at end of file
+    parser.add_argument(
+        "--turn-timeout",
+        type=float,
+        default=600,
+        metavar="SECONDS",
+        help="LLM 호출 한 번(대화 턴)의 제한 시간(초). 0이면 제한 없음 (기본값: 600)",
+    )
+    parser.add_argument(
+        "--total-timeout",
+        type=float,
+        default=1800,
+        metavar="SECONDS",
+        help="LLM 대화 전체의 제한 시간(초). 0이면 제한 없음 (기본값: 1800)",
+    )
+    parser.add_argument(
+        "--readme-validator",
+        choices=README_VALIDATOR_NAMES,
+        default=DEFAULT_README_VALIDATOR,
+        help=(
+            "LLM 응답을 최종 README로 받아들일지 판단하는 검증기. "
+            "heuristic은 제목, 마크다운 구조, 대화 문장, 길이로 점수를 매기고 "
+            f"heading은 '#'로 시작하는지만 확인 (기본값: {DEFAULT_README_VALIDATOR})"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        metavar="OUT_JSON",
+        help=(
+            "git 탐색, 파일 수집, 샤드 저장, 프롬프트 생성, LLM 대화 턴별 소요 시간을 "
+            "Chrome trace-event 형식으로 저장하고 요약 표를 stderr에 출력"
+        ),
+    )
\ No newline at end of file
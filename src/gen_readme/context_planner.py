@@ -0,0 +1,256 @@
+import heapq
+import posixpath
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .dedupe import drop_dangling_duplicates
+from .dir_text_collector import format_file_header, format_file_stream
+from .noise_filter import GENERATED_SUFFIXES, LOCK_FILES
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10 이하
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# 토큰 수 추정: UTF-8 4바이트당 1토큰 (한글은 글자당 약 0.75토큰)
+BYTES_PER_TOKEN = 4
+# 이보다 적게 남는 파일은 잘라 넣지 않고 통째로 제외
+MIN_TRUNCATE_TOKENS = 256
+# 컨텍스트 창 중 README 생성 대화의 컨텍스트에 쓰는 비율 (나머지는 프롬프트, 도구 호출, 응답 몫)
+CONTEXT_WINDOW_USAGE = 0.8
+# 매니페스트에 나열할 최대 파일 수
+MAX_MANIFEST_ENTRIES = 200
+
+# 중요도 등급 (클수록 먼저 포함)
+TIER_ESSENTIAL = 3
+TIER_HIGH = 2
+TIER_NORMAL = 1
+TIER_LOW = 0
+
+_ESSENTIAL_NAMES = {
+    "__main__.py",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "package.json",
+    "Cargo.toml",
+    "go.mod",
+}
+_HIGH_NAMES = {"__init__.py", "Dockerfile", "Makefile", "docker-compose.yml", "docker-compose.yaml"}
+_DOC_EXTENSIONS = {".md", ".rst", ".adoc"}
+_CONFIG_EXTENSIONS = {".toml", ".cfg", ".ini", ".yaml", ".yml"}
+_LOW_DIRS = {
+    "test",
+    "tests",
+    "__tests__",
+    "testing",
+    "spec",
+    "fixtures",
+    "testdata",
+    "generated",
+    "migrations",
+    "vendor",
+    "third_party",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """문자열의 대략적인 토큰 수."""
+    return (len(text.encode("utf-8")) + BYTES_PER_TOKEN - 1) // BYTES_PER_TOKEN
+
+
+def context_limit(window_tokens: int) -> int:
+    """컨텍스트 창 크기에 대해 요약 없이 보낼 수 있는 컨텍스트의 최대 토큰 수."""
+    return int(window_tokens * CONTEXT_WINDOW_USAGE)
+
+
+def load_entry_point_modules(package_dir: Path) -> set[str]:
+    """
+    pyproject.toml의 [project.scripts]/[project.gui-scripts]에서 진입점 모듈을 읽어
+    'gen_readme/app' 같은 경로 형태로 반환한다. tomllib(또는 tomli)이 없으면 빈 집합.
+    """
+    pyproject = package_dir / "pyproject.toml"
+    if tomllib is None or not pyproject.is_file():
+        return set()
+    try:
+        with open(pyproject, "rb") as f:
+            project = tomllib.load(f).get("project", {})
+    except (OSError, ValueError) as e:
+        print(f"[경고] pyproject.toml을 읽지 못해 진입점 정보를 사용하지 않습니다: {e}")
+        return set()
+
+    modules = set()
+    for table in ("scripts", "gui-scripts"):
+        for target in project.get(table, {}).values():
+            module = str(target).split(":", 1)[0].strip()
+            if module:
+                modules.add(module.replace(".", "/"))
+    return modules
+
+
+def _is_entry_point(relative_path: str, entry_modules: set[str]) -> bool:
+    stem, ext = posixpath.splitext(relative_path)
+    if ext != ".py":
+        return False
+    if stem.endswith("/__init__"):
+        stem = stem[: -len("/__init__")]
+    return any(stem == m or stem.endswith("/" + m) for m in entry_modules)
+
+
+def classify(relative_path: str, entry_modules: set[str] = frozenset()) -> int:
+    """
+    README 작성에 얼마나 중요한 파일인지 등급을 매긴다.
+    진입점·패키지 메타데이터 > 패키지 __init__·설정·문서 > 일반 소스 > 테스트·픽스처·생성 파일
+    """
+    path = relative_path.replace("\\", "/")
+    parts = path.split("/")
+    name = parts[-1]
+    _, ext = posixpath.splitext(name)
+
+    if (
+        name in LOCK_FILES
+        or name.endswith(GENERATED_SUFFIXES)
+        or any(part in _LOW_DIRS for part in parts[:-1])
+        or name.startswith("test_")
+        or name.endswith(("_test.py", "_test.go"))
+        or ".test." in name
+        or ".spec." in name
+        or name == "conftest.py"
+    ):
+        return TIER_LOW
+
+    if (
+        name in _ESSENTIAL_NAMES
+        or name.upper().startswith("README")
+        or _is_entry_point(path, entry_modules)
+    ):
+        return TIER_ESSENTIAL
+
+    if (
+        name in _HIGH_NAMES
+        or ext in _DOC_EXTENSIONS
+        or ext in _CONFIG_EXTENSIONS
+        or (parts[0] in ("docs", "doc") and len(parts) > 1)
+    ):
+        return TIER_HIGH
+
+    return TIER_NORMAL
+
+
+@dataclass
+class ContextManifest:
+    """토큰 예산 때문에 제외되거나 축약된 파일 기록."""
+
+    budget: int
+    included_files: int = 0
+    included_tokens: int = 0
+    dropped: list[tuple[str, int]] = field(default_factory=list)  # (경로, 토큰)
+    truncated: list[tuple[str, int, int]] = field(default_factory=list)  # (경로, 포함 토큰, 원래 토큰)
+
+    def render(self) -> str:
+        """LLM에게 함께 전달할 매니페스트 본문."""
+        lines = [
+            f"컨텍스트 토큰 예산({self.budget}토큰)을 맞추기 위해 아래 파일들은 제외되거나 앞부분만 포함되었다.",
+            "이 파일들의 세부 내용은 추측하지 말고, 필요하면 존재 여부 정도만 언급하라.",
+            "",
+        ]
+        for path, kept, original in self.truncated:
+            lines.append(f"- {path} (약 {original}토큰 중 {kept}토큰만 포함)")
+        for path, tokens in self.dropped[:MAX_MANIFEST_ENTRIES]:
+            lines.append(f"- {path} (약 {tokens}토큰, 제외)")
+        if len(self.dropped) > MAX_MANIFEST_ENTRIES:
+            lines.append(f"- ... 외 {len(self.dropped) - MAX_MANIFEST_ENTRIES}개 파일 제외")
+        return "\n".join(lines) + "\n"
+
+
+def _truncate(text: str, tokens: int, keep_tokens: int) -> str:
+    """앞부분 keep_tokens만큼을 줄 단위로 남기고 생략 표시를 붙인다."""
+    keep_chars = len(text) * keep_tokens // max(tokens, 1)
+    cut = text.rfind("\n", 0, keep_chars)
+    if cut <= 0:
+        cut = keep_chars
+    return text[:cut] + f"\n... (이하 생략: 원본 약 {tokens}토큰)\n"
+
+
+def plan_files(
+    files: Iterable[tuple[str, str]],
+    max_tokens: int,
+    entry_modules: set[str] = frozenset(),
+    manifest: ContextManifest | None = None,
+) -> list[tuple[str, str]]:
+    """
+    (상대 경로, 내용) 스트림에서 중요도가 높은 파일부터 max_tokens 예산을 채운다.
+    예산 경계에 걸린 파일은 앞부분만 남기고, 나머지는 제외하여 manifest에 기록한다.
+    가장 덜 중요한 파일부터 즉시 버리므로 메모리에는 대략 예산만큼의 내용만 유지된다.
+
+    :return: 선택된 (상대 경로, 내용) 목록. 원래 경로 순서를 유지한다.
+    """
+    if manifest is None:
+        manifest = ContextManifest(budget=max_tokens)
+
+    # 힙의 맨 앞이 가장 덜 중요한 파일: 낮은 등급, 깊은 경로, 큰 파일, 나중 순서
+    heap: list = []
+    total = 0
+    for seq, (relative_path, text) in enumerate(files):
+        tokens = estimate_tokens(text)
+        tier = classify(relative_path, entry_modules)
+        depth = relative_path.count("/")
+        heapq.heappush(heap, (tier, -depth, -tokens, -seq, relative_path, text, tokens))
+        total += tokens
+        while heap and total - heap[0][6] >= max_tokens:
+            dropped = heapq.heappop(heap)
+            total -= dropped[6]
+            manifest.dropped.append((dropped[4], dropped[6]))
+
+    if heap and total > max_tokens:
+        entry = heapq.heappop(heap)
+        relative_path, text, tokens = entry[4], entry[5], entry[6]
+        keep_tokens = max_tokens - (total - tokens)
+        total -= tokens
+        if keep_tokens >= MIN_TRUNCATE_TOKENS:
+            text = _truncate(text, tokens, keep_tokens)
+            heapq.heappush(heap, entry[:5] + (text, keep_tokens))
+            total += keep_tokens
+            manifest.truncated.append((relative_path, keep_tokens, tokens))
+        else:
+            manifest.dropped.append((relative_path, tokens))
+
+    ordered = sorted(heap, key=lambda e: -e[3])
+    # 대표 파일이 빠져 참조만 남게 된 중복 파일도 뺀다. (LLM이 없는 파일을 찾지 않도록)
+    selected, dangling = drop_dangling_duplicates([(e[4], e[5]) for e in ordered])
+    if dangling:
+        kept_tokens = {e[4]: e[6] for e in ordered}
+        for relative_path, _ in dangling:
+            total -= kept_tokens[relative_path]
+            manifest.dropped.append((relative_path, kept_tokens[relative_path]))
+    manifest.included_files = len(selected)
+    manifest.included_tokens = total
+    # 매니페스트는 경로 순으로 정리
+    manifest.dropped.sort()
+    return selected
+
+
+def stream_planned_files(
+    files: Iterable[tuple[str, str]],
+    max_tokens: int,
+    entry_modules: set[str] = frozenset(),
+) -> Iterator[str]:
+    """
+    plan_files로 예산에 맞춘 파일들을 컨텍스트 스트림으로 내보내고,
+    제외/축약된 파일이 있으면 마지막에 매니페스트를 덧붙인다.
+    """
+    manifest = ContextManifest(budget=max_tokens)
+    selected = plan_files(files, max_tokens, entry_modules, manifest)
+    print(
+        f"[정보] 컨텍스트 예산 {max_tokens}토큰: {manifest.included_files}개 파일 포함"
+        f"(약 {manifest.included_tokens}토큰), {len(manifest.dropped)}개 제외, "
+        f"{len(manifest.truncated)}개 축약"
+    )
+    yield from format_file_stream(selected)
+    if manifest.dropped or manifest.truncated:
+        yield format_file_header("(컨텍스트 매니페스트: 제외/축약된 파일)")
+        yield manifest.render()
@@ -0,0 +1,223 @@
+import difflib
+import hashlib
+import re
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+# MinHash 서명 길이와 LSH 밴드 구성 (NUM_BINS = BANDS * ROWS)
+# 해시 함수 NUM_BINS개 대신, 한 번의 해시 값을 하위 비트로 NUM_BINS개 구간에 나누고
+# 구간마다 최솟값을 취하는 one-permutation MinHash를 사용한다.
+NUM_BINS = 32
+BANDS = 8
+ROWS = 4
+_BIN_BITS = 5
+_BIN_MASK = NUM_BINS - 1
+_EMPTY = 1 << 32
+# 이 유사도(추정 Jaccard) 이상이면 유사 파일로 보고 diff로 대체
+NEAR_DUP_THRESHOLD = 0.7
+# diff가 원본의 이 비율보다 작을 때만 대체
+MAX_DIFF_RATIO = 0.5
+# 유사 파일 탐지 대상 크기 범위 (너무 작으면 오탐, 너무 크면 diff 비용이 큼)
+NEAR_DUP_MIN_CHARS = 512
+NEAR_DUP_MAX_CHARS = 256 * 1024
+# diff 기준이 되는 대표 파일 내용을 메모리에 유지하는 총량
+MAX_REPRESENTATIVE_CHARS = 32 * 1024 * 1024
+
+# 대체한 내용의 첫 줄. 컨텍스트 예산이나 섹션 선택에서 대표 파일이 빠졌는지 확인할 때 다시 해석한다.
+_EXACT_STUB = "(중복 파일: {path}와 내용이 같아 생략)\n"
+_NEAR_HEADER = "(유사 파일: {path}와 약 {score:.0%} 유사하여 차이만 표시)\n"
+_STUB_PREFIXES = ("(중복 파일: ", "(유사 파일: ")
+_STUB_LINE = re.compile(r"\((?:중복 파일: (.+)와 내용이 같아 생략|유사 파일: (.+)와 약 \d+% 유사하여 차이만 표시)\)")
+
+
+def duplicate_of(text: str) -> str | None:
+    """중복 제거로 대체된 내용이면 참조하는 대표 파일의 경로, 아니면 None."""
+    if not text.startswith(_STUB_PREFIXES):
+        return None
+    end = text.find("\n")
+    match = _STUB_LINE.fullmatch(text if end < 0 else text[:end])
+    if match is None:
+        return None
+    return match.group(1) or match.group(2)
+
+
+def drop_dangling_duplicates(
+    files: list[tuple[str, str]]
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """
+    files 안에 참조하는 대표 파일이 없는 중복 대체 내용을 뺀다. (대표 파일만 예산이나 선택에서 빠진 경우)
+    대체 내용이 다시 대체된 파일을 참조할 수 있으므로 더 뺄 것이 없을 때까지 반복한다.
+
+    :return: (남은 목록, 뺀 목록). 남은 목록은 원래 순서를 유지한다.
+    """
+    kept = list(files)
+    dropped: list[tuple[str, str]] = []
+    while True:
+        present = {relative_path for relative_path, _ in kept}
+        remaining = []
+        for relative_path, text in kept:
+            reference = duplicate_of(text)
+            if reference is not None and reference not in present:
+                dropped.append((relative_path, text))
+            else:
+                remaining.append((relative_path, text))
+        if len(remaining) == len(kept):
+            return kept, dropped
+        kept = remaining
+
+
+@dataclass
+class DedupeStats:
+    exact_files: int = 0
+    near_files: int = 0
+    saved_chars: int = 0
+
+
+def _normalize(text: str) -> bytes:
+    """줄 끝 공백과 빈 줄 차이를 무시하도록 정규화한 내용."""
+    return "\n".join([line for line in map(str.rstrip, text.splitlines()) if line]).encode(
+        "utf-8"
+    )
+
+
+def _minhash(normalized: bytes) -> tuple[int, ...] | None:
+    """연속된 두 줄을 하나의 shingle로 보는 one-permutation MinHash 서명."""
+    line_hashes = [zlib.crc32(line) for line in normalized.split(b"\n")]
+    if len(line_hashes) < 2:
+        return None
+    signature = [_EMPTY] * NUM_BINS
+    for first, second in zip(line_hashes, line_hashes[1:]):
+        # 두 줄의 해시를 섞어 32비트 shingle 해시를 만든다.
+        h = (first * 0x9E3779B1 ^ second) & 0xFFFFFFFF
+        bin_index = h & _BIN_MASK
+        value = h >> _BIN_BITS
+        if value < signature[bin_index]:
+            signature[bin_index] = value
+    return tuple(signature)
+
+
+def _band_keys(signature: tuple[int, ...]) -> Iterator[tuple[int, tuple[int, ...]]]:
+    """LSH 밴드 키. 모든 구간이 비어 있는 밴드는 서로 무관한 파일끼리 충돌하므로 건너뛴다."""
+    for band in range(BANDS):
+        rows = signature[band * ROWS:(band + 1) * ROWS]
+        if any(value != _EMPTY for value in rows):
+            yield band, rows
+
+
+def _similarity(sig_a: tuple[int, ...], sig_b: tuple[int, ...]) -> float:
+    """양쪽 모두 비어 있는 구간은 제외하고 일치하는 구간의 비율을 계산한다."""
+    used = matched = 0
+    for a, b in zip(sig_a, sig_b):
+        if a == _EMPTY and b == _EMPTY:
+            continue
+        used += 1
+        if a == b:
+            matched += 1
+    return matched / used if used else 0.0
+
+
+class Deduplicator:
+    """
+    (상대 경로, 내용) 스트림에서 중복 파일을 걸러낸다.
+    - 정규화한 내용이 완전히 같은 파일은 "<경로>와 같음" 한 줄로 대체
+    - MinHash/LSH로 찾은 유사 파일은 대표 파일과의 unified diff로 대체
+    해시와 서명만 모든 파일에 대해 유지하고, diff에 필요한 대표 파일 내용은
+    MAX_REPRESENTATIVE_CHARS 안에서 LRU로 유지하므로 메모리 사용량이 제한된다.
+    """
+
+    def __init__(self, stats: DedupeStats | None = None):
+        self.stats = stats or DedupeStats()
+        self._digests: dict[bytes, str] = {}
+        self._buckets: dict[tuple[int, tuple[int, ...]], str] = {}
+        self._signatures: dict[str, tuple[int, ...]] = {}
+        # 경로 -> (줄 목록, 글자 수)
+        self._representatives: OrderedDict[str, tuple[list[str], int]] = OrderedDict()
+        self._representative_chars = 0
+
+    def process(self, files: Iterable[tuple[str, str]]) -> Iterator[tuple[str, str]]:
+        for relative_path, text in files:
+            yield relative_path, self._dedupe(relative_path, text)
+
+        if self.stats.exact_files or self.stats.near_files:
+            print(
+                f"[정보] 중복 제거: 동일 파일 {self.stats.exact_files}개, "
+                f"유사 파일 {self.stats.near_files}개를 대체하여 약 {self.stats.saved_chars}자를 줄였습니다."
+            )
+
+    def _dedupe(self, relative_path: str, text: str) -> str:
+        normalized = _normalize(text)
+        digest = hashlib.blake2b(normalized, digest_size=16).digest()
+
+        original = self._digests.get(digest)
+        if original is not None:
+            stub = _EXACT_STUB.format(path=original)
+            if len(stub) < len(text):
+                self.stats.exact_files += 1
+                self.stats.saved_chars += len(text) - len(stub)
+                return stub
+            return text
+        self._digests[digest] = relative_path
+
+        if not NEAR_DUP_MIN_CHARS <= len(text) <= NEAR_DUP_MAX_CHARS:
+            return text
+        signature = _minhash(normalized)
+        if signature is None:
+            return text
+
+        replacement = self._near_duplicate(relative_path, text, signature)
+        if replacement is not None:
+            self.stats.near_files += 1
+            self.stats.saved_chars += len(text) - len(replacement)
+            return replacement
+
+        self._add_representative(relative_path, text, signature)
+        return text
+
+    def _near_duplicate(
+        self, relative_path: str, text: str, signature: tuple[int, ...]
+    ) -> str | None:
+        candidates = []
+        for key in _band_keys(signature):
+            candidate = self._buckets.get(key)
+            if candidate is not None and candidate not in candidates:
+                candidates.append(candidate)
+
+        best, best_score = None, NEAR_DUP_THRESHOLD
+        for candidate in candidates:
+            score = _similarity(signature, self._signatures[candidate])
+            if score >= best_score and candidate in self._representatives:
+                best, best_score = candidate, score
+        if best is None:
+            return None
+
+        self._representatives.move_to_end(best)
+        base_lines, _ = self._representatives[best]
+        diff = "".join(
+            difflib.unified_diff(
+                base_lines,
+                text.splitlines(keepends=True),
+                fromfile=best,
+                tofile=relative_path,
+                n=1,
+            )
+        )
+        header = _NEAR_HEADER.format(path=best, score=best_score)
+        replacement = header + diff
+        if len(replacement) > len(text) * MAX_DIFF_RATIO:
+            return None
+        return replacement
+
+    def _add_representative(
+        self, relative_path: str, text: str, signature: tuple[int, ...]
+    ) -> None:
+        self._signatures[relative_path] = signature
+        for key in _band_keys(signature):
+            self._buckets.setdefault(key, relative_path)
+
+        self._representatives[relative_path] = (text.splitlines(keepends=True), len(text))
+        self._representative_chars += len(text)
+        while self._representative_chars > MAX_REPRESENTATIVE_CHARS and self._representatives:
+            _, (_, chars) = self._representatives.popitem(last=False)
+            self._representative_chars -= chars
@@ -1,9 +1,112 @@
+import fnmatch
+import mmap
 import os
-from typing import Callable, Iterator
-from . import git_utils
+import stat
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+from . import git_utils, profiling
+from .collect_cache import MISS, CollectionCache, blob_key, stat_key
+from .dedupe import DedupeStats, Deduplicator
+from .noise_filter import NoiseFilter, noise_stub
+from .skeleton import python_skeleton
+from .temp_utils import FILE_HEADER_PREFIX, FileHeader
 
+if TYPE_CHECKING:
+    from .tree_snapshot import TreeSnapshot
 
-def is_probably_binary(file_path: str, block_size: int = 1024) -> bool:
+# 동시에 파일을 읽는 스레드 수 기본값 (I/O 바운드 작업이므로 CPU 수와 무관하게 잡음)
+DEFAULT_JOBS = 8
+# 읽기를 마쳤지만 아직 내보내지 않은 파일 내용의 총량 상한
+MAX_INFLIGHT_BYTES = 32 * 1024 * 1024
+# 컨텍스트 스트림에서 한 번에 내보내는 문자열 조각 크기
+CHUNK_SIZE = 16 * 1024
+# 바이너리 판별에 사용하는 앞부분 크기
+SNIFF_SIZE = 1024
+# 이 크기 이상인 파일은 mmap으로 읽어 중간 복사 없이 디코딩
+MMAP_THRESHOLD = 1024 * 1024
+# 링크 파일은 열지 않고 건너뛰기 위한 플래그 (지원하지 않는 플랫폼에서는 0)
+_O_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+
+
+@dataclass
+class FileText:
+    """한 번의 open으로 읽어 디코딩한 파일 내용."""
+
+    text: str
+    size: int
+    dropped_bytes: int = 0
+    cached: bool = False
+
+
+@dataclass
+class CollectionStats:
+    """수집 과정의 통계. stream_all_files에 넘기면 스트림을 소비하면서 채워진다."""
+
+    files: int = 0
+    bytes_read: int = 0
+    decode_dropped_bytes: int = 0
+    decode_error_files: int = 0
+    cache_hits: int = 0
+    skeleton_files: int = 0
+    skeleton_saved_bytes: int = 0
+    noise_files: int = 0
+    noise_saved_bytes: int = 0
+    dedupe: DedupeStats = field(default_factory=DedupeStats)
+
+
+# 확장자별 skeleton 변환기. 변환기는 파일 내용을 받아 요약본을 반환하고,
+# 변환할 수 없으면 None을 반환한다. (이 경우 전체 내용을 그대로 사용)
+Transformer = Callable[[str], "str | None"]
+_TRANSFORMERS: dict[str, Transformer] = {
+    ".py": python_skeleton,
+    ".pyi": python_skeleton,
+}
+
+
+def register_transformer(extension: str, transformer: Transformer) -> None:
+    """
+    skeleton 모드에서 사용할 확장자별 변환기를 등록한다.
+    예: register_transformer(".go", go_skeleton)
+    """
+    _TRANSFORMERS[extension.lower()] = transformer
+
+
+def get_transformer(relative_path: str) -> Transformer | None:
+    return _TRANSFORMERS.get(os.path.splitext(relative_path)[1].lower())
+
+
+@dataclass
+class SkeletonOptions:
+    """
+    skeleton 모드 설정.
+
+    :param min_bytes: 이보다 작은 파일은 요약하지 않고 전체 내용을 유지
+    :param keep_full: 전체 내용을 유지할 파일의 glob 패턴 (상대 경로 또는 파일명과 비교)
+    """
+
+    min_bytes: int = 4 * 1024
+    keep_full: tuple[str, ...] = ()
+
+    def keeps_full_text(self, relative_path: str, size: int) -> bool:
+        if size < self.min_bytes:
+            return True
+        name = os.path.basename(relative_path)
+        return any(
+            fnmatch.fnmatch(relative_path, pattern) or fnmatch.fnmatch(name, pattern)
+            for pattern in self.keep_full
+        )
+
+
+def _looks_binary(head: bytes) -> bool:
+    """앞부분에 NULL 바이트(\0)가 있으면 바이너리 파일로 간주."""
+    return b"\x00" in head
+
+
+def is_probably_binary(file_path: str, block_size: int = SNIFF_SIZE) -> bool:
     """
     파일의 앞부분을 조금 읽어서 바이너리 여부를 대략 판별한다.
     NULL 바이트(\0)가 있으면 바이너리 파일로 간주.
@@ -11,88 +114,462 @@ def is_probably_binary(file_path: str, block_size: int = 1024) -> bool:
     try:
         with open(file_path, "rb") as f:
             chunk = f.read(block_size)
-        if b"\x00" in chunk:
-            return True
-        return False
+        return _looks_binary(chunk)
     except Exception:
         # 열 수 없는 파일은 바이너리 취급해서 스킵
         return True
 
 
-def _stream_files_from_git(root_dir: str, chunk_size: int) -> Iterator[str]:
-    """Git 추적 파일을 스트리밍합니다."""
-    tracked_files = git_utils.get_tracked_files(root_dir)
+def _iter_git_entries(
+    repo_ctx: git_utils.RepoContext,
+    listing: git_utils.RepoListing | None = None,
+    announce: bool = True,
+) -> Iterator[tuple[str, str]]:
+    """
+    Git 추적 파일의 (절대 경로, 패키지 기준 상대 경로)를 경로 순서대로 반환합니다.
+    listing이 주어지면 git을 다시 실행하지 않고 미리 조회한 목록에서 패키지 하위만 골라냅니다.
+    """
+    if listing is not None and listing.covers(repo_ctx):
+        tracked_files = listing.files_under(repo_ctx)
+    else:
+        tracked_files = git_utils.get_tracked_files(repo_ctx)
     if not tracked_files:
-        print("[정보] Git 추적 파일을 찾을 수 없습니다.")
+        if announce:
+            print("[정보] Git 추적 파일을 찾을 수 없습니다.")
         return
 
-    print(f"[정보] .gitignore를 기준으로 {len(tracked_files)}개의 파일을 수집합니다.")
-    for file_path in tracked_files:
-        if not os.path.exists(file_path) or os.path.islink(file_path):
-            continue
-        if is_probably_binary(file_path):
-            continue
-        
-        relative_path = os.path.relpath(file_path, root_dir)
-        yield f"\n\n===== FILE: {relative_path} =====\n\n"
-        try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-                    yield chunk
-        except Exception as e:
-            print(f"[경고] 파일 읽기 실패: {file_path} ({e})")
-            continue
+    if announce:
+        print(f"[정보] .gitignore를 기준으로 {len(tracked_files)}개의 파일을 수집합니다.")
+    yield from _repo_relative_entries(repo_ctx, tracked_files)
 
 
-def _stream_files_from_walk(
-    root_dir: str, skip_hidden: bool, chunk_size: int
-) -> Iterator[str]:
-    """os.walk를 사용하여 모든 파일을 스트리밍합니다."""
-    print("[정보] Git 저장소가 아니므로, 숨김 파일을 제외하고 모든 파일을 수집합니다.")
+def _repo_relative_entries(
+    repo_ctx: git_utils.RepoContext, repo_relative_paths: list[str]
+) -> Iterator[tuple[str, str]]:
+    """git 루트 기준 경로 목록을 (절대 경로, 패키지 기준 상대 경로)로 바꿉니다."""
+    git_root = str(repo_ctx.git_root)
+    # git 루트 기준 경로에서 패키지 접두사만 잘라내 패키지 기준 상대 경로를 만든다.
+    prefix = repo_ctx.rel_path.as_posix() + "/" if repo_ctx.rel_path.parts else ""
+    for repo_relative in repo_relative_paths:
+        yield os.path.join(git_root, repo_relative), repo_relative[len(prefix):]
+
+
+def _iter_walk_entries(
+    root_dir: str, skip_hidden: bool, announce: bool = True
+) -> Iterator[tuple[str, str]]:
+    """os.walk로 찾은 파일의 (절대 경로, 상대 경로)를 경로 순서대로 반환합니다."""
+    if announce:
+        print("[정보] Git 저장소가 아니므로, 숨김 파일을 제외하고 모든 파일을 수집합니다.")
     for dirpath, dirnames, filenames in os.walk(root_dir):
         if skip_hidden:
             dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        # 실행마다 같은 순서로 출력되도록 정렬
+        dirnames.sort()
 
-        for filename in filenames:
+        for filename in sorted(filenames):
             if skip_hidden and filename.startswith("."):
                 continue
 
             file_path = os.path.join(dirpath, filename)
-            if os.path.islink(file_path) or is_probably_binary(file_path):
-                continue
-            
-            relative_path = os.path.relpath(file_path, root_dir)
-            yield f"\n\n===== FILE: {relative_path} =====\n\n"
+            yield file_path, os.path.relpath(file_path, root_dir)
+
+
+def _decode(buffer, size: int) -> tuple[str, int]:
+    """
+    UTF-8로 디코딩하고 (텍스트, 디코딩 오류로 버려진 바이트 수)를 반환한다.
+    대부분의 파일은 strict 디코딩 한 번으로 끝나고, 실패한 경우에만 다시 계산한다.
+    """
+    try:
+        text = str(buffer, "utf-8")
+        dropped = 0
+    except UnicodeDecodeError:
+        text = str(buffer, "utf-8", "ignore")
+        dropped = size - len(text.encode("utf-8"))
+    # 텍스트 모드 open과 같은 결과가 되도록 줄바꿈을 통일
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, dropped
+
+
+def read_text_file(file_path: str) -> FileText | None:
+    """
+    파일을 한 번만 열어서 바이너리 판별과 텍스트 디코딩을 함께 처리한다.
+    MMAP_THRESHOLD 이상인 파일은 mmap으로 읽는다.
+    존재하지 않거나 링크이거나 일반 파일이 아니거나 바이너리인 경우 None을 반환한다.
+    """
+    if not _O_NOFOLLOW and os.path.islink(file_path):
+        return None
+    try:
+        fd = os.open(file_path, os.O_RDONLY | _O_NOFOLLOW)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError:
+        if os.path.islink(file_path):
+            return None
+        raise
+
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        size = st.st_size
+        if size == 0:
+            return FileText(text="", size=0)
+
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                if _looks_binary(mm[:SNIFF_SIZE]):
+                    return None
+                text, dropped = _decode(mm, size)
+        else:
+            with open(fd, "rb", closefd=False) as f:
+                data = f.read()
+            size = len(data)
+            if _looks_binary(data[:SNIFF_SIZE]):
+                return None
+            text, dropped = _decode(data, size)
+        return FileText(text=text, size=size, dropped_bytes=dropped)
+    finally:
+        os.close(fd)
+
+
+def _cached_reader(
+    cache: CollectionCache, blob_ids: dict[str, str]
+) -> Callable[[str], FileText | None]:
+    """
+    캐시를 먼저 조회하는 read_text_file 래퍼를 만든다.
+    git 인덱스와 내용이 같은 파일은 blob ID로, 나머지는 (inode, mtime, 크기)로 키를 만든다.
+    바이너리 등으로 제외된 파일도 None으로 저장해 다음 실행에서 다시 열지 않는다.
+    """
+
+    def reader(file_path: str) -> FileText | None:
+        blob_id = blob_ids.get(file_path)
+        if blob_id:
+            key = blob_key(blob_id)
+        else:
             try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    while True:
-                        chunk = f.read(chunk_size)
-                        if not chunk:
-                            break
-                        yield chunk
-            except Exception as e:
-                print(f"[경고] 파일 읽기 실패: {file_path} ({e})")
-                continue
+                key = stat_key(os.lstat(file_path))
+            except (FileNotFoundError, NotADirectoryError):
+                return None
+
+        cached = cache.get(key)
+        if cached is not MISS:
+            meta, text = cached
+            if text is None:
+                return None
+            return FileText(
+                text=text,
+                size=meta["size"],
+                dropped_bytes=meta["dropped_bytes"],
+                cached=True,
+            )
+
+        result = read_text_file(file_path)
+        if result is None:
+            cache.put(key, {})
+        else:
+            cache.put(
+                key,
+                {"size": result.size, "dropped_bytes": result.dropped_bytes},
+                result.text,
+            )
+        return result
+
+    return reader
+
+
+class _InflightBytes:
+    """읽기를 마쳤지만 아직 내보내지 않은 결과의 총 크기를 스레드 안전하게 추적한다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = 0
+
+    def on_done(self, future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            with self._lock:
+                result = future.result()
+                self.total += result.size if result else 0
+
+    def release(self, future: Future) -> None:
+        if future.exception() is None:
+            with self._lock:
+                result = future.result()
+                self.total -= result.size if result else 0
+
+
+def _collect_ordered(
+    entries: Iterator[tuple[str, str]],
+    reader: Callable[[str], FileText | None],
+    jobs: int,
+    max_inflight_bytes: int = MAX_INFLIGHT_BYTES,
+) -> Iterator[tuple[str, str, Future]]:
+    """
+    스레드 풀로 파일을 미리 읽되, 입력 순서 그대로 (절대 경로, 상대 경로, Future)를 반환한다.
+    대기 중인 작업 수는 jobs의 4배, 읽어 둔 내용의 총량은 max_inflight_bytes로 제한한다.
+    """
+    max_pending = max(1, jobs) * 4
+    pending: deque = deque()
+    inflight = _InflightBytes()
+    exhausted = False
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        try:
+            while True:
+                while (
+                    not exhausted
+                    and len(pending) < max_pending
+                    and (not pending or inflight.total < max_inflight_bytes)
+                ):
+                    try:
+                        file_path, relative_path = next(entries)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    future = executor.submit(reader, file_path)
+                    future.add_done_callback(inflight.on_done)
+                    pending.append((file_path, relative_path, future))
+
+                if not pending:
+                    return
+                file_path, relative_path, future = pending.popleft()
+                future.exception()  # 완료될 때까지 대기
+                inflight.release(future)
+                yield file_path, relative_path, future
+        finally:
+            # 소비자가 중간에 멈춘 경우 아직 시작하지 않은 작업은 취소
+            for _, _, future in pending:
+                future.cancel()
+
+
+def _iter_entry_texts(
+    entries: Iterator[tuple[str, str]],
+    jobs: int,
+    stats: CollectionStats,
+    reader: Callable[[str], FileText | None] = read_text_file,
+    skeleton: SkeletonOptions | None = None,
+    noise: NoiseFilter | None = None,
+) -> Iterator[tuple[str, str]]:
+    """
+    파일 목록을 병렬로 읽어 (상대 경로, 내용)을 경로 순서대로 반환합니다.
+    noise가 주어지면 lockfile·생성 파일 등은 크기만 담은 한 줄 요약으로 바꾸고,
+    skeleton이 주어지면 등록된 변환기가 있는 파일은 요약본으로 바꿉니다.
+    """
+    for file_path, relative_path, future in _collect_ordered(
+        entries, reader, jobs
+    ):
+        error = future.exception()
+        if error is not None:
+            print(f"[경고] 파일 읽기 실패: {file_path} ({error})")
+            continue
+        result = future.result()
+        if result is None:
+            continue
+
+        stats.files += 1
+        stats.bytes_read += result.size
+        if result.cached:
+            stats.cache_hits += 1
+        if result.dropped_bytes:
+            stats.decode_dropped_bytes += result.dropped_bytes
+            stats.decode_error_files += 1
+
+        text = result.text
+        reason = noise.classify(relative_path, text) if noise else None
+        if reason is not None:
+            stub = noise_stub(reason, result.size)
+            stats.noise_files += 1
+            stats.noise_saved_bytes += max(0, result.size - len(stub))
+            yield relative_path, stub
+            continue
+
+        if skeleton and not skeleton.keeps_full_text(relative_path, result.size):
+            transformer = get_transformer(relative_path)
+            summary = transformer(text) if transformer else None
+            if summary is not None:
+                stats.skeleton_files += 1
+                stats.skeleton_saved_bytes += len(text) - len(summary)
+                text = summary
+
+        yield relative_path, text
+
+    if stats.decode_dropped_bytes:
+        print(
+            f"[정보] UTF-8 디코딩 오류로 {stats.decode_error_files}개 파일에서 "
+            f"{stats.decode_dropped_bytes}바이트가 제외되었습니다."
+        )
+    if stats.noise_files:
+        print(
+            f"[정보] lockfile·생성 파일 등 {stats.noise_files}개를 요약으로 대체하여 "
+            f"약 {stats.noise_saved_bytes}바이트를 줄였습니다."
+        )
+    if stats.skeleton_files:
+        print(
+            f"[정보] skeleton 모드: {stats.skeleton_files}개 파일을 요약하여 "
+            f"약 {stats.skeleton_saved_bytes}자를 줄였습니다."
+        )
+
+
+def _read_summary(result: FileText | None) -> dict:
+    if result is None:
+        return {"skipped": 1}
+    return {"files": 1, "bytes": result.size, "cached": result.cached}
+
+
+def format_file_header(relative_path: str) -> FileHeader:
+    """컨텍스트 스트림에서 파일 하나의 시작을 나타내는 헤더."""
+    return FileHeader(f"\n\n{FILE_HEADER_PREFIX}{relative_path} =====\n\n", relative_path)
+
+
+def format_file_stream(
+    files: Iterable[tuple[str, str]], chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """(상대 경로, 내용) 스트림을 헤더와 chunk_size 단위 조각의 문자열 스트림으로 바꿉니다."""
+    for relative_path, text in files:
+        yield format_file_header(relative_path)
+        for start in range(0, len(text), chunk_size):
+            yield text[start:start + chunk_size]
+
+
+def collect_files(
+    root_dir: str,
+    skip_hidden: bool = True,
+    repo_ctx: git_utils.RepoContext | None = None,
+    jobs: int | None = None,
+    stats: CollectionStats | None = None,
+    cache: CollectionCache | None = None,
+    skeleton: SkeletonOptions | None = None,
+    dedupe: bool = False,
+    noise: NoiseFilter | None = None,
+    listing: git_utils.RepoListing | None = None,
+    snapshot: "TreeSnapshot | None" = None,
+) -> Iterator[tuple[str, str]]:
+    """
+    디렉터리 파일들을 (상대 경로, 내용) 단위로 반환합니다.
+    Git 저장소인 경우 .gitignore를 존중하고, 그렇지 않은 경우 모든 파일을 탐색합니다.
+    repo_ctx를 넘기면 git 루트를 다시 탐색하지 않고 그대로 사용합니다.
+    파일은 jobs개의 스레드로 미리 읽지만, 출력 순서는 항상 경로 순서를 따릅니다.
+    stats를 넘기면 읽은 파일 수, 바이트 수, 디코딩 오류로 버려진 바이트 수가 기록됩니다.
+    cache를 넘기면 이전 실행에서 변경되지 않은 파일은 디스크를 다시 읽지 않습니다.
+    skeleton을 넘기면 소스 파일을 시그니처 위주의 요약본으로 바꿉니다.
+    dedupe가 True이면 동일/유사 파일을 참조 한 줄이나 diff로 대체합니다.
+    noise를 넘기면 lockfile·minified·생성 파일을 크기만 담은 한 줄 요약으로 대체합니다.
+    listing을 넘기면 git 추적 파일 목록과 blob ID를 다시 조회하지 않습니다. (batch 모드)
+    snapshot을 넘기면 파일 목록과 내용을 디스크 대신 메모리에 보관한 값에서 가져옵니다. (감시 모드)
+    """
+    if repo_ctx is None:
+        repo_ctx = git_utils.resolve_repo_context(Path(root_dir))
+    if jobs is None:
+        jobs = DEFAULT_JOBS
+    if stats is None:
+        stats = CollectionStats()
+
+    if snapshot is not None:
+        entries = snapshot.entries()
+    elif repo_ctx.is_git:
+        entries = _iter_git_entries(repo_ctx, listing)
+    else:
+        entries = _iter_walk_entries(root_dir, skip_hidden)
+
+    reader: Callable[[str], FileText | None] = read_text_file
+    if snapshot is not None:
+        reader = snapshot.read
+        # 이미 메모리에 있으므로 캐시를 거치지 않는다.
+        cache = None
+    elif cache is not None:
+        blob_ids: dict[str, str] = {}
+        if repo_ctx.is_git:
+            git_root = str(repo_ctx.git_root)
+            if listing is not None and listing.covers(repo_ctx):
+                index_blob_ids = listing.blob_ids_under(repo_ctx)
+            else:
+                index_blob_ids = git_utils.get_index_blob_ids(repo_ctx)
+            blob_ids = {
+                os.path.join(git_root, path): blob
+                for path, blob in index_blob_ids.items()
+            }
+        reader = _cached_reader(cache, blob_ids)
+
+    if profiling.enabled():
+        # 파일 목록 조회/디렉터리 탐색과 파일 하나하나의 읽기(바이너리 판별, 디코딩 포함)를 따로 기록
+        entries = profiling.traced_iter("collect.walk", entries, cat="collect")
+        reader = profiling.traced_calls(
+            "collect.read_file", reader, cat="collect", summarize=_read_summary
+        )
+
+    records = _iter_entry_texts(entries, jobs, stats, reader, skeleton, noise)
+    if dedupe:
+        records = Deduplicator(stats.dedupe).process(records)
+    yield from profiling.traced_iter(
+        "collect.files",
+        records,
+        cat="collect",
+        summarize=lambda: {
+            "files": stats.files,
+            "bytes": stats.bytes_read,
+            "cache_hits": stats.cache_hits,
+        },
+    )
+
+    if cache is not None:
+        print(f"[정보] 수집 캐시 적중: {stats.cache_hits}/{stats.files}개 파일")
+        if cache.auto_prune:
+            cache.prune()
 
 
 def stream_all_files(
     root_dir: str,
     skip_hidden: bool = True,
+    repo_ctx: git_utils.RepoContext | None = None,
+    jobs: int | None = None,
+    stats: CollectionStats | None = None,
+    cache: CollectionCache | None = None,
+    skeleton: SkeletonOptions | None = None,
+    dedupe: bool = False,
+    noise: NoiseFilter | None = None,
+    listing: git_utils.RepoListing | None = None,
+    snapshot: "TreeSnapshot | None" = None,
     **kwargs, # 이전 버전 호환성을 위해 file_filter 등의 인자를 받음
 ) -> Iterator[str]:
     """
     디렉터리 파일 내용을 스트림으로 반환합니다.
-    Git 저장소인 경우 .gitignore를 존중하고, 그렇지 않은 경우 모든 파일을 탐색합니다.
+    collect_files의 결과를 `===== FILE: <경로> =====` 헤더와 함께 이어 붙인 형태입니다.
     """
-    CHUNK_SIZE = 16 * 1024
-    
-    # git_utils.find_git_root는 pathlib.Path 객체를 요구합니다.
-    from pathlib import Path
+    yield from format_file_stream(
+        collect_files(
+            root_dir,
+            skip_hidden,
+            repo_ctx,
+            jobs,
+            stats,
+            cache,
+            skeleton,
+            dedupe,
+            noise,
+            listing,
+            snapshot,
+        )
+    )
 
-    if git_utils.find_git_root(Path(root_dir)):
-        yield from _stream_files_from_git(root_dir, CHUNK_SIZE)
-    else:
-        yield from _stream_files_from_walk(root_dir, skip_hidden, CHUNK_SIZE)
+
+def collect_selected_files(
+    repo_ctx: git_utils.RepoContext,
+    repo_relative_paths: list[str],
+    jobs: int | None = None,
+    stats: CollectionStats | None = None,
+    skeleton: SkeletonOptions | None = None,
+    noise: NoiseFilter | None = None,
+) -> Iterator[tuple[str, str]]:
+    """
+    git 루트 기준 경로로 지정한 파일들만 collect_files와 같은 형식으로 반환합니다.
+    증분 모드에서 변경된 파일의 현재 내용을 보낼 때 사용합니다.
+    skeleton, noise는 collect_files와 같게 적용합니다.
+    """
+    entries = _repo_relative_entries(repo_ctx, repo_relative_paths)
+    yield from _iter_entry_texts(
+        entries,
+        jobs or DEFAULT_JOBS,
+        stats or CollectionStats(),
+        skeleton=skeleton,
+        noise=noise,
+    )
@@ -1,85 +1,328 @@
+import bisect
+import os
 import pathlib
+import shutil
 import subprocess
+from dataclasses import dataclass
+from typing import Iterable
+
+from . import profiling
 
 
 def run_cmd(cmd, cwd=None) -> subprocess.CompletedProcess:
-    return subprocess.run(
-        cmd,
-        cwd=cwd,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
+    profiling.count("subprocesses")
+    with profiling.span("git.subprocess", cat="git", command=" ".join(cmd[:3])):
+        return subprocess.run(
+            cmd,
+            cwd=cwd,
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+
+
+@dataclass(frozen=True)
+class RepoContext:
+    """
+    한 번의 실행 동안 공유되는 저장소 정보.
+    git 루트 탐색은 생성 시 한 번만 수행하고, 이후에는 이 객체를 전달해서 재사용한다.
+
+    :param package_dir: 분석 대상 패키지의 절대 경로
+    :param git_root: git 저장소 루트 (git 저장소가 아니면 None)
+    :param rel_path: git 루트 기준 패키지의 상대 경로 (git 저장소가 아니면 None)
+    :param git_available: PATH에 git 명령이 있는지 여부
+    """
+
+    package_dir: pathlib.Path
+    git_root: pathlib.Path | None
+    rel_path: pathlib.Path | None
+    git_available: bool
+
+    @property
+    def is_git(self) -> bool:
+        """git 명령으로 추적 파일을 조회할 수 있는 상태인지 여부."""
+        return self.git_root is not None and self.git_available
 
 
+def _has_git_entry(directory: pathlib.Path) -> bool:
+    """
+    directory 바로 아래에 `.git` 항목이 있는지 확인한다.
+    일반 저장소는 디렉터리, worktree/submodule은 `gitdir: ...`을 담은 파일이다.
+    """
+    entry = directory / ".git"
+    if entry.is_dir():
+        return (entry / "HEAD").exists()
+    if entry.is_file():
+        try:
+            with open(entry, "r", encoding="utf-8", errors="ignore") as f:
+                return f.read(8) == "gitdir: "
+        except OSError:
+            return False
+    return False
+
+
+@profiling.traced("git.find_git_root", cat="git")
 def find_git_root(start: pathlib.Path) -> pathlib.Path | None:
     """
     start 기준으로 상위 디렉터리를 올라가며 git 루트를 찾는다.
-    안전성을 위해 사용자의 홈 디렉터리까지만 탐색한다.
+    파일시스템에서 `.git` 항목을 먼저 찾고, 찾지 못한 경우에만
+    `git rev-parse --show-toplevel`을 한 번 실행한다. (GIT_DIR 등 환경변수로 지정된 경우)
+    안전성을 위해 `.git` 탐색은 사용자의 홈 디렉터리까지만 올라간다.
     """
     current = start.resolve()
     home = pathlib.Path.home()
 
     for parent in [current, *current.parents]:
-        # parent가 디렉터리가 아니면 건너뜀 (예: 잘못된 경로)
-        if not parent.is_dir():
-            continue
-
-        result = run_cmd(["git", "rev-parse", "--show-toplevel"], cwd=parent)
-        if result.returncode == 0:
-            return pathlib.Path(result.stdout.strip())
-
-        # 홈 디렉터리까지 탐색했으면 더 이상 올라가지 않고 종료
+        if _has_git_entry(parent):
+            return parent
+        # 홈 디렉터리까지 탐색했으면 더 이상 올라가지 않는다.
         if parent == home:
             break
+
+    if not current.is_dir() or shutil.which("git") is None:
+        return None
+    result = run_cmd(["git", "rev-parse", "--show-toplevel"], cwd=current)
+    if result.returncode == 0 and result.stdout.strip():
+        return pathlib.Path(result.stdout.strip()).resolve()
     return None
 
 
-def get_git_diff_for_path(path: pathlib.Path) -> str | None:
+def resolve_repo_context(package_dir: pathlib.Path) -> RepoContext:
+    """패키지 경로에 대한 RepoContext를 생성한다. git 루트 탐색은 여기서 한 번만 일어난다."""
+    package_dir = package_dir.resolve()
+    git_root = find_git_root(package_dir)
+    rel_path = package_dir.relative_to(git_root) if git_root else None
+    return RepoContext(
+        package_dir=package_dir,
+        git_root=git_root,
+        rel_path=rel_path,
+        git_available=shutil.which("git") is not None,
+    )
+
+
+def derive_repo_context(base: RepoContext, package_dir: pathlib.Path) -> RepoContext:
     """
-    특정 path에 대한 git diff가 있는지 확인하고, 있으면 diff 텍스트를 반환한다.
-    우선 staged(--cached), 없으면 워킹트리 diff를 본다.
+    이미 탐색한 저장소 안의 다른 패키지에 대한 RepoContext를 git 루트 재탐색 없이 만든다.
+    package_dir가 base의 저장소 밖에 있거나 중첩 저장소(서브모듈 등)이면 새로 탐색한다.
     """
-    git_root = find_git_root(path)
-    if git_root is None:
+    package_dir = package_dir.resolve()
+    if base.git_root is None:
+        return resolve_repo_context(package_dir)
+    try:
+        rel_path = package_dir.relative_to(base.git_root)
+    except ValueError:
+        return resolve_repo_context(package_dir)
+    for parent in [package_dir, *package_dir.parents]:
+        if parent == base.git_root:
+            break
+        if _has_git_entry(parent):
+            return resolve_repo_context(package_dir)
+    return RepoContext(
+        package_dir=package_dir,
+        git_root=base.git_root,
+        rel_path=rel_path,
+        git_available=base.git_available,
+    )
+
+
+def _package_path(repo_ctx: RepoContext) -> str:
+    return repo_ctx.rel_path.as_posix() if repo_ctx.rel_path else "."
+
+
+def _pathspec(repo_ctx: RepoContext) -> str:
+    # 패키지 경로에 *, ?, [ 등이 있어도 glob으로 해석하지 않도록 literal로 넘긴다.
+    return f":(literal){_package_path(repo_ctx)}"
+
+
+def _exclude_pathspecs(repo_ctx: RepoContext, exclude: Iterable[str]) -> list[str]:
+    """패키지 기준 상대 경로 목록을 git이 제외할 pathspec 목록으로 바꾼다."""
+    prefix = repo_ctx.rel_path.as_posix() + "/" if repo_ctx.rel_path.parts else ""
+    return [f":(exclude,literal){prefix}{path}" for path in exclude]
+
+
+def get_git_diff_for_path(
+    repo_ctx: RepoContext, base_ref: str | None = None, exclude: Iterable[str] = ()
+) -> str | None:
+    """
+    패키지 경로에 대한 git diff가 있는지 확인하고, 있으면 diff 텍스트를 반환한다.
+    base_ref가 주어지면 base_ref와 워킹트리의 diff를, 아니면 우선 staged(--cached),
+    없으면 워킹트리 diff를 본다. exclude의 파일(패키지 기준 상대 경로)은 diff에서 뺀다.
+    """
+    if not repo_ctx.is_git:
         return None
 
-    rel = path.resolve().relative_to(git_root)
+    rel = [_pathspec(repo_ctx), *_exclude_pathspecs(repo_ctx, exclude)]
+
+    if base_ref:
+        ranged = run_cmd(["git", "diff", base_ref, "--", *rel], cwd=repo_ctx.git_root)
+        if ranged.returncode != 0:
+            raise RuntimeError(f"git diff {base_ref} 실행 실패: {ranged.stderr.strip()}")
+        return ranged.stdout if ranged.stdout.strip() else None
 
     # 1) staged diff
-    cached = run_cmd(["git", "diff", "--cached", "--", str(rel)], cwd=git_root)
+    cached = run_cmd(["git", "diff", "--cached", "--", *rel], cwd=repo_ctx.git_root)
     if cached.returncode == 0 and cached.stdout.strip():
         return cached.stdout
 
     # 2) working tree diff
-    working = run_cmd(["git", "diff", "--", str(rel)], cwd=git_root)
+    working = run_cmd(["git", "diff", "--", *rel], cwd=repo_ctx.git_root)
     if working.returncode == 0 and working.stdout.strip():
         return working.stdout
 
     return None
 
 
-def get_tracked_files(root_dir: str) -> list[str]:
+def get_changed_files(
+    repo_ctx: RepoContext,
+    base_ref: str | None = None,
+    exclude: Iterable[str] = (),
+    include_deleted: bool = False,
+) -> list[str]:
     """
-    지정된 디렉터리에서 git이 추적하는 파일 및 무시되지 않는 파일 목록을 반환합니다.
+    get_git_diff_for_path와 같은 기준(base_ref, staged, 워킹트리 순)으로 변경된 파일 목록을 반환한다.
+    삭제된 파일은 현재 내용이 없으므로 include_deleted가 아니면 제외하고,
+    exclude의 파일(패키지 기준 상대 경로)도 뺀다.
 
-    :param root_dir: 검색을 시작할 git 저장소 내 디렉터리
-    :return: 절대 경로의 파일 목록
+    :return: git 루트 기준 상대 경로('/' 구분자)의 파일 목록
     """
-    git_root = find_git_root(pathlib.Path(root_dir))
-    if not git_root:
+    if not repo_ctx.is_git:
         return []
 
-    # git ls-files를 사용하여 staging 되는 파일들 가져옴
+    rel = [_pathspec(repo_ctx), *_exclude_pathspecs(repo_ctx, exclude)]
+    base = ["git", "diff", "-z", "--name-only"]
+    if not include_deleted:
+        base.append("--diff-filter=d")
+    candidates = [[base_ref]] if base_ref else [["--cached"], []]
+    for extra in candidates:
+        result = run_cmd([*base, *extra, "--", *rel], cwd=repo_ctx.git_root)
+        if result.returncode != 0:
+            continue
+        files = [f for f in result.stdout.split("\0") if f]
+        if files:
+            return files
+    return []
+
+
+@profiling.traced("git.get_tracked_files", cat="git", summarize=lambda files: {"files": len(files)})
+def get_tracked_files(repo_ctx: RepoContext) -> list[str]:
+    """
+    패키지 하위 경로에서 git이 추적하는 파일 및 무시되지 않는 파일 목록을 반환합니다.
+    모노레포에서도 저장소 전체가 아닌 package_path 하위만 조회하도록 pathspec으로 범위를 제한합니다.
+
+    :param repo_ctx: resolve_repo_context로 생성한 저장소 정보
+    :return: git 루트 기준 상대 경로('/' 구분자)의 파일 목록
+    """
+    if not repo_ctx.is_git:
+        return []
+
+    pathspec = _pathspec(repo_ctx)
+    # -z: 공백/개행/비ASCII 파일명도 인용 없이 NUL 구분으로 받음
     result = run_cmd(
-        ["git", "ls-files", "--cached", "--exclude-standard"], cwd=git_root
+        ["git", "ls-files", "-z", "--cached", "--exclude-standard", "--", pathspec],
+        cwd=repo_ctx.git_root,
     )
 
     if result.returncode != 0:
         print(f"[경고] git 추적 파일 목록을 가져오는 데 실패했습니다: {result.stderr}")
         return []
 
-    files = result.stdout.strip().split("\n")
-    # 상대 경로를 절대 경로로 변환
-    return [str(git_root.joinpath(f).resolve()) for f in files if f]
+    return [f for f in result.stdout.split("\0") if f]
+
+
+@profiling.traced("git.get_index_blob_ids", cat="git", summarize=lambda blobs: {"files": len(blobs)})
+def get_index_blob_ids(repo_ctx: RepoContext) -> dict[str, str]:
+    """
+    패키지 하위 추적 파일의 git 인덱스 blob ID를 반환합니다.
+    워킹트리에서 수정된 파일과 일반 파일이 아닌 항목(심볼릭 링크, 서브모듈)은
+    인덱스 blob이 실제 내용과 다르므로 제외합니다.
+
+    :param repo_ctx: resolve_repo_context로 생성한 저장소 정보
+    :return: {git 루트 기준 상대 경로: blob ID}
+    """
+    if not repo_ctx.is_git:
+        return {}
+
+    pathspec = _pathspec(repo_ctx)
+    staged = run_cmd(
+        ["git", "ls-files", "-z", "-s", "--", pathspec], cwd=repo_ctx.git_root
+    )
+    modified = run_cmd(
+        ["git", "ls-files", "-z", "-m", "--", pathspec], cwd=repo_ctx.git_root
+    )
+    if staged.returncode != 0 or modified.returncode != 0:
+        return {}
+
+    modified_paths = {f for f in modified.stdout.split("\0") if f}
+    blob_ids: dict[str, str] = {}
+    for record in staged.stdout.split("\0"):
+        if not record:
+            continue
+        # 형식: "<mode> <blob> <stage>\t<path>"
+        meta, _, path = record.partition("\t")
+        mode, blob, stage = meta.split(" ")
+        if mode not in ("100644", "100755") or stage != "0":
+            continue
+        if path in modified_paths:
+            continue
+        blob_ids[path] = blob
+    return blob_ids
+
+
+@dataclass
+class RepoListing:
+    """
+    여러 패키지의 추적 파일 목록과 인덱스 blob ID를 git 명령 한 번으로 조회해 나눠 쓰기 위한 목록.
+    모노레포에서 패키지마다 `git ls-files`를 반복 실행하지 않도록 batch 모드에서 사용한다.
+
+    :param git_root: 목록을 조회한 git 저장소 루트
+    :param tracked_files: git 루트 기준 상대 경로의 정렬된 목록
+    :param blob_ids: {git 루트 기준 상대 경로: blob ID}
+    """
+
+    git_root: pathlib.Path
+    tracked_files: list[str]
+    blob_ids: dict[str, str]
+
+    def covers(self, repo_ctx: RepoContext) -> bool:
+        return repo_ctx.is_git and repo_ctx.git_root == self.git_root
 
+    def files_under(self, repo_ctx: RepoContext) -> list[str]:
+        """repo_ctx 패키지 하위의 추적 파일 목록."""
+        if not repo_ctx.rel_path or not repo_ctx.rel_path.parts:
+            return list(self.tracked_files)
+        prefix = repo_ctx.rel_path.as_posix() + "/"
+        start = bisect.bisect_left(self.tracked_files, prefix)
+        end = bisect.bisect_left(self.tracked_files, prefix[:-1] + "0")  # '/' 다음 문자
+        return self.tracked_files[start:end]
+
+    def blob_ids_under(self, repo_ctx: RepoContext) -> dict[str, str]:
+        """repo_ctx 패키지 하위 추적 파일의 blob ID."""
+        return {
+            path: self.blob_ids[path]
+            for path in self.files_under(repo_ctx)
+            if path in self.blob_ids
+        }
+
+
+def list_repo_files(contexts: list[RepoContext]) -> RepoListing | None:
+    """
+    같은 저장소에 속한 패키지들의 추적 파일과 blob ID를 한 번에 조회한다.
+    contexts가 git 저장소가 아니거나 서로 다른 저장소에 걸쳐 있으면 None을 반환한다.
+    """
+    roots = {ctx.git_root for ctx in contexts}
+    if not contexts or len(roots) != 1 or not contexts[0].is_git:
+        return None
+
+    git_root = contexts[0].git_root
+    # 모든 패키지를 포함하는 가장 가까운 공통 상위 경로만 조회한다.
+    common = os.path.commonpath([_package_path(ctx) for ctx in contexts])
+    rel_path = pathlib.Path(common) if common not in ("", ".") else None
+    scope = RepoContext(
+        package_dir=git_root / common,
+        git_root=git_root,
+        rel_path=rel_path,
+        git_available=True,
+    )
+    tracked = sorted(get_tracked_files(scope))
+    blob_ids = get_index_blob_ids(scope)
+    return RepoListing(git_root=git_root, tracked_files=tracked, blob_ids=blob_ids)
@@ -0,0 +1,138 @@
+import os
+import re
+from dataclasses import dataclass
+from typing import Iterator
+
+from . import dir_text_collector, git_utils
+from .config import DEFAULT_README_NAME
+from .noise_filter import NoiseFilter, noise_stub
+
+# 변경분이 저장소 크기의 이 비율을 넘으면 증분 갱신 대신 전체 재생성
+DEFAULT_MAX_RATIO = 0.3
+
+
+@dataclass
+class IncrementalPlan:
+    """증분 갱신에 필요한 git diff와 변경된 파일 목록."""
+
+    diff: str
+    changed_files: list[str]  # git 루트 기준 상대 경로
+    changed_bytes: int
+    total_bytes: int
+
+
+def _sum_sizes(git_root: str, repo_relative_paths: list[str]) -> int:
+    total = 0
+    for path in repo_relative_paths:
+        try:
+            total += os.stat(os.path.join(git_root, path)).st_size
+        except OSError:
+            continue
+    return total
+
+
+def _noise_reasons(
+    repo_ctx: git_utils.RepoContext, repo_relative_paths: list[str], noise: NoiseFilter
+) -> dict[str, str]:
+    """
+    변경된 파일 중 노이즈로 판별된 파일의 git 루트 기준 경로와 그 이유를 반환한다.
+    삭제되었거나 바이너리인 파일은 내용 없이 이름만으로 판별한다.
+    """
+    git_root = str(repo_ctx.git_root)
+    prefix = repo_ctx.rel_path.as_posix() + "/" if repo_ctx.rel_path.parts else ""
+    reasons: dict[str, str] = {}
+    for repo_relative in repo_relative_paths:
+        content = dir_text_collector.read_text_file(os.path.join(git_root, repo_relative))
+        reason = noise.classify(repo_relative[len(prefix):], content.text if content else "")
+        if reason:
+            reasons[repo_relative] = reason
+    return reasons
+
+
+def _stub_noise_hunks(diff: str, reasons: dict[str, str]) -> str:
+    """노이즈 파일의 diff는 'diff --git' 줄만 남기고 변경 내용을 한 줄 요약으로 바꾼다."""
+    if not reasons:
+        return diff
+    sections = re.split(r"(?m)^(?=diff --git )", diff)
+    for i, section in enumerate(sections):
+        header, _, _ = section.partition("\n")
+        # 이름 변경이면 b/ 쪽이 현재 경로다. (특수 문자로 인용된 경로는 그대로 둔다)
+        reason = next(
+            (reason for path, reason in reasons.items() if header.endswith(f" b/{path}")), None
+        )
+        if reason and header.startswith("diff --git "):
+            sections[i] = header + "\n" + noise_stub(reason, len(section.encode("utf-8")))
+    return "".join(sections)
+
+
+def plan_incremental(
+    repo_ctx: git_utils.RepoContext,
+    base_ref: str | None = None,
+    max_ratio: float = DEFAULT_MAX_RATIO,
+    noise: NoiseFilter | None = None,
+) -> IncrementalPlan | None:
+    """
+    증분 갱신이 가능한지 판단하고 계획을 반환합니다.
+    git 저장소가 아니거나, 변경분(diff + 변경 파일 내용)이 추적 파일 전체 크기의
+    max_ratio를 넘으면 None을 반환하여 전체 재생성으로 돌아가게 합니다.
+    변경 사항이 전혀 없으면 diff가 빈 계획을 반환합니다.
+    noise를 넘기면 lockfile·생성 파일 등의 diff는 한 줄 요약으로 바꾸고, 변경분 크기에도 요약 크기만 더합니다.
+    """
+    if not repo_ctx.is_git:
+        print("[정보] Git 저장소가 아니므로 증분 갱신 대신 전체 README를 재생성합니다.")
+        return None
+
+    # 이전 실행이 다시 쓴 README.md는 변경분으로 보지 않는다. (기존 README는 따로 전달한다)
+    exclude = (DEFAULT_README_NAME,)
+    diff = git_utils.get_git_diff_for_path(repo_ctx, base_ref, exclude) or ""
+    if not diff.strip():
+        return IncrementalPlan(diff="", changed_files=[], changed_bytes=0, total_bytes=0)
+
+    git_root = str(repo_ctx.git_root)
+    changed_files = git_utils.get_changed_files(repo_ctx, base_ref, exclude, include_deleted=True)
+    reasons = _noise_reasons(repo_ctx, changed_files, noise) if noise else {}
+    diff = _stub_noise_hunks(diff, reasons)
+    # 삭제된 파일은 diff로만 전달한다.
+    changed_files = [path for path in changed_files if os.path.lexists(os.path.join(git_root, path))]
+    total_bytes = _sum_sizes(git_root, git_utils.get_tracked_files(repo_ctx))
+    # 노이즈 파일은 현재 내용 대신 한 줄 요약으로 전달되므로 크기에 넣지 않는다.
+    changed_bytes = len(diff.encode("utf-8")) + _sum_sizes(
+        git_root, [path for path in changed_files if path not in reasons]
+    )
+
+    if total_bytes and changed_bytes > total_bytes * max_ratio:
+        print(
+            f"[정보] 변경분({changed_bytes}바이트)이 저장소 크기({total_bytes}바이트)의 "
+            f"{max_ratio:.0%}를 넘어 전체 README를 재생성합니다."
+        )
+        return None
+
+    return IncrementalPlan(
+        diff=diff,
+        changed_files=changed_files,
+        changed_bytes=changed_bytes,
+        total_bytes=total_bytes,
+    )
+
+
+def stream_incremental_context(
+    repo_ctx: git_utils.RepoContext,
+    plan: IncrementalPlan,
+    jobs: int | None = None,
+    skeleton: dir_text_collector.SkeletonOptions | None = None,
+    noise: NoiseFilter | None = None,
+) -> Iterator[str]:
+    """
+    git diff와 변경된 파일들의 현재 내용을 컨텍스트 스트림으로 반환합니다.
+    변경된 파일에도 전체 수집과 같은 skeleton, noise 변환을 적용합니다.
+    """
+    print(
+        f"[정보] 증분 갱신: 변경된 파일 {len(plan.changed_files)}개와 diff만 전달합니다."
+    )
+    yield dir_text_collector.format_file_header("(git diff)")
+    yield plan.diff
+    yield from dir_text_collector.format_file_stream(
+        dir_text_collector.collect_selected_files(
+            repo_ctx, plan.changed_files, jobs=jobs, skeleton=skeleton, noise=noise
+        )
+    )
@@ -0,0 +1,191 @@
+import fnmatch
+import math
+import os
+from collections import Counter
+from pathlib import Path
+
+# 저장소별로 규칙을 덮어쓰는 파일 (gitignore 형식: `패턴`은 생략, `!패턴`은 항상 포함)
+OVERRIDE_FILE_NAME = ".gen-readme-ignore"
+
+LOCK_FILES = {
+    "poetry.lock",
+    "Pipfile.lock",
+    "uv.lock",
+    "pdm.lock",
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "bun.lockb",
+    "Cargo.lock",
+    "go.sum",
+    "composer.lock",
+    "Gemfile.lock",
+    "mix.lock",
+    "Podfile.lock",
+}
+GENERATED_SUFFIXES = (
+    "_pb2.py",
+    "_pb2_grpc.py",
+    "_pb2.pyi",
+    ".pb.go",
+    ".pb.cc",
+    ".pb.h",
+    ".min.js",
+    ".min.css",
+    ".map",
+    ".snap",
+)
+# 이 크기 이상이면 데이터 파일로 보고 생략하는 확장자
+_DATA_EXTENSIONS = {
+    ".svg": 8 * 1024,
+    ".csv": 16 * 1024,
+    ".tsv": 16 * 1024,
+    ".json": 64 * 1024,
+    ".xml": 64 * 1024,
+    ".geojson": 16 * 1024,
+    ".ipynb": 64 * 1024,
+}
+# 파일 첫 몇 줄에서 찾는 생성 파일 표식
+_GENERATED_MARKERS = (
+    "@generated",
+    "do not edit",
+    "code generated by",
+    "autogenerated",
+    "auto-generated",
+    "generated by the protocol buffer compiler",
+    "this file was automatically generated",
+)
+_HEADER_LINES = 5
+_HEADER_CHARS = 1024
+# 평균 줄 길이가 이보다 길면 minified 파일로 판단 (문단이 긴 문서 파일은 제외)
+MAX_AVERAGE_LINE_LENGTH = 300
+_PROSE_EXTENSIONS = {".md", ".rst", ".txt", ".adoc"}
+# 문자당 엔트로피가 이보다 높으면 base64 등 인코딩된 데이터로 판단
+# (한글 등 글자 종류가 많은 문서도 엔트로피가 높으므로 ASCII 내용에만 적용)
+MAX_ENTROPY_BITS = 5.7
+# 줄 길이/엔트로피 검사를 적용하는 최소 크기
+_HEURISTIC_MIN_CHARS = 4 * 1024
+_ENTROPY_SAMPLE_CHARS = 8 * 1024
+
+
+def _entropy(sample: str) -> float:
+    counts = Counter(sample)
+    total = len(sample)
+    return -sum(c / total * math.log2(c / total) for c in counts.values())
+
+
+def _matches(relative_path: str, pattern: str) -> bool:
+    """gitignore처럼 패턴 앞이나 중간에 '/'가 있으면 규칙 파일 위치 기준, 없으면 어느 깊이든 맞춘다."""
+    pattern = pattern.rstrip("/")
+    if "/" in pattern:
+        anchored = pattern.lstrip("/")
+        return fnmatch.fnmatch(relative_path, anchored) or fnmatch.fnmatch(relative_path, anchored + "/*")
+    name = os.path.basename(relative_path)
+    return (
+        fnmatch.fnmatch(relative_path, pattern)
+        or fnmatch.fnmatch(name, pattern)
+        or fnmatch.fnmatch(relative_path, pattern + "/*")
+        or fnmatch.fnmatch(relative_path, "*/" + pattern)
+        or fnmatch.fnmatch(relative_path, "*/" + pattern + "/*")
+    )
+
+
+class NoiseFilter:
+    """
+    lockfile, minified/생성 파일, 큰 데이터 파일처럼 README 작성에 도움이 되지 않는
+    파일을 판별한다. 판별된 파일은 크기만 담은 한 줄 요약으로 대체된다.
+
+    :param rules: (패턴, 포함 여부, 기준 접두사) 목록. 나중 규칙이 우선한다.
+        기준 접두사는 규칙 파일이 있는 디렉터리에서 본 패키지 경로('services/orders/' 등, 같으면 '')이며,
+        classify에 넘기는 패키지 기준 경로 앞에 붙여 규칙 파일 기준 경로로 맞춘다.
+    """
+
+    def __init__(self, rules: list[tuple[str, bool, str]] | None = None):
+        self.rules = rules or []
+
+    @classmethod
+    def from_directories(cls, *directories: Path | None, root: Path | None = None) -> "NoiseFilter":
+        """
+        각 디렉터리의 OVERRIDE_FILE_NAME을 순서대로 읽는다. (뒤쪽 디렉터리 규칙이 우선)
+        root는 classify에 넘길 경로의 기준(패키지) 디렉터리로, 기본값은 마지막 디렉터리다.
+        root의 상위가 아닌 디렉터리의 규칙은 적용할 수 없으므로 무시한다.
+        """
+        given = [Path(d).resolve() for d in directories if d is not None]
+        if not given:
+            return cls()
+        root = Path(root).resolve() if root is not None else given[-1]
+        rules: list[tuple[str, bool, str]] = []
+        seen = set()
+        for directory in given:
+            if directory in seen:
+                continue
+            seen.add(directory)
+            override = directory / OVERRIDE_FILE_NAME
+            if not override.is_file():
+                continue
+            try:
+                prefix = root.relative_to(directory).as_posix()
+            except ValueError:
+                continue
+            prefix = "" if prefix == "." else prefix + "/"
+            try:
+                lines = override.read_text(encoding="utf-8").splitlines()
+            except OSError as e:
+                print(f"[경고] {override}를 읽지 못했습니다: {e}")
+                continue
+            for line in lines:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("!"):
+                    rules.append((line[1:], True, prefix))
+                else:
+                    rules.append((line, False, prefix))
+        return cls(rules)
+
+    def _override(self, relative_path: str) -> bool | None:
+        decision = None
+        for pattern, include, prefix in self.rules:
+            if _matches(prefix + relative_path, pattern):
+                decision = include
+        return decision
+
+    def classify(self, relative_path: str, text: str) -> str | None:
+        """노이즈 파일이면 이유를, 아니면 None을 반환한다."""
+        override = self._override(relative_path)
+        if override is True:
+            return None
+        if override is False:
+            return f"{OVERRIDE_FILE_NAME} 규칙"
+
+        name = os.path.basename(relative_path)
+        if name in LOCK_FILES:
+            return "lockfile"
+        if name.endswith(GENERATED_SUFFIXES):
+            return "생성/minified 파일"
+
+        ext = os.path.splitext(name)[1].lower()
+        limit = _DATA_EXTENSIONS.get(ext)
+        if limit is not None and len(text) >= limit:
+            return "대용량 데이터 파일"
+
+        header = "\n".join(text[:_HEADER_CHARS].splitlines()[:_HEADER_LINES]).lower()
+        if any(marker in header for marker in _GENERATED_MARKERS):
+            return "생성 파일"
+
+        if len(text) >= _HEURISTIC_MIN_CHARS:
+            if (
+                ext not in _PROSE_EXTENSIONS
+                and len(text) / (text.count("\n") + 1) > MAX_AVERAGE_LINE_LENGTH
+            ):
+                return "minified 파일"
+            sample = text[:_ENTROPY_SAMPLE_CHARS]
+            if sample.isascii() and _entropy(sample) > MAX_ENTROPY_BITS:
+                return "인코딩된 데이터"
+        return None
+
+
+def noise_stub(reason: str, size: int) -> str:
+    """노이즈 파일 대신 전달할 한 줄 요약."""
+    return f"(생략됨: {reason}, {size:,} bytes)\n"
@@ -0,0 +1,294 @@
+import contextlib
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+# 실행 중인 프로파일러. --profile을 지정하지 않으면 None이며, 이때 계측 함수들은
+# 전역 변수 하나만 확인하고 원래 함수/이터레이터를 그대로 사용한다.
+_active: "Profiler | None" = None
+_async_ids = itertools.count(1)
+
+
+def enabled() -> bool:
+    return _active is not None
+
+
+class _NullSpan:
+    """프로파일링이 꺼져 있을 때 사용하는 아무 일도 하지 않는 구간."""
+
+    def set(self, **args) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """with 블록 하나를 Chrome trace의 구간 이벤트로 기록한다. set으로 인자를 덧붙일 수 있다."""
+
+    def __init__(self, profiler: "Profiler", name: str, cat: str, async_id: int | None, args: dict):
+        self.profiler = profiler
+        self.name = name
+        self.cat = cat
+        self.async_id = async_id
+        self.args = args
+        self._start = 0
+
+    def set(self, **args) -> None:
+        self.args.update(args)
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.profiler.record(
+            self.name, self.cat, self._start, time.perf_counter_ns(), self.args, self.async_id
+        )
+        return False
+
+
+class _Aggregate:
+    """요약 표의 한 행: 같은 이름의 구간을 모두 합친 값."""
+
+    __slots__ = ("calls", "total_ns", "max_ns", "files", "bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.files = 0
+        self.bytes = 0
+
+
+class Profiler:
+    """
+    실행 중 각 단계의 소요 시간과 바이트 수, 파일 수, 하위 프로세스 수를 모은다.
+    결과는 Chrome trace-event 형식(chrome://tracing, Perfetto에서 열 수 있음)으로 저장하고,
+    단계별 합계를 표로 출력한다.
+    """
+
+    def __init__(self):
+        self.events: list[dict] = []
+        self.counters: dict[str, int] = {}
+        self._aggregates: dict[str, _Aggregate] = {}
+        self._threads: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    def _ts(self, ns: int) -> float:
+        return (ns - self._origin) / 1000
+
+    def record(
+        self,
+        name: str,
+        cat: str,
+        start_ns: int,
+        end_ns: int,
+        args: dict | None = None,
+        async_id: int | None = None,
+    ) -> None:
+        args = args or {}
+        thread = threading.current_thread()
+        base = {"name": name, "cat": cat, "pid": self._pid, "tid": thread.ident}
+        if async_id is None:
+            events = [{**base, "ph": "X", "ts": self._ts(start_ns), "dur": (end_ns - start_ns) / 1000, "args": args}]
+        else:
+            # 이벤트 루프에서 동시에 진행되는 구간(LLM 대화 등)은 서로 겹칠 수 있으므로 비동기 이벤트로 남긴다.
+            events = [
+                {**base, "ph": "b", "id": async_id, "ts": self._ts(start_ns), "args": args},
+                {**base, "ph": "e", "id": async_id, "ts": self._ts(end_ns)},
+            ]
+        duration = end_ns - start_ns
+        with self._lock:
+            self.events.extend(events)
+            self._threads.setdefault(thread.ident, thread.name)
+            aggregate = self._aggregates.get(name)
+            if aggregate is None:
+                aggregate = self._aggregates[name] = _Aggregate()
+            aggregate.calls += 1
+            aggregate.total_ns += duration
+            aggregate.max_ns = max(aggregate.max_ns, duration)
+            aggregate.files += args.get("files", 0)
+            aggregate.bytes += args.get("bytes", 0)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """누적 카운터(하위 프로세스 수 등)를 늘리고 trace에 카운터 이벤트를 남긴다."""
+        with self._lock:
+            value = self.counters.get(name, 0) + amount
+            self.counters[name] = value
+            self.events.append(
+                {
+                    "name": name,
+                    "ph": "C",
+                    "pid": self._pid,
+                    "ts": self._ts(time.perf_counter_ns()),
+                    "args": {name: value},
+                }
+            )
+
+    def trace(self) -> dict:
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self._threads.items()
+        ]
+        return {
+            "traceEvents": metadata + self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"counters": dict(self.counters)},
+        }
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.trace(), f, ensure_ascii=False)
+
+    def print_summary(self, stream: TextIO | None = None) -> None:
+        """단계별 호출 수, 합계/최대 시간, 파일 수, 바이트 수를 표로 출력한다."""
+        stream = stream or sys.stderr
+        rows = sorted(self._aggregates.items(), key=lambda item: item[1].total_ns, reverse=True)
+        width = max([len("phase")] + [len(name) for name, _ in rows])
+        print("[정보] 프로파일 요약 (여러 스레드에서 실행되거나 다른 단계를 포함하는 단계는 시간이 겹칠 수 있음)", file=stream)
+        print(
+            f"  {'phase':<{width}} {'calls':>7} {'total_ms':>11} {'max_ms':>10} {'files':>9} {'bytes':>14}",
+            file=stream,
+        )
+        for name, row in rows:
+            print(
+                f"  {name:<{width}} {row.calls:>7,} {row.total_ns / 1e6:>11.1f} {row.max_ns / 1e6:>10.1f} "
+                f"{row.files or '':>9} {row.bytes or '':>14}",
+                file=stream,
+            )
+        for name, value in sorted(self.counters.items()):
+            print(f"  {name}: {value:,}", file=stream)
+
+
+def span(name: str, cat: str = "gen-readme", concurrent: bool = False, **args: Any):
+    """
+    구간을 측정하는 컨텍스트 관리자. 프로파일링이 꺼져 있으면 공유된 빈 객체를 반환한다.
+    concurrent이면 같은 스레드의 다른 구간과 겹칠 수 있는 비동기 구간(asyncio 작업 등)으로 기록한다.
+    """
+    profiler = _active
+    if profiler is None:
+        return _NULL_SPAN
+    return _Span(profiler, name, cat, next(_async_ids) if concurrent else None, args)
+
+
+def count(name: str, amount: int = 1) -> None:
+    profiler = _active
+    if profiler is not None:
+        profiler.count(name, amount)
+
+
+def traced(
+    name: str,
+    cat: str = "gen-readme",
+    summarize: Callable[[Any], dict] | None = None,
+):
+    """
+    함수 호출 하나를 구간으로 기록하는 데코레이터.
+    summarize를 주면 반환값에서 파일 수, 바이트 수 등 구간 인자를 만든다.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            with _Span(profiler, name, cat, None, {}) as s:
+                result = func(*args, **kwargs)
+                if summarize is not None:
+                    s.set(**summarize(result))
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def traced_calls(name: str, func: Callable, cat: str = "gen-readme", summarize=None) -> Callable:
+    """
+    함수를 호출마다 구간을 남기는 함수로 감싼다. (스레드 풀 작업 등)
+    프로파일링이 꺼져 있으면 func를 그대로 반환한다.
+    """
+    if _active is None:
+        return func
+    return traced(name, cat, summarize)(func)
+
+
+def traced_iter(
+    name: str,
+    iterable: Iterable,
+    cat: str = "gen-readme",
+    summarize: Callable[[], dict] | None = None,
+) -> Iterator:
+    """
+    이터레이터를 소비하는 동안 next() 안에서 보낸 시간만 모아 구간 하나로 기록한다.
+    (소비자가 중간에 하는 일은 포함하지 않는다.) summarize는 소비가 끝난 뒤 구간 인자를 만든다.
+    프로파일링이 꺼져 있으면 iterable을 그대로 반환한다.
+    """
+    profiler = _active
+    if profiler is None:
+        return iterable
+    return _traced_iter(profiler, name, cat, iter(iterable), summarize)
+
+
+def _traced_iter(profiler: Profiler, name: str, cat: str, iterator: Iterator, summarize) -> Iterator:
+    busy = 0
+    items = 0
+    first = time.perf_counter_ns()
+    try:
+        while True:
+            start = time.perf_counter_ns()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                busy += time.perf_counter_ns() - start
+                break
+            busy += time.perf_counter_ns() - start
+            items += 1
+            yield item
+    finally:
+        args = {"items": items, "wall_ms": round((time.perf_counter_ns() - first) / 1e6, 3)}
+        if summarize is not None:
+            args.update(summarize())
+        # 구간 길이는 실제로 이터레이터 안에서 보낸 시간, 시작 시각은 처음 소비한 시각
+        profiler.record(name, cat, first, first + busy, args)
+
+
+@contextlib.contextmanager
+def session(path: str | None):
+    """
+    path가 주어지면 블록 동안 프로파일링을 켜고, 끝나면 trace를 저장하고 요약을 출력한다.
+    path가 None이면 아무 일도 하지 않는다.
+    """
+    global _active
+    if not path:
+        yield None
+        return
+    profiler = _active = Profiler()
+    try:
+        with span("run", cat="run"):
+            yield profiler
+    finally:
+        _active = None
+        profiler.print_summary()
+        try:
+            profiler.write(path)
+            print(f"[정보] 프로파일을 저장했습니다: {path} (chrome://tracing 또는 Perfetto에서 열 수 있습니다)", file=sys.stderr)
+        except OSError as e:
+            print(f"[경고] 프로파일을 저장하지 못했습니다: {e}", file=sys.stderr)
@@ -26,6 +26,7 @@ class GeminiPromptBuilder:
         situation: str,
         objective: str,
         file_path_str: str,
+        output_format: str | None = None,
     ) -> str:
         """프롬프트의 각 부분을 한 줄로 합쳐 최종 프롬프트를 생성한다."""
     
@@ -33,7 +34,7 @@ class GeminiPromptBuilder:
         situation_cleaned = ' '.join(situation.split())
         objective_cleaned = ' '.join(objective.split())
         request_cleaned = ' '.join(request.split()) if request else "별도의 추가 요청 없음"
-        output_format_cleaned = ' '.join(self._OUTPUT_FORMAT.split())
+        output_format_cleaned = ' '.join((output_format or self._OUTPUT_FORMAT).split())
 
         parts = [
             f"역할: {role_cleaned}",
@@ -89,4 +90,128 @@ class GeminiPromptBuilder:
             situation=situation,
             objective=objective,
             file_path_str=file_path_str,
-        )
\ No newline at end of file
+        )
+
+    def build_prompt_incremental(
+        self, file_paths: List[str], request: str | None
+    ) -> str:
+        """기존 README.md를 코드 변경분(diff)만으로 갱신하기 위한 프롬프트를 구성합니다."""
+        file_path_str = " , ".join([f"@{p}" for p in file_paths])
+
+        situation = textwrap.dedent("""
+            - 이 프로젝트에는 이미 README.md 파일이 존재한다.
+            - 아래 "분석 대상 코드 경로" 목록에는 전체 코드가 아니라 기존 README 내용, 마지막 변경분의 git diff, 변경된 파일들의 현재 내용만 포함되어 있다.
+            """).strip()
+        objective = textwrap.dedent("""
+            - git diff와 변경된 파일 내용을 분석하여, 기존 README에서 이번 변경의 영향을 받는 부분만 수정하거나 보충하라.
+            - 변경과 관계없는 기존 내용과 구조는 그대로 유지하고, 수정이 반영된 README.md 전체를 출력하라.
+            """).strip()
+
+        return self._build_base_prompt(
+            request=request,
+            situation=situation,
+            objective=objective,
+            file_path_str=file_path_str,
+        )
+
+    def build_prompt_outline(
+        self, file_paths: List[str], request: str | None, updating: bool = False
+    ) -> str:
+        """섹션별로 나누어 병렬 생성할 README의 목차(섹션 구성)만 정하기 위한 프롬프트를 구성합니다."""
+        file_path_str = " , ".join([f"@{p}" for p in file_paths])
+
+        situation = textwrap.dedent("""
+            - README.md를 섹션별로 나누어 여러 작성자가 동시에 작성한 뒤 목차 순서대로 합칠 예정이다.
+            - 아래 "분석 대상 코드 경로"에는 전체 파일 목록과 패키지 메타데이터, 진입점, 문서 등 핵심 파일만 포함되어 있다.
+            """).strip()
+        if updating:
+            situation += " - 기존 README 내용도 포함되어 있으니, 유용한 기존 섹션 구성은 유지하라."
+        objective = textwrap.dedent("""
+            - README.md 본문은 작성하지 말고, 이 프로젝트에 맞는 README의 목차만 정하라.
+            - 섹션은 서로 내용이 겹치지 않도록 3~8개로 나누고, 각 섹션 작성에 특히 필요한 파일이 있으면 함께 적어라.
+            """).strip()
+        output_format = textwrap.dedent("""
+            출력 형식: 다른 대화나 서두 없이 아래 형식의 마크다운만 출력해라.
+            첫 줄은 "# 프로젝트 제목", 이어서 섹션마다 "## 섹션 제목" 줄, 그 아래 한 줄 설명,
+            필요하면 "파일: 경로1, 경로2" 줄(파일 목록에 있는 경로 또는 glob 패턴)을 쓴다. 제목과 설명은 한국어로 작성해야 한다.
+            """).strip()
+
+        return self._build_base_prompt(
+            request=request,
+            situation=situation,
+            objective=objective,
+            file_path_str=file_path_str,
+            output_format=output_format,
+        )
+
+    def build_prompt_summary(
+        self, file_paths: List[str], request: str | None, scope: str, merge: bool = False
+    ) -> str:
+        """
+        저장소가 커서 한 번에 담을 수 없을 때, scope(디렉터리나 파일 묶음)의 요약을 작성하기 위한 프롬프트를 구성합니다.
+        merge가 True이면 하위 요약들을 하나로 합칩니다.
+        """
+        file_path_str = " , ".join([f"@{p}" for p in file_paths])
+
+        situation = textwrap.dedent("""
+            - 저장소가 커서 README.md를 한 번에 작성할 수 없어, 디렉터리별로 요약한 뒤 요약들을 모아 README를 작성할 예정이다.
+            - 너는 README가 아니라 README 작성자가 참고할 요약을 작성한다.
+            """).strip()
+        if merge:
+            objective = textwrap.dedent(f"""
+                - 아래 "분석 대상 코드 경로"에는 "{scope}" 하위 디렉터리와 파일 묶음의 요약들이 포함되어 있다.
+                - 요약들을 "{scope}" 전체의 요약 하나로 합쳐라. 겹치는 내용은 합치고, 모듈/클래스/함수/명령/설정 이름과 경로는 그대로 유지하라.
+                """).strip()
+        else:
+            objective = textwrap.dedent(f"""
+                - 아래 "분석 대상 코드 경로"에는 "{scope}"의 파일들이 포함되어 있다.
+                - README 작성에 필요한 정보(역할, 주요 모듈/클래스/함수와 공개 인터페이스, 실행 방법과 명령, 설정, 다른 디렉터리와의 관계)를 요약하라.
+                - 모듈/클래스/함수/명령/설정 이름과 파일 경로는 그대로 적어라.
+                """).strip()
+        output_format = textwrap.dedent(f"""
+            출력 형식: 다른 대화나 서두 없이, "## {scope}" 제목으로 시작하는 마크다운 요약만 출력해라.
+            하위 제목이 필요하면 "###" 이하를 사용하고, 약 500단어 이내로 작성해라. 내용은 한국어로 작성해야 한다.
+            """).strip()
+
+        return self._build_base_prompt(
+            request=request,
+            situation=situation,
+            objective=objective,
+            file_path_str=file_path_str,
+            output_format=output_format,
+        )
+
+    def build_prompt_section(
+        self,
+        file_paths: List[str],
+        request: str | None,
+        title: str,
+        description: str,
+        outline: List[str],
+    ) -> str:
+        """README의 섹션 하나만 작성하기 위한 프롬프트를 구성합니다. outline은 전체 섹션 제목 목록입니다."""
+        file_path_str = " , ".join([f"@{p}" for p in file_paths])
+        others = ", ".join(f'"{t}"' for t in outline if t != title) or "없음"
+
+        situation = textwrap.dedent(f"""
+            - README.md를 섹션별로 나누어 동시에 작성한 뒤 목차 순서대로 합칠 예정이며, 너는 "{title}" 섹션만 담당한다.
+            - 다른 섹션({others})은 다른 작성자가 쓴다.
+            - 아래 "분석 대상 코드 경로"에는 전체 파일 목록과 이 섹션에 관련된 파일만 포함되어 있다.
+              README 템플릿이나 기존 README의 해당 섹션이 있으면 함께 포함되어 있다.
+            """).strip()
+        objective = textwrap.dedent(f"""
+            - "{title}" 섹션의 내용만 작성하라. 섹션 설명: {description or "없음"}
+            - 다른 섹션이 다룰 내용은 반복하지 말고, 프로젝트 전체 소개나 목차도 쓰지 마라.
+            """).strip()
+        output_format = textwrap.dedent(f"""
+            출력 형식: 다른 대화나 서두 없이, "## {title}" 제목으로 시작하는 이 섹션의 마크다운만 출력해라.
+            하위 제목이 필요하면 "###" 이하를 사용해라. 어떠한 추가 설명이나 대화 내용도 포함하지 마라. 내용은 한국어로 작성해야 한다.
+            """).strip()
+
+        return self._build_base_prompt(
+            request=request,
+            situation=situation,
+            objective=objective,
+            file_path_str=file_path_str,
+            output_format=output_format,
+        )
@@ -1,21 +1,89 @@
-from .base import ReadmeProvider
-from .gemini.gemini import GeminiReadmeProvider
+import importlib
+import sys
+
+from .base import LLMCallStats, ReadmeProvider
+
+__all__ = [
+    "ENTRY_POINT_GROUP",
+    "LLMCallStats",
+    "PROVIDERS",
+    "ReadmeProvider",
+    "get_provider",
+    "load_provider_class",
+]
 
 # 사용 가능한 제공자들을 매핑합니다.
-# 새로운 제공자를 추가하려면 여기에 추가하세요.
-# 키는 CLI에서 사용할 이름 (소문자), 값은 제공자 클래스입니다.
-PROVIDERS = {
-    "gemini": GeminiReadmeProvider,
-    # 예: "openai": OpenaiReadmeProvider,
+# 키는 CLI에서 사용할 이름 (소문자), 값은 "모듈 경로:클래스 이름" 문자열 또는 제공자 클래스입니다.
+# 문자열로 등록한 제공자는 실제로 선택되었을 때만 import하므로 CLI 시작 시간에 영향을 주지 않습니다.
+# 별도 패키지의 제공자는 이 표를 수정하지 않고 ENTRY_POINT_GROUP 진입점으로 등록하거나,
+# -p에 "모듈 경로:클래스 이름"을 직접 지정해 사용할 수 있습니다.
+PROVIDERS: dict[str, str | type[ReadmeProvider]] = {
+    "gemini": "gen_readme.providers.gemini.gemini:GeminiReadmeProvider",
+    "openai": "gen_readme.providers.openai_compat.openai_compat:OpenaiCompatReadmeProvider",
 }
+# pyproject.toml 예: [project.entry-points."gen_readme.providers"] mine = "my_pkg.provider:MyProvider"
+ENTRY_POINT_GROUP = "gen_readme.providers"
+# 일부 제공자만 받는 옵션. 공통 옵션(turn_timeout 등)과 달리 제공자마다 걸러서 전달한다.
+PROVIDER_SPECIFIC_OPTIONS = ("api_base", "model")
+
+
+def _entry_point_target(name: str) -> str | None:
+    # importlib.metadata는 설치된 배포판 메타데이터를 모두 훑으므로 내장 제공자가 아닐 때만 조회한다.
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name.lower() == name:
+            return entry_point.value
+    return None
+
 
+def _import_target(target: str) -> object:
+    module_name, _, attribute = target.partition(":")
+    if not attribute:
+        raise ValueError(f"제공자는 '모듈 경로:클래스 이름' 형식이어야 합니다: {target}")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        raise RuntimeError(f"제공자 모듈을 불러오지 못했습니다 ({target}): {e}") from e
+    try:
+        return getattr(module, attribute)
+    except AttributeError:
+        raise ValueError(f"제공자 모듈에 {attribute}가 없습니다: {target}") from None
 
-def get_provider(name: str) -> ReadmeProvider:
+
+def load_provider_class(name: str) -> type[ReadmeProvider]:
     """
-    지정된 이름의 README 제공자 인스턴스를 반환합니다.
+    제공자 이름을 클래스로 바꾼다. 내장 표(PROVIDERS), 진입점(ENTRY_POINT_GROUP),
+    "모듈 경로:클래스 이름" 순으로 찾고, 찾은 모듈은 이때 처음 import한다.
     """
-    provider_class = PROVIDERS.get(name.lower())
-    if not provider_class:
+    key = name.lower()
+    target = PROVIDERS.get(key)
+    if target is None and ":" in name:
+        target = name
+    if target is None:
+        target = _entry_point_target(key)
+    if target is None:
         raise ValueError(f"알 수 없는 제공자입니다: {name}")
-    return provider_class()
+    provider_class = _import_target(target) if isinstance(target, str) else target
+    if not (isinstance(provider_class, type) and issubclass(provider_class, ReadmeProvider)):
+        raise ValueError(f"{name}은(는) ReadmeProvider를 상속한 클래스가 아닙니다.")
+    if key in PROVIDERS:
+        PROVIDERS[key] = provider_class
+    return provider_class
+
 
+def get_provider(name: str, **options) -> ReadmeProvider:
+    """
+    지정된 이름의 README 제공자 인스턴스를 반환합니다.
+    options(turn_timeout, total_timeout 등)는 제공자 생성자에 그대로 전달되며,
+    제공자가 option_names로 선언하지 않은 전용 옵션(api_base, model)은 값이 있으면 경고 후 무시합니다.
+    """
+    provider_class = load_provider_class(name)
+    accepted = {}
+    for key, value in options.items():
+        if key in PROVIDER_SPECIFIC_OPTIONS and key not in provider_class.option_names:
+            if value is not None:
+                print(f"[경고] {name} 제공자는 --{key.replace('_', '-')} 옵션을 사용하지 않습니다.", file=sys.stderr)
+            continue
+        accepted[key] = value
+    return provider_class(**accepted)
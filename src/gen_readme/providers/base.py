@@ -1,13 +1,46 @@
+import copy
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import List
 
+from ..readme_output import ReadmeOutput
+from ..readme_validator import ReadmeValidator, get_validator
+
+# LLM 호출 한 번(턴)과 대화 전체의 기본 제한 시간 (초)
+DEFAULT_TURN_TIMEOUT = 600.0
+DEFAULT_TOTAL_TIMEOUT = 1800.0
+
+
+@dataclass
+class LLMCallStats:
+    """LLM 호출 한 번의 측정값. 제공자가 호출 중에 채운다."""
+
+    turns: int = 0  # 실행한 대화 턴 수 (턴마다 LLM 왕복이 한 번씩 일어난다)
+
 
 class ReadmeProvider(ABC):
     """
     모든 README 생성 제공자가 상속해야 하는 추상 기본 클래스.
+
+    :param turn_timeout: LLM 호출 한 번(대화 턴)의 제한 시간(초). None이면 제한 없음
+    :param total_timeout: 대화 전체의 제한 시간(초). None이면 제한 없음
+    :param validator: 응답이 최종 README로 쓸 만한지 판단하는 검증기. None이면 기본 검증기
     """
 
+    # 공통 옵션 외에 생성자가 받는 제공자 전용 옵션 이름 (예: api_base, model)
+    option_names: tuple[str, ...] = ()
+    # 한 번의 대화에 담을 수 있는 컨텍스트 크기(토큰). 수집한 컨텍스트가 이보다 크면 디렉터리별로 요약한다.
+    context_window_tokens: int = 128_000
 
+    def __init__(
+        self,
+        turn_timeout: float | None = DEFAULT_TURN_TIMEOUT,
+        total_timeout: float | None = DEFAULT_TOTAL_TIMEOUT,
+        validator: ReadmeValidator | None = None,
+    ):
+        self.turn_timeout = turn_timeout
+        self.total_timeout = total_timeout
+        self.validator = validator or get_validator()
 
     @abstractmethod
     def build_prompt_new(
@@ -24,6 +57,78 @@ class ReadmeProvider(ABC):
         pass
 
     @abstractmethod
-    def call_llm(self, prompt: str) -> str:
-        """LLM을 호출하여 결과를 반환한다."""
+    def build_prompt_incremental(
+        self, file_paths: List[str], request: str | None
+    ) -> str:
+        """기존 README.md를 코드 변경분만으로 갱신하기 위한 프롬프트를 구성한다."""
+        pass
+
+    def build_prompt_outline(
+        self, file_paths: List[str], request: str | None, updating: bool = False
+    ) -> str:
+        """
+        섹션 병렬 생성(--parallel-sections)에 쓸 README 목차만 정하는 프롬프트를 구성한다.
+        지원하지 않는 제공자는 재정의하지 않아도 되며, 이때 섹션 병렬 생성을 사용할 수 없다.
+        """
+        raise RuntimeError(f"{type(self).__name__} 제공자는 섹션 병렬 생성을 지원하지 않습니다.")
+
+    def build_prompt_section(
+        self,
+        file_paths: List[str],
+        request: str | None,
+        title: str,
+        description: str,
+        outline: List[str],
+    ) -> str:
+        """README의 섹션 하나만 작성하는 프롬프트를 구성한다. outline은 전체 섹션 제목 목록이다."""
+        raise RuntimeError(f"{type(self).__name__} 제공자는 섹션 병렬 생성을 지원하지 않습니다.")
+
+    def build_prompt_summary(
+        self, file_paths: List[str], request: str | None, scope: str, merge: bool = False
+    ) -> str:
+        """
+        큰 저장소를 디렉터리별로 요약할 때 scope의 요약을 작성하는 프롬프트를 구성한다. merge이면 하위 요약들을 합친다.
+        지원하지 않는 제공자는 재정의하지 않아도 되며, 이때 컨텍스트를 요약할 수 없다.
+        """
+        raise RuntimeError(f"{type(self).__name__} 제공자는 디렉터리 요약을 지원하지 않습니다.")
+
+    def with_validator(self, validator: ReadmeValidator) -> "ReadmeProvider":
+        """
+        응답 검증기만 바꾼 사본을 반환한다. (README 전체가 아닌 목차나 섹션 하나를 받는 호출용)
+        나머지 상태(설정, 연결 등)는 원본과 공유한다.
+        """
+        clone = copy.copy(self)
+        clone.validator = validator
+        return clone
+
+    @abstractmethod
+    def call_llm(
+        self,
+        prompt: str,
+        context_dirs: List[str] | None = None,
+        output: ReadmeOutput | None = None,
+        stats: LLMCallStats | None = None,
+    ) -> str:
+        """
+        LLM을 호출하여 결과를 반환한다.
+        context_dirs는 프롬프트가 참조하는 컨텍스트 파일들이 들어 있는 디렉터리 목록이다.
+        스트리밍을 지원하는 제공자는 README 조각이 도착하는 대로 output.write로 전달한다.
+        (지원하지 않으면 무시해도 되며, 최종 결과는 호출자가 output.commit으로 확정한다.)
+        stats를 넘기면 대화 턴 수 등의 측정값을 기록한다.
+        """
         pass
+
+    async def call_llm_async(
+        self,
+        prompt: str,
+        context_dirs: List[str] | None = None,
+        output: ReadmeOutput | None = None,
+        stats: LLMCallStats | None = None,
+    ) -> str:
+        """
+        call_llm의 awaitable 버전. 하나의 이벤트 루프에서 여러 대화를 동시에 실행할 때 사용한다.
+        기본 구현은 call_llm을 스레드에서 실행하며, 비동기 호출을 지원하는 제공자는 재정의한다.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.call_llm, prompt, context_dirs, output, stats)
@@ -0,0 +1,70 @@
+import time
+
+from ..readme_output import ReadmeOutput
+
+# 첫 턴을 포함한 최대 대화 턴 수
+MAX_CONVERSATION_TURNS = 5
+FINAL_MARKDOWN_COMMAND = (
+    "지금까지의 지시와 대화를 바탕으로, 다른 대화나 추가 설명 없이, "
+    "오직 README.md 파일의 최종 마크다운 내용만 출력해줘. 이것이 최종 결과물이다."
+)
+
+
+class Deadline:
+    """대화 전체 제한 시간 안에서 턴마다 사용할 수 있는 시간을 계산한다."""
+
+    def __init__(self, turn_timeout: float | None, total_timeout: float | None):
+        self.turn_timeout = turn_timeout
+        self.total_timeout = total_timeout
+        self._end = time.monotonic() + total_timeout if total_timeout else None
+
+    def next_turn(self) -> float | None:
+        if self._end is None:
+            return self.turn_timeout
+        remaining = self._end - time.monotonic()
+        if remaining <= 0:
+            raise RuntimeError(
+                f"대화 전체 제한 시간({self.total_timeout:.0f}초)을 넘어 중단했습니다."
+            )
+        return min(remaining, self.turn_timeout) if self.turn_timeout else remaining
+
+
+class TurnStream:
+    """
+    한 턴의 응답 조각을 출력 대상으로 전달한다.
+    최종 결과(앞뒤 공백 제거)와 같아지도록 앞쪽 공백은 버리고 뒤쪽 공백은 다음 내용이 올 때까지 보류한다.
+    require_heading이면 '#'로 시작하지 않는 응답(README가 아닌 대화)은 전달하지 않는다.
+    """
+
+    def __init__(self, output: ReadmeOutput | None, require_heading: bool):
+        self.output = output
+        self.require_heading = require_heading
+        self.started = False
+        self.rejected = False
+        self.first_chunk_ns: int | None = None
+        self._pending_space = ""
+
+    def feed(self, chunk: str) -> None:
+        if self.first_chunk_ns is None:
+            self.first_chunk_ns = time.perf_counter_ns()
+        if self.output is None or self.rejected:
+            return
+        if not self.started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                return
+            if self.require_heading and not chunk.startswith("#"):
+                self.rejected = True
+                return
+            self.started = True
+        body = chunk.rstrip()
+        if body:
+            self.output.write(self._pending_space + body)
+            self._pending_space = chunk[len(body):]
+        else:
+            self._pending_space += chunk
+
+    def discard(self) -> None:
+        """이 턴의 응답이 최종 README가 아니면 이미 전달한 조각을 버린다."""
+        if self.started:
+            self.output.discard()
@@ -1,9 +1,9 @@
 import shutil
 from typing import List
 
-from ..base import ReadmeProvider
+from ...readme_output import ReadmeOutput
+from ..base import LLMCallStats, ReadmeProvider
 from ...prompting import GeminiPromptBuilder
-from . import gemini_orchestrator
 
 
 class GeminiReadmeProvider(ReadmeProvider):
@@ -11,11 +11,25 @@ class GeminiReadmeProvider(ReadmeProvider):
     Gemini CLI와의 상호작용을 담당하는 제공자.
     """
 
-    def __init__(self):
+    context_window_tokens = 1_000_000
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.prompt_builder = GeminiPromptBuilder()
-        self.gemini_path = shutil.which("gemini")
-        if not self.gemini_path:
-            raise RuntimeError("gemini CLI를 찾을 수 없습니다. PATH에 gemini 명령이 있어야 합니다.")
+        self._gemini_path: str | None = None
+
+    @property
+    def gemini_path(self) -> str:
+        """
+        gemini CLI 경로. PATH 탐색은 처음 LLM을 호출할 때 한 번만 한다.
+        (캐시된 README를 사용하거나 인자 오류로 끝나는 실행은 탐색하지 않는다)
+        """
+        if self._gemini_path is None:
+            path = shutil.which("gemini")
+            if not path:
+                raise RuntimeError("gemini CLI를 찾을 수 없습니다. PATH에 gemini 명령이 있어야 합니다.")
+            self._gemini_path = path
+        return self._gemini_path
 
     def build_prompt_new(self, file_paths: List[str], request: str | None) -> str:
         return self.prompt_builder.build_prompt_new(file_paths, request)
@@ -23,14 +37,66 @@ class GeminiReadmeProvider(ReadmeProvider):
     def build_prompt_update(self, file_paths: List[str], request: str | None) -> str:
         return self.prompt_builder.build_prompt_update(file_paths, request)
 
-    def call_llm(self, prompt: str) -> str:
+    def build_prompt_incremental(self, file_paths: List[str], request: str | None) -> str:
+        return self.prompt_builder.build_prompt_incremental(file_paths, request)
+
+    def build_prompt_outline(
+        self, file_paths: List[str], request: str | None, updating: bool = False
+    ) -> str:
+        return self.prompt_builder.build_prompt_outline(file_paths, request, updating)
+
+    def build_prompt_section(
+        self,
+        file_paths: List[str],
+        request: str | None,
+        title: str,
+        description: str,
+        outline: List[str],
+    ) -> str:
+        return self.prompt_builder.build_prompt_section(file_paths, request, title, description, outline)
+
+    def build_prompt_summary(
+        self, file_paths: List[str], request: str | None, scope: str, merge: bool = False
+    ) -> str:
+        return self.prompt_builder.build_prompt_summary(file_paths, request, scope, merge)
+
+    def call_llm(
+        self,
+        prompt: str,
+        context_dirs: List[str] | None = None,
+        output: ReadmeOutput | None = None,
+        stats: LLMCallStats | None = None,
+    ) -> str:
         """
         gemini CLI를 호출하고 최종 텍스트를 반환합니다.
+        컨텍스트 샤드는 작업 디렉터리 밖에 있으므로 context_dirs를 작업 공간에 추가합니다.
         """
+        import asyncio
+
+        return asyncio.run(self.call_llm_async(prompt, context_dirs, output, stats))
+
+    async def call_llm_async(
+        self,
+        prompt: str,
+        context_dirs: List[str] | None = None,
+        output: ReadmeOutput | None = None,
+        stats: LLMCallStats | None = None,
+    ) -> str:
+        """gemini CLI 대화를 현재 이벤트 루프에서 실행하고 최종 텍스트를 반환합니다."""
+        gemini_path = self.gemini_path
+        # 대화 모듈(asyncio 하위 프로세스, stream-json 파서)은 실제로 LLM을 호출할 때만 불러온다.
+        from . import gemini_orchestrator
+
         try:
-            return gemini_orchestrator.run_conversation(
-                self.gemini_path,
-                prompt
+            return await gemini_orchestrator.run_conversation_async(
+                gemini_path,
+                prompt,
+                include_dirs=context_dirs,
+                turn_timeout=self.turn_timeout,
+                total_timeout=self.total_timeout,
+                output=output,
+                validator=self.validator,
+                stats=stats,
             )
         except RuntimeError as e:
             raise RuntimeError(f"gemini CLI 호출 중 오류 발생: {e}")
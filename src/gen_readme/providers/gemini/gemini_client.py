@@ -1,25 +1,87 @@
-import subprocess
+import asyncio
+import os
+import signal
 import sys
+from typing import Callable
 
-def _execute_gemini_command(gemini_path: str, args: list[str]) -> subprocess.Popen:
-    """gemini CLI 명령을 실행하고 Popen 객체를 반환한다."""
+from ... import profiling
+from .gemini_parser import GeminiStreamParser
+
+# stdout을 한 번에 읽는 크기 (긴 응답 조각은 여러 블록에 걸쳐 한 줄로 들어온다)
+STREAM_READ_SIZE = 256 * 1024
+
+
+def _kill_process_group(proc: asyncio.subprocess.Process) -> None:
+    """gemini CLI와 그 자식 프로세스(node 등)를 프로세스 그룹 단위로 종료한다."""
+    if proc.returncode is not None:
+        return
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def run_gemini_command(
+    gemini_path: str,
+    args: list[str],
+    timeout: float | None = None,
+    error_message_prefix: str = "gemini 명령 실행 실패",
+    on_message: Callable[[str], None] | None = None,
+) -> tuple[str | None, str | None]:
+    """
+    gemini CLI 명령을 실행하고 (세션 ID, 응답 내용)을 반환한다.
+    stdout과 stderr를 동시에 읽으므로 어느 한쪽 파이프가 가득 차서 멈추지 않는다.
+    timeout(초) 안에 끝나지 않거나 작업이 취소되면 프로세스 그룹을 종료한다.
+    on_message는 응답 조각이 도착할 때마다 호출된다.
+    """
     command = [gemini_path] + args
     print(f"[DEBUG] Executing command: {' '.join(command)}", file=sys.stderr)
-    
-    return subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        encoding="utf-8",
+
+    proc = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        # 새 세션(프로세스 그룹)으로 실행해 취소 시 자식 프로세스까지 함께 종료
+        start_new_session=True,
     )
+    profiling.count("subprocesses")
+    parser = GeminiStreamParser(on_message)
+
+    async def drain_stdout() -> None:
+        # 줄 단위 대신 큰 블록으로 읽고 바이트 상태로 줄을 나눠 파서에 넘긴다.
+        pending = bytearray()
+        while chunk := await proc.stdout.read(STREAM_READ_SIZE):
+            cut = chunk.rfind(b"\n")
+            if cut < 0:
+                pending += chunk
+                continue
+            pending += chunk[:cut]
+            for line in bytes(pending).split(b"\n"):
+                parser.feed_bytes(line)
+            pending = bytearray(chunk[cut + 1:])
+        if pending:
+            parser.feed_bytes(bytes(pending))
 
-def _wait_and_check_proc(proc: subprocess.Popen, error_message_prefix: str = "gemini 명령 실행 실패") -> str:
-    """프로세스가 종료될 때까지 기다리고, 오류 발생 시 예외를 발생시킨다. stderr 내용을 반환한다."""
-    stderr_output = proc.stderr.read() if proc.stderr else ""
-    proc.wait()
+    async def drain_stderr() -> str:
+        return (await proc.stderr.read()).decode("utf-8", errors="replace")
+
+    try:
+        _, stderr_output, _ = await asyncio.wait_for(
+            asyncio.gather(drain_stdout(), drain_stderr(), proc.wait()), timeout
+        )
+    except asyncio.TimeoutError:
+        _kill_process_group(proc)
+        await proc.wait()
+        raise RuntimeError(f"{error_message_prefix}: {timeout:.0f}초 안에 응답이 끝나지 않아 중단했습니다.")
+    except BaseException:
+        # 취소(KeyboardInterrupt, 상위 작업 취소 등) 시에도 프로세스를 남기지 않는다.
+        _kill_process_group(proc)
+        raise
 
     if proc.returncode != 0:
         raise RuntimeError(f"{error_message_prefix} (코드 {proc.returncode}): {stderr_output.strip()}")
-    
-    return stderr_output
\ No newline at end of file
+
+    return parser.result()
@@ -1,55 +1,163 @@
-import sys
-from halo import Halo
+import asyncio
+import time
 
-from .gemini_client import _execute_gemini_command, _wait_and_check_proc
-from .gemini_parser import parse_gemini_stream
+from ... import profiling
+from ...readme_output import ReadmeOutput
+from ...readme_validator import ReadmeValidator, get_validator
+from ...spinner import start_spinner
+from ..base import DEFAULT_TOTAL_TIMEOUT, DEFAULT_TURN_TIMEOUT, LLMCallStats
+from ..conversation import FINAL_MARKDOWN_COMMAND, MAX_CONVERSATION_TURNS, Deadline, TurnStream
+from .gemini_client import run_gemini_command
 
 
-def run_conversation(gemini_path: str, task_prompt: str) -> str:
-    """'structured' 모드를 위한 UUID 기반 세션 대화형 호출을 실행합니다."""
+def _workspace_args(include_dirs: list[str] | None) -> list[str]:
+    """작업 디렉터리 밖의 컨텍스트 파일(@경로)을 읽을 수 있도록 작업 공간에 추가하는 인자."""
+    dirs = [d for d in include_dirs or [] if d]
+    if not dirs:
+        return []
+    return ["--include-directories", ",".join(dirs)]
 
-    MAX_CONVERSATION_TURNS = 5
-    spinner = Halo(text='Gemini CLI와 대화 시작 중...', spinner='dots')
-    spinner.start()
+
+async def _run_turn(
+    turn: int,
+    gemini_path: str,
+    args: list[str],
+    timeout: float | None,
+    error_message_prefix: str,
+    turn_stream: TurnStream,
+) -> tuple[str | None, str | None]:
+    """대화 턴 하나(gemini 프로세스 하나)를 실행한다. --profile이면 턴별 지연 시간을 기록한다."""
+    with profiling.span("llm.turn", cat="llm", concurrent=True, turn=turn) as turn_span:
+        start = time.perf_counter_ns()
+        session_id, content = await run_gemini_command(
+            gemini_path,
+            args,
+            timeout=timeout,
+            error_message_prefix=error_message_prefix,
+            on_message=turn_stream.feed,
+        )
+        if turn_stream.first_chunk_ns is not None:
+            turn_span.set(first_chunk_ms=round((turn_stream.first_chunk_ns - start) / 1e6, 1))
+        turn_span.set(bytes=len(content.encode("utf-8")) if content else 0)
+    return session_id, content
+
+
+async def run_conversation_async(
+    gemini_path: str,
+    task_prompt: str,
+    include_dirs: list[str] | None = None,
+    turn_timeout: float | None = DEFAULT_TURN_TIMEOUT,
+    total_timeout: float | None = DEFAULT_TOTAL_TIMEOUT,
+    output: ReadmeOutput | None = None,
+    validator: ReadmeValidator | None = None,
+    stats: LLMCallStats | None = None,
+) -> str:
+    """
+    'structured' 모드를 위한 UUID 기반 세션 대화형 호출을 실행합니다.
+    각 턴은 turn_timeout, 대화 전체는 total_timeout(초) 안에 끝나야 하며,
+    넘기거나 작업이 취소되면 실행 중인 gemini 프로세스 그룹을 종료합니다.
+    하나의 이벤트 루프에서 여러 대화를 동시에 실행할 수 있습니다.
+    output을 넘기면 README 조각이 도착하는 대로 전달하고, 최종 결과가 아닌 턴의 조각은 버립니다.
+    응답은 validator(기본값: HeuristicReadmeValidator)로 검증하며, 첫 응답이 통과하면 바로 끝내고
+    그렇지 않으면 다음 턴부터 최종 마크다운만 출력하라고 요청합니다.
+    stats를 넘기면 실행한 대화 턴 수를 기록합니다.
+    """
+    validator = validator or get_validator()
+    stats = stats if stats is not None else LLMCallStats()
+    deadline = Deadline(turn_timeout, total_timeout)
+    # README가 stdout으로 스트리밍될 수 있으므로 진행 표시는 stderr에 출력
+    spinner = start_spinner("Gemini CLI와 대화 시작 중...")
 
     try:
         spinner.text = "Gemini CLI 세션 초기화 및 작업 전달 중..."
-        proc_init = _execute_gemini_command(gemini_path, ["--output-format", "stream-json", task_prompt])
-        session_id, final_content = parse_gemini_stream(proc_init)
-        _wait_and_check_proc(proc_init, error_message_prefix="gemini 세션 초기화 및 작업전달 실패")
+        turn_stream = TurnStream(output, require_heading=True)
+        stats.turns = 1
+        session_id, final_content = await _run_turn(
+            1,
+            gemini_path,
+            _workspace_args(include_dirs) + ["--output-format", "stream-json", task_prompt],
+            deadline.next_turn(),
+            "gemini 세션 초기화 및 작업전달 실패",
+            turn_stream,
+        )
 
         if not session_id:
             raise RuntimeError("Gemini CLI에서 세션 ID를 획득하지 못했습니다.")
         spinner.info(f"Gemini 세션 시작됨 (ID: ...{session_id[-6:]})")
-        
-        if not final_content:
-            #  혹시 바로 마크다운 안줄수도 있으니 대화형 루프를 통해 최종 결과 요청
-            for i in range(MAX_CONVERSATION_TURNS):
-                final_command = (
-                    "지금까지의 지시와 대화를 바탕으로, 다른 대화나 추가 설명 없이, 오직 README.md 파일의 최종 마크다운 내용만 출력해줘. 이것이 최종 결과물이다."
-                    if i == MAX_CONVERSATION_TURNS - 1
-                    else "계속해서 작업을 진행해줘."
-                )
-                spinner.text = f"대화형 턴 {i+1}/{MAX_CONVERSATION_TURNS}..."
-                
-                proc_turn = _execute_gemini_command(
-                    gemini_path,
-                    ["--resume", session_id, "--output-format", "stream-json", final_command],
-                )
-                _, response_content = parse_gemini_stream(proc_turn)
-    
-                _wait_and_check_proc(proc_turn, error_message_prefix=f"gemini 대화 턴 {i+1} 실패")
-                if response_content and response_content.startswith("#"):
-                    spinner.succeed("Gemini CLI 대화 완료 및 README 생성 성공!")
-                    return response_content
-            
-            spinner.fail(f"{MAX_CONVERSATION_TURNS}번의 시도 후에도 유효한 README 콘텐츠를 생성하지 못했습니다.")
-            raise RuntimeError(f"{MAX_CONVERSATION_TURNS}번의 시도 후에도 유효한 README 콘텐츠를 생성하지 못했습니다.")
-
-        spinner.succeed("Gemini CLI 대화 완료 및 README 생성 성공!")
-        return final_content
 
+        check = validator.validate(final_content)
+        if check.accepted:
+            spinner.succeed("Gemini CLI 대화 완료 및 README 생성 성공!")
+            return final_content
+        turn_stream.discard()
+
+        # 통과하지 못한 응답 중 '#'로 시작하는 가장 나은 것은 마지막 대안으로 남겨 둔다.
+        best_content, best_score = None, -1.0
+        if final_content and final_content.startswith("#"):
+            best_content, best_score = final_content, check.score
+
+        # 바로 최종 마크다운만 요청한다. (세션을 다시 불러오는 턴마다 프로세스 실행과 모델 왕복이 추가된다)
+        for turn in range(2, MAX_CONVERSATION_TURNS + 1):
+            reasons = ", ".join(check.reasons) or f"점수 {check.score}"
+            spinner.text = f"대화형 턴 {turn}/{MAX_CONVERSATION_TURNS} (이전 응답: {reasons})..."
+
+            turn_stream = TurnStream(output, require_heading=True)
+            stats.turns = turn
+            _, response_content = await _run_turn(
+                turn,
+                gemini_path,
+                _workspace_args(include_dirs)
+                + ["--resume", session_id, "--output-format", "stream-json", FINAL_MARKDOWN_COMMAND],
+                deadline.next_turn(),
+                f"gemini 대화 턴 {turn} 실패",
+                turn_stream,
+            )
+            check = validator.validate(response_content)
+            if check.accepted:
+                spinner.succeed("Gemini CLI 대화 완료 및 README 생성 성공!")
+                return response_content
+            turn_stream.discard()
+            if response_content and response_content.startswith("#") and check.score > best_score:
+                best_content, best_score = response_content, check.score
+
+        if best_content is not None:
+            spinner.warn(
+                f"{MAX_CONVERSATION_TURNS}번의 턴 안에 검증을 통과한 응답이 없어 "
+                f"가장 나은 응답(점수 {best_score})을 사용합니다."
+            )
+            return best_content
+
+        spinner.fail(f"{MAX_CONVERSATION_TURNS}번의 시도 후에도 유효한 README 콘텐츠를 생성하지 못했습니다.")
+        raise RuntimeError(f"{MAX_CONVERSATION_TURNS}번의 시도 후에도 유효한 README 콘텐츠를 생성하지 못했습니다.")
+
+    except asyncio.CancelledError:
+        spinner.fail("Gemini CLI 대화가 취소되었습니다.")
+        raise
     except Exception as e:
         spinner.fail(f"Gemini CLI 대화 중 오류 발생: {e}")
         raise
 
+
+def run_conversation(
+    gemini_path: str,
+    task_prompt: str,
+    include_dirs: list[str] | None = None,
+    turn_timeout: float | None = DEFAULT_TURN_TIMEOUT,
+    total_timeout: float | None = DEFAULT_TOTAL_TIMEOUT,
+    output: ReadmeOutput | None = None,
+    validator: ReadmeValidator | None = None,
+    stats: LLMCallStats | None = None,
+) -> str:
+    """run_conversation_async를 새 이벤트 루프에서 실행하는 동기 버전입니다."""
+    return asyncio.run(
+        run_conversation_async(
+            gemini_path,
+            task_prompt,
+            include_dirs,
+            turn_timeout,
+            total_timeout,
+            output,
+            validator,
+            stats,
+        )
+    )
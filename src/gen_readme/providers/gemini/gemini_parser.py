@@ -1,6 +1,154 @@
 import json
 import sys
 import subprocess
+import time
+from typing import Callable, TextIO
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson은 선택 의존성
+    _loads = json.loads
+
+# stream-json 이벤트는 보통 `{"type":"<종류>",...}` 형태로 시작하므로,
+# 이 접두사 뒤의 종류만 보고 필요 없는 이벤트는 JSON 디코딩 없이 건너뛴다.
+_TYPE_PREFIXES = (b'{"type":"', b'{"type": "')
+_HANDLED_TYPES = {b"init", b"message", b"result", b"thought"}
+_JSON_ERRORS = (ValueError, TypeError)  # orjson.JSONDecodeError는 ValueError의 하위 클래스
+
+
+class RateLimitedLog:
+    """
+    thought/디버그 출력을 위한 로그 싱크.
+    줄마다 바로 쓰지 않고 모았다가 flush_interval마다 한 번에 쓰며,
+    초당 rate줄(최대 burst줄까지 누적)을 넘는 줄은 버리고 개수만 센다.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        rate: float = 20.0,
+        burst: int = 50,
+        flush_interval: float = 0.2,
+    ):
+        self.stream = stream or sys.stderr
+        self.rate = rate
+        self.burst = burst
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._last_flush = self._last_refill
+        self._pending: list[str] = []
+
+    def allow(self) -> bool:
+        """지금 한 줄을 더 쓸 수 있는지 확인한다. 쓸 수 없으면 버린 줄로 센다."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+        if self._tokens < 1:
+            self.dropped += 1
+            return False
+        self._tokens -= 1
+        return True
+
+    def log(self, message: str, force: bool = False) -> None:
+        """한 줄을 기록한다. force이면 속도 제한과 관계없이 기록한다."""
+        if not force and not self.allow():
+            return
+        self._pending.append(message)
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self.stream.write("\n".join(self._pending) + "\n")
+            self.stream.flush()
+            self._pending.clear()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self.dropped:
+            self._pending.append(f"[CoT] ... 출력량이 많아 {self.dropped}줄을 생략했습니다.")
+            self.dropped = 0
+        self.flush()
+
+
+class GeminiStreamParser:
+    """
+    gemini CLI의 stream-json 출력을 한 줄씩 받아 세션 ID와 응답 내용을 모은다.
+    동기(Popen)/비동기(asyncio) 실행 모두 같은 파서를 사용한다.
+    on_message를 넘기면 assistant 응답 조각이 도착할 때마다 호출한다.
+    thought와 디버그 출력은 log(기본값: stderr로 가는 RateLimitedLog)로 보낸다.
+    """
+
+    def __init__(
+        self,
+        on_message: Callable[[str], None] | None = None,
+        log: RateLimitedLog | None = None,
+    ):
+        self.session_id: str | None = None
+        self.response_parts: list[str] = []
+        self.on_message = on_message
+        self.log = log or RateLimitedLog()
+
+    def feed(self, line: str | bytes) -> None:
+        if isinstance(line, str):
+            line = line.encode("utf-8")
+        self.feed_bytes(line)
+
+    def feed_bytes(self, line: bytes) -> None:
+        # 접두사로 이벤트 종류를 먼저 확인하고, 처리하지 않는 이벤트는 디코딩하지 않는다.
+        if line.startswith(_TYPE_PREFIXES):
+            start = line.index(b'"', 8) + 1
+            event_type = line[start:line.find(b'"', start)]
+            if event_type not in _HANDLED_TYPES:
+                return
+            # 어차피 버려질 thought는 디코딩하지 않는다.
+            if event_type == b"thought" and not self.log.allow():
+                return
+        elif not line.strip():
+            return
+        else:
+            event_type = None
+
+        try:
+            data = _loads(line)
+        except _JSON_ERRORS:
+            return
+        if not isinstance(data, dict):
+            return
+        self._handle(data, event_type)
+
+    def _handle(self, data: dict, event_type: bytes | None) -> None:
+        kind = data.get("type")
+
+        # type: init -> 세션 ID 추출
+        if kind == "init" and "session_id" in data:
+            self.session_id = data["session_id"]
+            self.log.log(f"[DEBUG] 세션 ID 발견: {self.session_id}", force=True)
+
+        # type: thought -> CoT 과정에서 독백이 있다면 출력
+        elif kind == "thought" and "content" in data:
+            # 접두사로 이미 속도 제한을 확인한 경우에는 다시 확인하지 않는다.
+            self.log.log(f"[CoT] {data['content']}", force=event_type == b"thought")
+
+        # type: message -> content 조각 수집
+        elif kind == "message" and data.get("role") == "assistant" and "content" in data:
+            self.response_parts.append(data["content"])
+            if self.on_message is not None:
+                self.on_message(data["content"])
+
+        # type: result, status: success -> 성공적인 스트림 종료 확인
+        elif kind == "result" and data.get("status") == "success":
+            self.log.log("[DEBUG] 스트림 성공적으로 종료됨.", force=True)
+
+    def result(self) -> tuple[str | None, str | None]:
+        """(세션 ID, 최종 콘텐츠)를 반환한다. 남아 있는 로그도 이때 내보낸다."""
+        self.log.close()
+        final_content = "".join(self.response_parts).strip() if self.response_parts else None
+        return self.session_id, final_content
 
 
 def parse_gemini_stream(proc: subprocess.Popen) -> tuple[str | None, str | None]:
@@ -8,35 +156,8 @@ def parse_gemini_stream(proc: subprocess.Popen) -> tuple[str | None, str | None]
     Popen 프로세스의 stdout 스트림을 처리하여 세션 ID와 최종 콘텐츠를 추출합니다.
     스트리밍되는 'message' 타입의 content들을 모두 합쳐서 최종 콘텐츠를 만듭니다.
     """
-    session_id: str | None = None
-    response_parts = []
-    
+    parser = GeminiStreamParser()
     if proc.stdout:
         for line in proc.stdout:
-            # print(f"[DEBUG] Raw JSON: {line.strip()}", file=sys.stderr)
-            try:
-                data = json.loads(line)
-                
-                # type: init -> 세션 ID 추출
-                if data.get("type") == "init" and "session_id" in data:
-                    session_id = data["session_id"]
-                    print(f"[DEBUG] 세션 ID 발견: {session_id}", file=sys.stderr)
-
-                # type: thought -> CoT 과정에서 독백이 있다면 출력
-                elif data.get("type") == "thought" and "content" in data:
-                    print(f"[CoT] {data['content']}", file=sys.stderr, flush=True)
-
-                # type: message -> content 조각 수집
-                elif data.get("type") == "message" and data.get("role") == "assistant" and "content" in data:
-                    response_parts.append(data["content"])
-                
-                # type: result, status: success -> 성공적인 스트림 종료 확인
-                elif data.get("type") == "result" and data.get("status") == "success":
-                    print(f"[DEBUG] 스트림 성공적으로 종료됨.", file=sys.stderr)
-
-            except (json.JSONDecodeError, KeyError):
-                continue
-    
-    final_content = "".join(response_parts).strip() if response_parts else None
-
-    return session_id, final_content
\ No newline at end of file
+            parser.feed(line)
+    return parser.result()
@@ -0,0 +1,65 @@
+import http.client
+import threading
+import urllib.parse
+
+from ... import profiling
+
+# 호스트마다 보관하는 유휴(keep-alive) 연결 수 상한
+DEFAULT_MAX_IDLE = 8
+
+
+class ConnectionPool:
+    """
+    한 API 엔드포인트에 대한 HTTP/1.1 keep-alive 연결 풀.
+    대화 턴과 재시도, batch 모드의 여러 패키지가 TCP/TLS 연결을 다시 맺지 않고 재사용한다.
+    여러 스레드에서 동시에 사용할 수 있다. (연결 하나는 한 번에 한 요청만 사용한다)
+    """
+
+    def __init__(self, base_url: str, max_idle: int = DEFAULT_MAX_IDLE):
+        parsed = urllib.parse.urlsplit(base_url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"API 주소는 http:// 또는 https://로 시작해야 합니다: {base_url}")
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.base_path = parsed.path.rstrip("/")
+        self.max_idle = max_idle
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    def url_path(self, path: str) -> str:
+        return f"{self.base_path}/{path.lstrip('/')}"
+
+    def acquire(self, timeout: float | None) -> tuple[http.client.HTTPConnection, bool]:
+        """유휴 연결이 있으면 재사용하고 없으면 새로 만든다. (연결, 재사용 여부)를 반환한다."""
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        if self.scheme == "https":
+            conn = http.client.HTTPSConnection(self.host, self.port, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        with self._lock:
+            self.opened += 1
+        profiling.count("http_connections")
+        return conn, False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool = True) -> None:
+        """응답을 끝까지 읽은 연결을 풀에 돌려준다. 재사용할 수 없으면 닫는다."""
+        if reusable and conn.sock is not None:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
@@ -0,0 +1,226 @@
+import email.utils
+import http.client
+import json
+import random
+import sys
+import time
+from typing import Callable
+
+from ... import profiling
+from .http_pool import ConnectionPool
+
+# 일시적인 오류로 보고 다시 시도하는 HTTP 상태 코드 (요청 한도 초과, 서버 과부하/장애)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_MAX_RETRIES = 4
+# 재시도 대기 시간: BACKOFF_BASE * 2^시도 횟수 (BACKOFF_MAX 이하), 그 절반 범위에서 무작위로 흔든다.
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+
+class _RetryableError(Exception):
+    """다시 시도할 수 있는 실패. stale이면 재사용한 keep-alive 연결이 서버에서 이미 닫힌 경우다."""
+
+    def __init__(self, message: str, retry_after: float | None = None, stale: bool = False):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.stale = stale
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 바꾼다."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int) -> float:
+    ceiling = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+def _error_message(body: bytes) -> str:
+    """오류 응답 본문에서 사람이 읽을 메시지를 꺼낸다. ({"error": {"message": ...}} 형식 또는 원문 앞부분)"""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body[:300].decode("utf-8", errors="replace").strip()
+    error = data.get("error") if isinstance(data, dict) else None
+    if isinstance(error, dict) and error.get("message"):
+        return str(error["message"])
+    if isinstance(data, list) and data and isinstance(data[0], dict):
+        # Gemini 호환 엔드포인트는 오류를 배열로 감싸 보내기도 한다.
+        return _error_message(json.dumps(data[0]).encode("utf-8"))
+    return body[:300].decode("utf-8", errors="replace").strip()
+
+
+class _Deadline:
+    def __init__(self, timeout: float | None):
+        self.timeout = timeout
+        self._end = time.monotonic() + timeout if timeout else None
+
+    def remaining(self) -> float | None:
+        if self._end is None:
+            return None
+        remaining = self._end - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError
+        return remaining
+
+
+def chat_completion(
+    pool: ConnectionPool,
+    model: str,
+    messages: list[dict],
+    api_key: str | None = None,
+    timeout: float | None = None,
+    on_message: Callable[[str], None] | None = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> str:
+    """
+    OpenAI 호환 /chat/completions 엔드포인트를 스트리밍 모드로 호출하고 응답 텍스트를 반환한다.
+    응답 조각은 도착하는 대로 on_message로 전달한다. (서버가 스트리밍하지 않으면 한 번에 전달)
+    429/5xx와 연결 오류는 지수 백오프(Retry-After가 있으면 그 값)로 max_retries번까지 다시 시도하며,
+    응답 조각을 이미 전달한 뒤의 실패는 출력이 중복되므로 다시 시도하지 않는다.
+    timeout은 재시도 대기를 포함한 호출 전체의 제한 시간(초)이다.
+    """
+    deadline = _Deadline(timeout)
+    body = json.dumps({"model": model, "messages": messages, "stream": True}, ensure_ascii=False).encode("utf-8")
+    headers = {
+        "Content-Type": "application/json",
+        "Accept": "text/event-stream, application/json",
+    }
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    path = pool.url_path("chat/completions")
+
+    attempt = 0
+    while True:
+        try:
+            with profiling.span("http.request", cat="llm", attempt=attempt + 1) as request_span:
+                return _post_once(pool, path, body, headers, deadline, on_message, request_span)
+        except TimeoutError:
+            raise RuntimeError(f"API 응답이 제한 시간({timeout:.0f}초) 안에 끝나지 않았습니다.")
+        except _RetryableError as e:
+            if e.stale:
+                # 유휴 상태에서 서버가 닫은 연결이므로 시도 횟수에 넣지 않고 새 연결로 바로 다시 보낸다.
+                continue
+            if attempt >= max_retries:
+                raise RuntimeError(f"API 요청이 {attempt + 1}번 모두 실패했습니다: {e}")
+            delay = e.retry_after if e.retry_after is not None else backoff_delay(attempt)
+            try:
+                remaining = deadline.remaining()
+            except TimeoutError:
+                remaining = 0.0
+            if remaining is not None and delay >= remaining:
+                raise RuntimeError(f"API 요청 실패({e}) 후 다시 시도할 시간이 남지 않았습니다.")
+            attempt += 1
+            print(
+                f"[경고] API 요청 실패({e}). {delay:.1f}초 후 다시 시도합니다. ({attempt}/{max_retries})",
+                file=sys.stderr,
+            )
+            time.sleep(delay)
+
+
+def _post_once(
+    pool: ConnectionPool,
+    path: str,
+    body: bytes,
+    headers: dict,
+    deadline: _Deadline,
+    on_message: Callable[[str], None] | None,
+    request_span,
+) -> str:
+    conn, reused = pool.acquire(deadline.remaining())
+    request_span.set(reused=reused)
+    profiling.count("http_requests")
+    try:
+        conn.request("POST", path, body, headers)
+        response = conn.getresponse()
+    except TimeoutError:
+        conn.close()
+        raise
+    except (http.client.HTTPException, OSError) as e:
+        conn.close()
+        raise _RetryableError(f"연결 오류: {e}", stale=reused)
+
+    request_span.set(status=response.status)
+    if response.status != 200:
+        data = response.read()
+        pool.release(conn, not response.will_close)
+        message = f"HTTP {response.status}: {_error_message(data)}"
+        if response.status in RETRY_STATUSES:
+            raise _RetryableError(message, retry_after=_retry_after(response.getheader("Retry-After")))
+        raise RuntimeError(f"API 요청이 거부되었습니다 ({message})")
+
+    emitted = False
+
+    def emit(text: str) -> None:
+        nonlocal emitted
+        emitted = True
+        if on_message is not None:
+            on_message(text)
+
+    try:
+        if (response.getheader("Content-Type") or "").startswith("text/event-stream"):
+            content = _read_event_stream(response, deadline, emit)
+        else:
+            content = _read_json(response, emit)
+    except TimeoutError:
+        conn.close()
+        raise
+    except (http.client.HTTPException, OSError) as e:
+        conn.close()
+        if emitted:
+            raise RuntimeError(f"API 응답을 받는 중 연결이 끊겼습니다: {e}")
+        raise _RetryableError(f"응답 수신 오류: {e}")
+    except Exception:
+        conn.close()
+        raise
+    pool.release(conn, not response.will_close)
+    request_span.set(bytes=len(content.encode("utf-8")))
+    return content.strip()
+
+
+def _read_event_stream(response: http.client.HTTPResponse, deadline: _Deadline, emit) -> str:
+    """Server-Sent Events 응답에서 choices[0].delta.content 조각을 모은다."""
+    parts = []
+    while True:
+        deadline.remaining()
+        line = response.readline()
+        if not line:
+            break
+        if not line.startswith(b"data:"):
+            continue  # 빈 줄(이벤트 구분), 주석(:keep-alive), event:/id: 필드
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            response.read()  # 연결을 재사용할 수 있도록 남은 본문(chunked 종료)을 비운다.
+            break
+        if not data:
+            continue
+        event = json.loads(data)
+        if event.get("error"):
+            raise RuntimeError(f"API 스트림 오류: {_error_message(data)}")
+        for choice in event.get("choices") or ():
+            text = (choice.get("delta") or {}).get("content")
+            if text:
+                parts.append(text)
+                emit(text)
+    return "".join(parts)
+
+
+def _read_json(response: http.client.HTTPResponse, emit) -> str:
+    """스트리밍을 지원하지 않는 서버의 일반 JSON 응답에서 choices[0].message.content를 꺼낸다."""
+    data = json.loads(response.read())
+    choices = data.get("choices") or []
+    content = (choices[0].get("message") or {}).get("content") if choices else None
+    if content:
+        emit(content)
+    return content or ""
@@ -0,0 +1,120 @@
+import os
+import threading
+from typing import List
+
+from ...readme_output import ReadmeOutput
+from ...readme_validator import ReadmeValidator
+from ..base import LLMCallStats, ReadmeProvider
+from ...prompting import GeminiPromptBuilder
+
+DEFAULT_API_BASE = "https://api.openai.com/v1"
+# API 키는 CLI 인자로 받지 않는다. (셸 기록과 프로세스 목록에 남지 않도록) 앞에 있는 변수가 우선한다.
+API_KEY_ENV_VARS = ("GEN_README_API_KEY", "OPENAI_API_KEY", "GEMINI_API_KEY")
+
+
+class OpenaiCompatReadmeProvider(ReadmeProvider):
+    """
+    OpenAI 호환 Chat Completions HTTP API(OpenAI, Gemini의 OpenAI 호환 엔드포인트, vLLM/Ollama 등)를
+    호출하는 제공자. 연결은 keep-alive 풀로 재사용하며, 컨텍스트 파일은 메시지에 직접 담아 보낸다.
+
+    :param api_base: API 기본 주소. None이면 GEN_README_API_BASE, OPENAI_BASE_URL, OpenAI 순으로 사용
+    :param model: 사용할 모델 이름. None이면 GEN_README_MODEL 환경 변수
+    """
+
+    option_names = ("api_base", "model")
+
+    def __init__(self, api_base: str | None = None, model: str | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.prompt_builder = GeminiPromptBuilder()
+        self.api_base = (
+            api_base
+            or os.environ.get("GEN_README_API_BASE")
+            or os.environ.get("OPENAI_BASE_URL")
+            or DEFAULT_API_BASE
+        )
+        self.model = model or os.environ.get("GEN_README_MODEL")
+        if not self.model:
+            raise RuntimeError("openai 제공자는 모델 이름이 필요합니다. --model 또는 GEN_README_MODEL을 지정하세요.")
+        self.api_key = next((os.environ[name] for name in API_KEY_ENV_VARS if os.environ.get(name)), None)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def pool(self):
+        """
+        keep-alive 연결 풀. http.client/ssl은 import 비용이 있으므로 처음 LLM을 호출할 때 만든다.
+        batch 모드에서는 여러 스레드가 같은 풀을 공유한다.
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                from .http_pool import ConnectionPool
+
+                self._pool = ConnectionPool(self.api_base)
+            return self._pool
+
+    def with_validator(self, validator: ReadmeValidator) -> "OpenaiCompatReadmeProvider":
+        # 사본도 같은 연결 풀을 쓰도록 풀을 먼저 만든다.
+        self.pool
+        return super().with_validator(validator)
+
+    def build_prompt_new(self, file_paths: List[str], request: str | None) -> str:
+        return self.prompt_builder.build_prompt_new(file_paths, request)
+
+    def build_prompt_update(self, file_paths: List[str], request: str | None) -> str:
+        return self.prompt_builder.build_prompt_update(file_paths, request)
+
+    def build_prompt_incremental(self, file_paths: List[str], request: str | None) -> str:
+        return self.prompt_builder.build_prompt_incremental(file_paths, request)
+
+    def build_prompt_outline(
+        self, file_paths: List[str], request: str | None, updating: bool = False
+    ) -> str:
+        return self.prompt_builder.build_prompt_outline(file_paths, request, updating)
+
+    def build_prompt_section(
+        self,
+        file_paths: List[str],
+        request: str | None,
+        title: str,
+        description: str,
+        outline: List[str],
+    ) -> str:
+        return self.prompt_builder.build_prompt_section(file_paths, request, title, description, outline)
+
+    def build_prompt_summary(
+        self, file_paths: List[str], request: str | None, scope: str, merge: bool = False
+    ) -> str:
+        return self.prompt_builder.build_prompt_summary(file_paths, request, scope, merge)
+
+    def call_llm(
+        self,
+        prompt: str,
+        context_dirs: List[str] | None = None,
+        output: ReadmeOutput | None = None,
+        stats: LLMCallStats | None = None,
+    ) -> str:
+        """
+        API와 대화하고 최종 텍스트를 반환합니다.
+        프롬프트가 참조하는 context_dirs 안의 컨텍스트 파일은 첫 메시지에 내용을 붙여 보냅니다.
+        batch 모드에서는 기본 call_llm_async가 이 메서드를 스레드에서 실행하며, 연결 풀은 스레드 간에 공유됩니다.
+        """
+        from . import openai_orchestrator
+
+        pool = self.pool
+        try:
+            return openai_orchestrator.run_conversation(
+                pool,
+                self.model,
+                prompt,
+                api_key=self.api_key,
+                context_dirs=context_dirs,
+                turn_timeout=self.turn_timeout,
+                total_timeout=self.total_timeout,
+                output=output,
+                validator=self.validator,
+                stats=stats,
+            )
+        except RuntimeError as e:
+            raise RuntimeError(f"API 호출 중 오류 발생: {e}")
+        except Exception as e:
+            raise RuntimeError(f"API 호출 중 예기치 않은 오류 발생: {e}")
@@ -0,0 +1,131 @@
+import os
+import re
+import time
+
+from ... import profiling
+from ...readme_output import ReadmeOutput
+from ...readme_validator import ReadmeValidator, get_validator
+from ...spinner import start_spinner
+from ..base import DEFAULT_TOTAL_TIMEOUT, DEFAULT_TURN_TIMEOUT, LLMCallStats
+from ..conversation import FINAL_MARKDOWN_COMMAND, MAX_CONVERSATION_TURNS, Deadline, TurnStream
+from .http_pool import ConnectionPool
+from .openai_client import DEFAULT_MAX_RETRIES, chat_completion
+
+_FILE_REFERENCE = re.compile(r"@(\S+)")
+
+
+def _within(path: str, dirs: list[str]) -> bool:
+    real = os.path.realpath(path)
+    return any(os.path.commonpath([real, os.path.realpath(d)]) == os.path.realpath(d) for d in dirs)
+
+
+def inline_context(prompt: str, context_dirs: list[str] | None) -> str:
+    """
+    프롬프트의 `@경로` 참조 파일 내용을 메시지 뒤에 붙인다.
+    HTTP API는 로컬 파일을 읽을 수 없으므로 컨텍스트를 메시지에 직접 담아 보낸다.
+    context_dirs가 주어지면 그 안의 파일만 읽는다. 같은 파일은 한 번만 붙인다.
+    """
+    dirs = [d for d in context_dirs or [] if d]
+    attachments = []
+    seen = set()
+    for path in _FILE_REFERENCE.findall(prompt):
+        if path in seen or not os.path.isfile(path) or (dirs and not _within(path, dirs)):
+            continue
+        seen.add(path)
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            attachments.append(f"----- @{path} -----\n{f.read()}")
+    if not attachments:
+        return prompt
+    return prompt + "\n\n아래는 위에서 @로 참조한 파일들의 내용이다.\n\n" + "\n\n".join(attachments)
+
+
+def _run_turn(
+    turn: int,
+    pool: ConnectionPool,
+    model: str,
+    messages: list[dict],
+    api_key: str | None,
+    timeout: float | None,
+    max_retries: int,
+    turn_stream: TurnStream,
+) -> str:
+    """대화 턴 하나(HTTP 요청 하나, 재시도 포함)를 실행한다. --profile이면 턴별 지연 시간을 기록한다."""
+    with profiling.span("llm.turn", cat="llm", turn=turn) as turn_span:
+        start = time.perf_counter_ns()
+        content = chat_completion(
+            pool,
+            model,
+            messages,
+            api_key=api_key,
+            timeout=timeout,
+            on_message=turn_stream.feed,
+            max_retries=max_retries,
+        )
+        if turn_stream.first_chunk_ns is not None:
+            turn_span.set(first_chunk_ms=round((turn_stream.first_chunk_ns - start) / 1e6, 1))
+        turn_span.set(bytes=len(content.encode("utf-8")))
+    return content
+
+
+def run_conversation(
+    pool: ConnectionPool,
+    model: str,
+    task_prompt: str,
+    api_key: str | None = None,
+    context_dirs: list[str] | None = None,
+    turn_timeout: float | None = DEFAULT_TURN_TIMEOUT,
+    total_timeout: float | None = DEFAULT_TOTAL_TIMEOUT,
+    output: ReadmeOutput | None = None,
+    validator: ReadmeValidator | None = None,
+    stats: LLMCallStats | None = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> str:
+    """
+    OpenAI 호환 API와 대화하여 README를 생성합니다.
+    세션을 서버에 두지 않고 대화 기록(messages)을 메모리에 유지하며, 턴마다 전체 기록을 다시 보냅니다.
+    컨텍스트 파일은 첫 메시지에 한 번만 담고, 응답이 validator를 통과하지 못하면
+    최종 마크다운만 출력하라는 메시지를 덧붙여 다음 턴을 실행합니다.
+    """
+    validator = validator or get_validator()
+    stats = stats if stats is not None else LLMCallStats()
+    deadline = Deadline(turn_timeout, total_timeout)
+    spinner = start_spinner(f"{model} 모델에 작업 전달 중...")
+
+    try:
+        messages = [{"role": "user", "content": inline_context(task_prompt, context_dirs)}]
+        best_content, best_score = None, -1.0
+        check = None
+        for turn in range(1, MAX_CONVERSATION_TURNS + 1):
+            if check is not None:
+                reasons = ", ".join(check.reasons) or f"점수 {check.score}"
+                spinner.text = f"대화형 턴 {turn}/{MAX_CONVERSATION_TURNS} (이전 응답: {reasons})..."
+            turn_stream = TurnStream(output, require_heading=True)
+            stats.turns = turn
+            content = _run_turn(
+                turn, pool, model, messages, api_key, deadline.next_turn(), max_retries, turn_stream
+            )
+            check = validator.validate(content)
+            if check.accepted:
+                spinner.succeed(f"{model} 대화 완료 및 README 생성 성공!")
+                return content
+            turn_stream.discard()
+            if content and content.startswith("#") and check.score > best_score:
+                best_content, best_score = content, check.score
+            messages += [
+                {"role": "assistant", "content": content},
+                {"role": "user", "content": FINAL_MARKDOWN_COMMAND},
+            ]
+
+        if best_content is not None:
+            spinner.warn(
+                f"{MAX_CONVERSATION_TURNS}번의 턴 안에 검증을 통과한 응답이 없어 "
+                f"가장 나은 응답(점수 {best_score})을 사용합니다."
+            )
+            return best_content
+
+        spinner.fail(f"{MAX_CONVERSATION_TURNS}번의 시도 후에도 유효한 README 콘텐츠를 생성하지 못했습니다.")
+        raise RuntimeError(f"{MAX_CONVERSATION_TURNS}번의 시도 후에도 유효한 README 콘텐츠를 생성하지 못했습니다.")
+
+    except Exception as e:
+        spinner.fail(f"{model} 대화 중 오류 발생: {e}")
+        raise
@@ -0,0 +1,153 @@
+import os
+import stat
+import sys
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+def _current_umask() -> int:
+    # umask는 바꿔야만 읽을 수 있으므로, batch 모드의 스레드가 생기기 전인 import 시점에 한 번만 읽는다.
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _current_umask()
+
+
+def _readme_mode(readme_path: Path) -> int:
+    """README에 줄 권한. 기존 파일의 권한을 유지하고, 새 파일은 일반 파일처럼 0o666에 umask를 적용한다."""
+    try:
+        return stat.S_IMODE(os.stat(readme_path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+class ReadmeOutput(ABC):
+    """
+    LLM이 생성하는 README를 조각 단위로 받아 내보내는 출력 대상.
+    write로 받은 조각은 commit으로 확정되며, 최종 README가 아니었던 턴의 조각은 discard로 버린다.
+    commit 없이 close되면(오류, 취소) 부분 출력을 정리한다.
+    """
+
+    def __init__(self):
+        self._parts: list[str] = []
+
+    @property
+    def streamed(self) -> str:
+        """지금까지 write로 받은 내용."""
+        return "".join(self._parts)
+
+    def write(self, chunk: str) -> None:
+        self._parts.append(chunk)
+        self._write(chunk)
+
+    def discard(self) -> None:
+        self._parts.clear()
+        self._discard()
+
+    @abstractmethod
+    def _write(self, chunk: str) -> None:
+        pass
+
+    @abstractmethod
+    def _discard(self) -> None:
+        pass
+
+    @abstractmethod
+    def commit(self, content: str) -> None:
+        """최종 README를 확정한다. 스트리밍한 내용과 다르면 content를 기준으로 맞춘다."""
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "ReadmeOutput":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class StdoutReadmeOutput(ReadmeOutput):
+    """조각이 도착하는 즉시 stdout으로 내보낸다. (--stdout)"""
+
+    def _write(self, chunk: str) -> None:
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+
+    def _discard(self) -> None:
+        # 이미 내보낸 내용은 되돌릴 수 없으므로 경고만 남긴다.
+        print(
+            "\n[경고] 위에 출력된 부분 결과는 최종 README가 아니므로 무시하세요.",
+            file=sys.stderr,
+        )
+
+    def commit(self, content: str) -> None:
+        streamed = self.streamed
+        if not streamed:
+            sys.stdout.write(content)
+        elif content.startswith(streamed):
+            sys.stdout.write(content[len(streamed):])
+        elif content != streamed:
+            self._discard()
+            sys.stdout.write(content)
+        sys.stdout.flush()
+
+
+class FileReadmeOutput(ReadmeOutput):
+    """
+    조각을 README 옆의 임시 파일에 바로 쓰고, commit할 때 원자적으로 이름을 바꾼다.
+    중간에 실패하면 기존 README는 그대로 남는다.
+    """
+
+    def __init__(self, readme_path: Path, existing_content: str | None = None):
+        super().__init__()
+        self.readme_path = readme_path
+        self.existing_content = existing_content
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=readme_path.parent, prefix=f".{readme_path.name}.", suffix=".tmp"
+        )
+        self._file = os.fdopen(fd, "w", encoding="utf-8")
+
+    def _write(self, chunk: str) -> None:
+        self._file.write(chunk)
+        self._file.flush()
+
+    def _discard(self) -> None:
+        self._file.seek(0)
+        self._file.truncate()
+
+    def commit(self, content: str) -> None:
+        if content != self.streamed:
+            self._discard()
+            self._file.write(content)
+        self._file.close()
+        if content == self.existing_content:
+            print(f"[정보] README 내용이 같아 파일을 다시 쓰지 않습니다: {self.readme_path}")
+            return
+        # mkstemp는 0600으로 만들므로 그대로 바꾸면 README가 다른 사용자에게 보이지 않는다.
+        os.chmod(self._tmp_path, _readme_mode(self.readme_path))
+        os.replace(self._tmp_path, self.readme_path)
+        self._tmp_path = None
+        print(f"[정보] README 갱신 완료: {self.readme_path}")
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+        if self._tmp_path:
+            try:
+                os.unlink(self._tmp_path)
+            except OSError:
+                pass
+            self._tmp_path = None
+
+
+def open_readme_output(
+    readme_path: Path, to_stdout: bool, existing_content: str | None = None
+) -> ReadmeOutput:
+    """--stdout 여부에 맞는 출력 대상을 만든다."""
+    if to_stdout:
+        return StdoutReadmeOutput()
+    return FileReadmeOutput(readme_path, existing_content)
@@ -0,0 +1,117 @@
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+# README가 아닌 대화(작업 안내, 인사, 후속 제안 등)로 보이는 줄
+_CHATTER_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"^(알겠습니다|네[,.!]|좋습니다|물론입니다|확인했습니다)",
+        r"(작업(을)? (진행|시작)|분석(을)? (진행|시작)|살펴보겠습니다|확인하겠습니다|작성하겠습니다|작업 중입니다)",
+        r"(README\.md (파일|내용)(을|의)? .*(입니다|다음과 같습니다))",
+        r"(도움이 되(었|셨)|더 필요한|추가로 (수정|요청)할)",
+        r"^(sure|okay|certainly|of course)[,.!]",
+        r"^(here is|here's|below is)\b",
+        r"\b(i will|i'll|let me)\b",
+        r"\b(hope this helps|let me know)\b",
+    )
+]
+_HEADING = re.compile(r"^#{1,6}\s+\S", re.MULTILINE)
+_LIST_ITEM = re.compile(r"^\s*([-*+]|\d+\.)\s+\S", re.MULTILINE)
+
+
+@dataclass
+class ValidationResult:
+    """README 검증 결과. score는 0~1이며 accepted이면 최종 README로 사용한다."""
+
+    score: float
+    accepted: bool
+    reasons: list[str] = field(default_factory=list)  # 감점 사유
+
+
+class ReadmeValidator(ABC):
+    """LLM 응답이 최종 README로 쓸 만한지 판단하는 검증기의 추상 기본 클래스."""
+
+    name = ""
+
+    @abstractmethod
+    def validate(self, content: str | None) -> ValidationResult:
+        pass
+
+
+class HeadingValidator(ReadmeValidator):
+    """'#'로 시작하는 응답이면 통과시키는 단순 검증기."""
+
+    name = "heading"
+
+    def validate(self, content: str | None) -> ValidationResult:
+        if content and content.lstrip().startswith("#"):
+            return ValidationResult(score=1.0, accepted=True)
+        return ValidationResult(score=0.0, accepted=False, reasons=["'#' 제목으로 시작하지 않음"])
+
+
+class HeuristicReadmeValidator(ReadmeValidator):
+    """
+    마크다운 구조, 제목 유무, 대화성 문장 유무, 최소 길이로 점수를 매기는 검증기.
+    첫 줄이 제목이 아니면 통과시키지 않으며, 나머지 항목 점수를 더해 threshold 이상이면 통과한다.
+    """
+
+    name = "heuristic"
+
+    def __init__(self, min_length: int = 200, threshold: float = 0.6):
+        self.min_length = min_length
+        self.threshold = threshold
+
+    def validate(self, content: str | None) -> ValidationResult:
+        text = (content or "").strip()
+        if not text:
+            return ValidationResult(score=0.0, accepted=False, reasons=["응답 없음"])
+
+        score = 0.0
+        reasons: list[str] = []
+        starts_with_heading = text.startswith("#")
+        if starts_with_heading:
+            score += 0.4
+        else:
+            reasons.append("'#' 제목으로 시작하지 않음")
+
+        headings = len(_HEADING.findall(text))
+        if headings >= 2 or (headings and (_LIST_ITEM.search(text) or "```" in text)):
+            score += 0.2
+        else:
+            reasons.append("마크다운 구조(소제목, 목록, 코드 블록) 부족")
+
+        # 응답의 처음과 끝 몇 줄만 본다. (README 본문 예시 속 문장까지 감점하지 않도록)
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        edges = lines[:2] + lines[-2:]
+        if not any(p.search(line) for line in edges for p in _CHATTER_PATTERNS):
+            score += 0.2
+        else:
+            reasons.append("README가 아닌 대화 문장 포함")
+
+        if len(text) >= self.min_length:
+            score += 0.2
+        else:
+            reasons.append(f"길이가 {self.min_length}자 미만")
+
+        return ValidationResult(
+            score=round(score, 2),
+            accepted=starts_with_heading and score >= self.threshold,
+            reasons=reasons,
+        )
+
+
+# CLI에서 선택할 수 있는 검증기. 키는 --readme-validator에 쓰는 이름이다.
+VALIDATORS = {
+    HeuristicReadmeValidator.name: HeuristicReadmeValidator,
+    HeadingValidator.name: HeadingValidator,
+}
+DEFAULT_VALIDATOR = HeuristicReadmeValidator.name
+
+
+def get_validator(name: str = DEFAULT_VALIDATOR) -> ReadmeValidator:
+    """지정된 이름의 README 검증기 인스턴스를 반환합니다."""
+    validator_class = VALIDATORS.get(name.lower())
+    if not validator_class:
+        raise ValueError(f"알 수 없는 README 검증기입니다: {name}")
+    return validator_class()
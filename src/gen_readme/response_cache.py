@@ -0,0 +1,116 @@
+import hashlib
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .collect_cache import MISS, CollectionCache
+from .temp_utils import FileHeader
+
+# 응답 캐시 기본 유효 기간과 전체 크기 상한
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60  # 7일
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64MB
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+
+def merkle_root(leaves: list[bytes]) -> bytes:
+    """leaf 해시 목록의 Merkle 루트. 홀수 개인 단계에서는 마지막 노드를 그대로 올린다."""
+    if not leaves:
+        return _digest(b"")
+    level = leaves
+    while len(level) > 1:
+        paired = [_digest(level[i] + level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+class ContextFingerprint:
+    """
+    컨텍스트 스트림을 그대로 흘려보내면서 파일별 해시(leaf)로 Merkle 루트를 계산한다.
+    leaf는 (헤더의 파일 경로, 내용)으로 만들므로 임시 파일 경로나 샤드 분할과 무관하다.
+    """
+
+    def __init__(self):
+        self._leaves: list[bytes] = []
+        self._current = None  # 현재 파일 내용의 해시 객체
+
+    def _close_leaf(self) -> None:
+        if self._current is not None:
+            self._leaves.append(self._current.digest())
+            self._current = None
+
+    def wrap(self, stream: Iterable[str]) -> Iterator[str]:
+        for chunk in stream:
+            if isinstance(chunk, FileHeader):
+                self._close_leaf()
+                self._current = hashlib.blake2b(digest_size=32)
+            elif self._current is None:
+                # 헤더 없이 시작하는 내용도 하나의 leaf로 묶는다.
+                self._current = hashlib.blake2b(digest_size=32)
+            self._current.update(chunk.encode("utf-8"))
+            yield chunk
+        self._close_leaf()
+
+    @property
+    def files(self) -> int:
+        return len(self._leaves)
+
+    def hexdigest(self) -> str:
+        """스트림을 모두 소비한 뒤 호출한다."""
+        return merkle_root(self._leaves).hex()
+
+
+def response_key(
+    provider: str,
+    prompt: str,
+    request: str | None,
+    template: str | None,
+    context_fingerprint: str,
+) -> str:
+    """제공자, 프롬프트, 추가 요청, 템플릿, 컨텍스트 fingerprint로 만든 응답 캐시 키."""
+    h = hashlib.blake2b(digest_size=32)
+    for part in (provider.lower(), prompt, request or "", template or "", context_fingerprint):
+        data = part.encode("utf-8")
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return f"response:{h.hexdigest()}"
+
+
+class ResponseCache:
+    """
+    LLM이 생성한 README 전체를 보관하는 캐시.
+    저장 후 ttl_seconds가 지난 항목은 사용하지 않고, 전체 크기는 max_bytes를 넘지 않도록
+    오래 사용하지 않은 항목부터 지운다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._store = CollectionCache(cache_dir, max_bytes=max_bytes, namespace="responses")
+
+    def get(self, key: str, existing_readme: str | None = None) -> str | None:
+        """
+        캐시된 README를 반환한다. 기존 README가 있는데 캐시된 결과와 다르면
+        (사용자가 README를 직접 고친 경우) 그 내용을 반영해야 하므로 None을 반환한다.
+        """
+        entry = self._store.get(key)
+        if entry is MISS:
+            return None
+        meta, text = entry
+        if text is None or time.time() - meta.get("created", 0) > self.ttl_seconds:
+            return None
+        if existing_readme is not None and existing_readme != text:
+            return None
+        return text
+
+    def put(self, key: str, readme: str) -> None:
+        self._store.put(key, {"created": time.time()}, readme)
+        self._store.prune()
@@ -0,0 +1,546 @@
+import asyncio
+import contextlib
+import fnmatch
+import posixpath
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+from . import profiling
+from .config import DEFAULT_README_NAME, DEFAULT_SECTION_JOBS
+from .context_planner import (
+    _CONFIG_EXTENSIONS,
+    _DOC_EXTENSIONS,
+    TIER_ESSENTIAL,
+    TIER_HIGH,
+    TIER_LOW,
+    classify,
+    plan_files,
+    stream_planned_files,
+)
+from .dedupe import duplicate_of
+from .dir_text_collector import format_file_header, format_file_stream
+from .providers import LLMCallStats, ReadmeProvider
+from .readme_validator import HeadingValidator
+from .skeleton import SKELETON_NOTICE, python_skeleton
+from .temp_utils import TempDirManager
+
+# 목차를 정하는 호출에 보내는 핵심 파일의 토큰 예산 (짧은 호출로 끝나도록)
+OUTLINE_MAX_TOKENS = 8000
+# 모든 섹션 컨텍스트에 붙이는 파일 목록의 최대 항목 수
+MAX_TREE_ENTRIES = 500
+# 계획 호출이 이보다 적은 섹션을 내면 기본 목차를 사용한다.
+MIN_SECTIONS = 2
+# 합칠 때 이보다 짧은 문단은 중복이어도 남긴다. (짧은 안내 문장이 우연히 같은 경우, 코드 블록은 길이와 관계없이 뺀다)
+MIN_DEDUPE_CHARS = 40
+
+_FENCE = re.compile(r"^\s*(```|~~~)")
+_HEADING_LINE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_TITLE_NOISE = re.compile(r"^[\s\d.)\-:#]+|[^\w\s가-힣]", re.UNICODE)
+_FILES_LINE = re.compile(r"^\s*[-*]?\s*(파일|files?)\s*[:：]\s*(.+)$", re.IGNORECASE)
+
+# 섹션 제목 키워드로 정한 섹션 종류. 앞에 있는 종류가 우선한다.
+_KIND_KEYWORDS = (
+    (
+        "installation",
+        ("설치", "시작하기", "요구 사항", "요구사항", "의존성", "install", "setup", "getting started", "requirement"),
+    ),
+    ("usage", ("사용", "예제", "예시", "실행", "명령", "usage", "example", "cli", "quick start", "quickstart")),
+    ("configuration", ("설정", "환경 변수", "config", "environment", "settings")),
+    ("api", ("api", "인터페이스", "레퍼런스", "모듈", "클래스", "함수", "interface", "reference")),
+    (
+        "architecture",
+        ("아키텍처", "구조", "설계", "흐름", "동작 방식", "구성 요소", "도메인", "architecture", "structure", "design"),
+    ),
+    ("development", ("개발", "테스트", "기여", "빌드", "development", "testing", "contributing", "build")),
+    ("overview", ("개요", "소개", "기능", "overview", "introduction", "about", "feature")),
+)
+_INSTALL_NAMES = {
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "package.json",
+    "Cargo.toml",
+    "go.mod",
+    "Dockerfile",
+    "Makefile",
+    "docker-compose.yml",
+    "docker-compose.yaml",
+    "environment.yml",
+    "Pipfile",
+    "tox.ini",
+    "noxfile.py",
+}
+_USAGE_STEMS = {"__main__", "cli", "main", "app", "cmd", "command", "commands", "server", "config", "settings"}
+_EXAMPLE_DIRS = {"examples", "example", "samples", "sample", "docs", "doc"}
+
+
+@dataclass
+class Section:
+    """README 목차의 섹션 하나."""
+
+    title: str
+    description: str = ""  # 계획 호출이 준 한 줄 설명
+    patterns: tuple[str, ...] = ()  # 계획 호출이 지정한 관련 파일 (경로 또는 glob)
+    template_body: str | None = None  # 템플릿에서 가져온 이 섹션의 본문
+
+    @property
+    def kind(self) -> str:
+        return section_kind(self.title, self.description)
+
+
+@dataclass
+class Outline:
+    """README 제목과 섹션 목록. source는 목차를 정한 곳이다. ("template", "plan", "default")"""
+
+    title: str | None
+    sections: list[Section] = field(default_factory=list)
+    source: str = "default"
+
+
+DEFAULT_SECTIONS = (
+    ("개요", "프로젝트의 역할과 주요 기능"),
+    ("아키텍처", "주요 모듈과 구성 요소, 처리 흐름"),
+    ("설치", "요구 사항과 설치 방법"),
+    ("사용법", "CLI나 코드에서 사용하는 방법과 예제"),
+    ("API", "공개 모듈, 클래스, 함수 인터페이스"),
+)
+
+
+def section_kind(title: str, description: str = "") -> str:
+    """섹션 제목(없으면 설명)의 키워드로 섹션 종류를 정한다. 알 수 없으면 "general"."""
+    for text in (title.lower(), description.lower()):
+        for kind, keywords in _KIND_KEYWORDS:
+            if any(keyword in text for keyword in keywords):
+                return kind
+    return "general"
+
+
+def normalize_title(title: str) -> str:
+    """비교용 섹션 제목. 앞 번호, 이모지와 문장 부호, 대소문자, 공백 차이를 없앤다."""
+    return " ".join(_TITLE_NOISE.sub(" ", title).lower().split())
+
+
+def _iter_fenced(lines: list[str]) -> Iterator[tuple[str, bool]]:
+    """(줄, 코드 블록 안인지 여부). 코드 블록의 시작/끝 줄도 안쪽으로 본다."""
+    in_fence = False
+    for line in lines:
+        if _FENCE.match(line):
+            yield line, True
+            in_fence = not in_fence
+        else:
+            yield line, in_fence
+
+
+def split_markdown_sections(text: str) -> tuple[str | None, list[tuple[str, str]]]:
+    """
+    마크다운을 ("# " 제목, [("## " 제목, 본문), ...])으로 나눈다. 코드 블록 안의 '#'는 제목으로 보지 않으며,
+    첫 "## " 앞의 내용은 버린다.
+    """
+    title = None
+    sections: list[tuple[str, list[str]]] = []
+    for line, in_fence in _iter_fenced(text.splitlines()):
+        match = None if in_fence else _HEADING_LINE.match(line)
+        if match and len(match.group(1)) == 1 and title is None and not sections:
+            title = match.group(2)
+        elif match and len(match.group(1)) == 2:
+            sections.append((match.group(2), []))
+        elif sections:
+            sections[-1][1].append(line)
+    return title, [(heading, "\n".join(body).strip()) for heading, body in sections]
+
+
+def _unique(sections: Iterable[Section]) -> list[Section]:
+    seen = set()
+    unique = []
+    for section in sections:
+        key = normalize_title(section.title)
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(section)
+    return unique
+
+
+def outline_from_template(template: str) -> Outline:
+    """README 템플릿의 "## " 제목으로 목차를 만든다. 각 섹션의 템플릿 본문은 해당 섹션 호출에만 전달한다."""
+    title, parts = split_markdown_sections(template)
+    sections = _unique(Section(heading, template_body=body or None) for heading, body in parts)
+    if len(sections) < MIN_SECTIONS:
+        raise ValueError(f"섹션 병렬 생성에 쓸 템플릿에는 '## ' 섹션 제목이 {MIN_SECTIONS}개 이상 있어야 합니다.")
+    return Outline(title, sections, source="template")
+
+
+def default_outline(title: str | None = None) -> Outline:
+    return Outline(title, [Section(t, d) for t, d in DEFAULT_SECTIONS], source="default")
+
+
+def parse_outline(response: str) -> Outline | None:
+    """
+    목차 호출의 응답("# 제목", "## 섹션", 설명 줄, "파일: ..." 줄)을 해석한다.
+    섹션이 MIN_SECTIONS개보다 적으면 None.
+    """
+    title, parts = split_markdown_sections(response)
+    sections = []
+    for heading, body in parts:
+        description, patterns = [], []
+        for line in body.splitlines():
+            match = _FILES_LINE.match(line)
+            if match:
+                patterns += [p.strip(" `'\"") for p in match.group(2).split(",") if p.strip(" `'\"")]
+            elif line.strip():
+                description.append(line.strip().lstrip("-* "))
+        sections.append(Section(heading, " ".join(description), tuple(patterns)))
+    sections = _unique(sections)
+    if len(sections) < MIN_SECTIONS:
+        return None
+    return Outline(title, sections, source="plan")
+
+
+# ----- 섹션별 컨텍스트 -----
+
+
+def _skeleton_or_text(relative_path: str, text: str) -> str:
+    if relative_path.endswith(".py") and not text.startswith(SKELETON_NOTICE):
+        return python_skeleton(text) or text
+    return text
+
+
+def _matches(relative_path: str, patterns: tuple[str, ...]) -> bool:
+    name = posixpath.basename(relative_path)
+    return any(
+        fnmatch.fnmatch(relative_path, p)
+        or fnmatch.fnmatch(name, p)
+        or relative_path.startswith(p.rstrip("/") + "/")
+        for p in patterns
+    )
+
+
+def _select_mode(kind: str, relative_path: str, tier: int) -> str | None:
+    """
+    섹션 종류별로 파일을 어떻게 넣을지 정한다. "full"이면 전체, "skeleton"이면 (파이썬은) 시그니처 요약, None이면 제외.
+    """
+    parts = relative_path.split("/")
+    name = parts[-1]
+    stem, ext = posixpath.splitext(name)
+    is_doc = ext in _DOC_EXTENSIONS
+    is_config = ext in _CONFIG_EXTENSIONS or "config" in stem or "settings" in stem or name.startswith(".env")
+
+    if kind == "overview":
+        if tier == TIER_ESSENTIAL or (is_doc and tier != TIER_LOW):
+            return "full"
+        return "skeleton" if name == "__init__.py" else None
+    if kind == "installation":
+        if name in _INSTALL_NAMES or (name.startswith("requirements") and ext == ".txt") or name.startswith(".env"):
+            return "full"
+        if tier == TIER_ESSENTIAL or (is_doc and "install" in relative_path.lower()):
+            return "full"
+        return None
+    if kind == "usage":
+        if tier == TIER_ESSENTIAL or stem in _USAGE_STEMS or any(p in _EXAMPLE_DIRS for p in parts[:-1]):
+            return "full"
+        return "skeleton" if name == "__init__.py" else None
+    if kind == "configuration":
+        if tier != TIER_LOW and is_config:
+            return "full"
+        if tier == TIER_ESSENTIAL:
+            return "full"
+        return "skeleton" if stem in _USAGE_STEMS else None
+    if kind == "development":
+        if tier == TIER_LOW:
+            return "skeleton"
+        if name in _INSTALL_NAMES or "contributing" in relative_path.lower():
+            return "full"
+        return None
+    # api, architecture, general: 저장소 전체를 요약본으로 본다.
+    if tier == TIER_LOW:
+        return None
+    if tier in (TIER_ESSENTIAL, TIER_HIGH):
+        return "full" if kind != "api" or not is_doc else None
+    return "skeleton"
+
+
+def select_files(
+    section: Section,
+    files: list[tuple[str, str]],
+    entry_modules: set[str] = frozenset(),
+) -> list[tuple[str, str]]:
+    """
+    섹션에 관련된 파일만 고른다. 계획 호출이 지정한 파일은 종류와 관계없이 전체 내용을 넣는다.
+    중복 제거로 대체된 파일을 고르면 참조하는 대표 파일도 같은 방식으로 함께 넣는다.
+    """
+    kind = section.kind
+    modes: dict[str, str] = {}
+    for relative_path, text in files:
+        if relative_path == DEFAULT_README_NAME:
+            continue  # 기존 README는 해당 섹션만 따로 전달한다.
+        if section.patterns and _matches(relative_path, section.patterns):
+            modes[relative_path] = "full"
+            continue
+        mode = _select_mode(kind, relative_path, classify(relative_path, entry_modules))
+        if mode in ("full", "skeleton"):
+            modes[relative_path] = mode
+
+    # 대표 파일이 다시 다른 파일을 참조할 수 있으므로 더 추가할 것이 없을 때까지 따라간다.
+    texts = dict(files)
+    pending = list(modes)
+    while pending:
+        relative_path = pending.pop()
+        reference = duplicate_of(texts[relative_path])
+        if reference in texts and reference not in modes and reference != DEFAULT_README_NAME:
+            modes[reference] = modes[relative_path]
+            pending.append(reference)
+
+    selected = []
+    for relative_path, text in files:
+        mode = modes.get(relative_path)
+        if mode == "full":
+            selected.append((relative_path, text))
+        elif mode == "skeleton":
+            selected.append((relative_path, _skeleton_or_text(relative_path, text)))
+    return selected
+
+
+def format_tree(files: list[tuple[str, str]]) -> list[str]:
+    """모든 섹션 컨텍스트에 붙이는 전체 파일 목록. (헤더, 목록) 두 조각이다."""
+    lines = [f"- {path}" for path, _ in files[:MAX_TREE_ENTRIES]]
+    if len(files) > MAX_TREE_ENTRIES:
+        lines.append(f"- ... 외 {len(files) - MAX_TREE_ENTRIES}개 파일")
+    return [format_file_header("(패키지 전체 파일 목록)"), "\n".join(lines) + "\n"]
+
+
+def outline_context(
+    files: list[tuple[str, str]],
+    entry_modules: set[str] = frozenset(),
+) -> Iterator[str]:
+    """목차 호출의 컨텍스트: 파일 목록과 (기존 README를 포함한) 핵심 파일."""
+    yield from format_tree(files)
+    core = [
+        (path, text)
+        for path, text in files
+        if classify(path, entry_modules) == TIER_ESSENTIAL or path.endswith(tuple(_DOC_EXTENSIONS))
+    ]
+    yield from format_file_stream(plan_files(core, OUTLINE_MAX_TOKENS, entry_modules))
+
+
+def section_context(
+    section: Section,
+    files: list[tuple[str, str]],
+    tree: list[str],
+    existing_body: str | None = None,
+    entry_modules: set[str] = frozenset(),
+    max_tokens: int | None = None,
+) -> Iterator[str]:
+    """섹션 호출 하나의 컨텍스트: 템플릿과 기존 README의 해당 섹션, 파일 목록, 관련 파일."""
+    if section.template_body:
+        yield format_file_header(f"(README 템플릿의 '{section.title}' 섹션)")
+        yield section.template_body + "\n"
+    if existing_body:
+        yield format_file_header(f"(기존 README의 '{section.title}' 섹션)")
+        yield existing_body + "\n"
+    yield from tree
+    selected = select_files(section, files, entry_modules)
+    if max_tokens:
+        yield from stream_planned_files(selected, max_tokens, entry_modules)
+    else:
+        yield from format_file_stream(selected)
+
+
+# ----- 합치기 -----
+
+
+def normalize_section(title: str, response: str) -> str:
+    """
+    섹션 응답을 "## title"로 시작하도록 맞춘다. 첫 제목 앞의 대화 문장과 LLM이 붙인 섹션 제목은 버리고,
+    본문의 제목은 "###" 이하가 되도록 단계를 낮춘다.
+    """
+    lines = response.strip().splitlines()
+    headings = [
+        (i, len(m.group(1)))
+        for i, (line, in_fence) in enumerate(_iter_fenced(lines))
+        if not in_fence and (m := _HEADING_LINE.match(line))
+    ]
+    if headings:
+        first, level = headings[0]
+        lines = lines[first + 1:] if level <= 2 else lines[first:]
+    shift = 0
+    levels = [
+        len(m.group(1))
+        for line, in_fence in _iter_fenced(lines)
+        if not in_fence and (m := _HEADING_LINE.match(line))
+    ]
+    if levels:
+        shift = max(0, 3 - min(levels))
+    body = []
+    for line, in_fence in _iter_fenced(lines):
+        match = None if in_fence else _HEADING_LINE.match(line)
+        if match and shift:
+            line = "#" * min(6, len(match.group(1)) + shift) + " " + match.group(2)
+        body.append(line)
+    return f"## {title}\n\n" + "\n".join(body).strip() + "\n"
+
+
+def _blocks(text: str) -> list[str]:
+    """빈 줄로 나눈 문단 목록. 코드 블록은 빈 줄이 있어도 하나로 둔다."""
+    blocks, current = [], []
+    for line, in_fence in _iter_fenced(text.splitlines()):
+        if not line.strip() and not in_fence:
+            if current:
+                blocks.append("\n".join(current))
+                current = []
+        else:
+            current.append(line)
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+def _heading_level(block: str) -> int | None:
+    match = _HEADING_LINE.match(block) if "\n" not in block else None
+    return len(match.group(1)) if match else None
+
+
+def merge_sections(title: str, sections: list[tuple[str, str]]) -> str:
+    """
+    정규화한 섹션들을 목차 순서대로 합친다. 앞 섹션에 이미 나온 문단이나 코드 블록(설치 명령 등)은
+    뒤 섹션에서 빼고, 그 때문에 내용이 없어진 하위 제목도 뺀다.
+    """
+    seen: set[str] = set()
+    merged = [f"# {title}"]
+    for _, body in sections:
+        kept = []
+        for block in _blocks(body):
+            key = " ".join(block.split()).lower()
+            is_code = _FENCE.match(block) is not None
+            if _heading_level(block) is None and (is_code or len(key) >= MIN_DEDUPE_CHARS):
+                if key in seen:
+                    continue
+                seen.add(key)
+            kept.append(block)
+        # 다음 블록이 같거나 높은 단계의 제목이면(또는 끝이면) 빈 하위 제목이다.
+        cleaned = []
+        for i, block in enumerate(kept):
+            level = _heading_level(block)
+            if level and level > 2:
+                following = kept[i + 1] if i + 1 < len(kept) else None
+                next_level = _heading_level(following) if following is not None else 0
+                if following is None or (next_level and next_level <= level):
+                    continue
+            cleaned.append(block)
+        merged.append("\n\n".join(cleaned))
+    return "\n\n".join(merged).rstrip() + "\n"
+
+
+# ----- 실행 -----
+
+
+async def call_llm_limited(
+    provider: ReadmeProvider,
+    prompt: str,
+    context_dir: str,
+    stats: LLMCallStats,
+    slots: list,
+    span: str,
+    **span_args,
+) -> str:
+    """LLM 호출 하나. slots의 세마포어(섹션 동시 호출 수, batch의 전체 LLM 동시 호출 수)를 모두 잡고 실행한다."""
+    call_stats = LLMCallStats()
+    async with contextlib.AsyncExitStack() as stack:
+        for slot in slots:
+            await stack.enter_async_context(slot)
+        with profiling.span(span, cat="llm", concurrent=True, **span_args) as call_span:
+            content = await provider.call_llm_async(prompt, context_dirs=[context_dir], stats=call_stats)
+            call_span.set(turns=call_stats.turns, bytes=len(content.encode("utf-8")))
+    stats.turns += call_stats.turns
+    return content
+
+
+async def plan_outline(
+    provider: ReadmeProvider,
+    files: list[tuple[str, str]],
+    request: str | None,
+    updating: bool,
+    temp_manager: TempDirManager,
+    stats: LLMCallStats,
+    entry_modules: set[str] = frozenset(),
+    llm_slots: asyncio.Semaphore | None = None,
+) -> Outline:
+    """짧은 LLM 호출로 목차를 정한다. 응답을 해석할 수 없으면 기본 목차를 사용한다."""
+    provider = provider.with_validator(HeadingValidator())
+    paths = temp_manager.save_content_to_temp_files(outline_context(files, entry_modules))
+    prompt = provider.build_prompt_outline(paths, request, updating)
+    response = await call_llm_limited(
+        provider, prompt, temp_manager.temp_dir, stats, [s for s in (llm_slots,) if s], "llm.outline"
+    )
+    outline = parse_outline(response)
+    if outline is None:
+        print("[경고] 목차 응답을 해석하지 못해 기본 목차를 사용합니다.", file=sys.stderr)
+        return default_outline()
+    return outline
+
+
+async def generate_sections_async(
+    provider: ReadmeProvider,
+    outline: Outline,
+    files: list[tuple[str, str]],
+    request: str | None,
+    temp_manager: TempDirManager,
+    stats: LLMCallStats,
+    title: str,
+    existing_readme: str | None = None,
+    entry_modules: set[str] = frozenset(),
+    max_tokens: int | None = None,
+    jobs: int = DEFAULT_SECTION_JOBS,
+    llm_slots: asyncio.Semaphore | None = None,
+) -> str:
+    """
+    목차의 섹션들을 동시에 생성하고 목차 순서대로 합친 README를 반환한다.
+    섹션마다 관련 파일만 담은 컨텍스트를 따로 저장하므로, 섹션 호출 하나는 전체 컨텍스트보다 훨씬 작다.
+    하나라도 실패하면 일부만 합친 README를 쓰지 않고 RuntimeError를 낸다.
+    """
+    # 섹션 응답은 README 전체가 아니므로 제목으로 시작하는지만 확인한다.
+    provider = provider.with_validator(HeadingValidator())
+    existing = {}
+    if existing_readme:
+        _, parts = split_markdown_sections(existing_readme)
+        existing = {normalize_title(heading): body for heading, body in parts}
+
+    tree = format_tree(files)
+    titles = [section.title for section in outline.sections]
+    prompts = []
+    for section in outline.sections:
+        paths = temp_manager.save_content_to_temp_files(
+            section_context(
+                section,
+                files,
+                tree,
+                existing.get(normalize_title(section.title)),
+                entry_modules,
+                max_tokens,
+            )
+        )
+        prompts.append(provider.build_prompt_section(paths, request, section.title, section.description, titles))
+
+    print(
+        f"[정보] {len(outline.sections)}개 섹션을 최대 {jobs}개씩 동시에 생성합니다: {', '.join(titles)}",
+        file=sys.stderr,
+    )
+    slots = [asyncio.Semaphore(max(1, jobs))] + ([llm_slots] if llm_slots else [])
+    results = await asyncio.gather(
+        *(
+            call_llm_limited(provider, prompt, temp_manager.temp_dir, stats, slots, "llm.section", section=section.title)
+            for section, prompt in zip(outline.sections, prompts)
+        ),
+        return_exceptions=True,
+    )
+    failures = [
+        f"'{section.title}' ({result})"
+        for section, result in zip(outline.sections, results)
+        if isinstance(result, BaseException)
+    ]
+    if failures:
+        raise RuntimeError(f"섹션 생성에 실패했습니다: {', '.join(failures)}")
+    return merge_sections(
+        title,
+        [(section.title, normalize_section(section.title, body)) for section, body in zip(outline.sections, results)],
+    )
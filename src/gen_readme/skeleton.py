@@ -0,0 +1,149 @@
+import ast
+
+# 본문이 생략되었음을 LLM에게 알리는 첫 줄
+SKELETON_NOTICE = "# [skeleton] 함수/메서드 본문은 생략되었습니다. 시그니처, docstring, CLI 정의만 남아 있습니다.\n"
+# 이보다 긴 상수 값은 `NAME = ...`으로 줄인다.
+MAX_CONSTANT_SOURCE = 200
+
+# argparse/click 등 CLI를 정의하는 호출 이름
+_CLI_CALLS = {
+    "ArgumentParser",
+    "add_argument",
+    "add_argument_group",
+    "add_mutually_exclusive_group",
+    "add_parser",
+    "add_subparsers",
+    "set_defaults",
+    "command",
+    "group",
+    "option",
+    "argument",
+}
+
+
+def _call_name(node: ast.AST | None) -> str | None:
+    if not isinstance(node, ast.Call):
+        return None
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    if isinstance(func, ast.Name):
+        return func.id
+    return None
+
+
+def _is_cli_statement(stmt: ast.stmt) -> bool:
+    if isinstance(stmt, (ast.Expr, ast.Assign, ast.AnnAssign)):
+        return _call_name(stmt.value) in _CLI_CALLS
+    return False
+
+
+def _docstring_node(body: list[ast.stmt]) -> list[ast.stmt]:
+    if (
+        body
+        and isinstance(body[0], ast.Expr)
+        and isinstance(body[0].value, ast.Constant)
+        and isinstance(body[0].value.value, str)
+    ):
+        return [body[0]]
+    return []
+
+
+def _is_main_guard(stmt: ast.stmt) -> bool:
+    """`if __name__ == "__main__":` 블록인지 여부."""
+    if not isinstance(stmt, ast.If) or not isinstance(stmt.test, ast.Compare):
+        return False
+    left = stmt.test.left
+    return isinstance(left, ast.Name) and left.id == "__name__"
+
+
+def _is_import_block(stmt: ast.stmt) -> bool:
+    """`try: import x / except ImportError: ...`처럼 import만 담은 블록인지 여부."""
+    if not isinstance(stmt, (ast.Try, ast.If)):
+        return False
+    return all(
+        isinstance(s, (ast.Import, ast.ImportFrom, ast.Assign, ast.Pass, ast.Try))
+        for s in stmt.body
+    ) and any(isinstance(s, (ast.Import, ast.ImportFrom)) for s in stmt.body)
+
+
+def _shorten_assignment(stmt: ast.stmt) -> ast.stmt:
+    """값이 긴 상수 할당은 값을 `...`로 바꾼다."""
+    if stmt.value is not None and len(ast.unparse(stmt.value)) > MAX_CONSTANT_SOURCE:
+        stmt.value = ast.Constant(value=Ellipsis)
+    return stmt
+
+
+def _is_kept_assignment(stmt: ast.stmt) -> bool:
+    """`__all__`, 대문자 상수, 타입 별칭처럼 공개 구조를 설명하는 할당인지 여부."""
+    if isinstance(stmt, ast.AnnAssign):
+        return isinstance(stmt.target, ast.Name)
+    if isinstance(stmt, ast.Assign):
+        names = [t.id for t in stmt.targets if isinstance(t, ast.Name)]
+        return bool(names) and all(n == "__all__" or n.isupper() for n in names)
+    return False
+
+
+def _skeleton_function(node: ast.FunctionDef | ast.AsyncFunctionDef) -> ast.stmt:
+    """시그니처와 docstring, 본문 안의 CLI 정의만 남긴다."""
+    cli_statements = sorted(
+        (
+            stmt
+            for stmt in ast.walk(node)
+            if stmt is not node and isinstance(stmt, ast.stmt) and _is_cli_statement(stmt)
+        ),
+        key=lambda s: (s.lineno, s.col_offset),
+    )
+    node.body = _docstring_node(node.body) + cli_statements
+    node.body.append(ast.Expr(value=ast.Constant(value=Ellipsis)))
+    return node
+
+
+def _skeleton_class(node: ast.ClassDef) -> ast.stmt:
+    body: list[ast.stmt] = _docstring_node(node.body)
+    for stmt in node.body[len(body):]:
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            body.append(_skeleton_function(stmt))
+        elif isinstance(stmt, ast.ClassDef):
+            body.append(_skeleton_class(stmt))
+        elif isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+            # 클래스 속성/데이터클래스 필드는 구조의 일부이므로 유지
+            body.append(_shorten_assignment(stmt))
+    if not body:
+        body.append(ast.Expr(value=ast.Constant(value=Ellipsis)))
+    node.body = body
+    return node
+
+
+def python_skeleton(text: str) -> str | None:
+    """
+    Python 소스에서 모듈 docstring, import, 클래스·함수 시그니처와 docstring,
+    `__all__`/상수, CLI 정의, `if __name__ == "__main__":` 블록만 남긴다.
+    파싱할 수 없거나 결과가 원본보다 짧지 않으면 None을 반환한다.
+    """
+    try:
+        module = ast.parse(text)
+    except (SyntaxError, ValueError):
+        return None
+
+    body: list[ast.stmt] = _docstring_node(module.body)
+    for stmt in module.body[len(body):]:
+        if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            body.append(stmt)
+        elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            body.append(_skeleton_function(stmt))
+        elif isinstance(stmt, ast.ClassDef):
+            body.append(_skeleton_class(stmt))
+        elif _is_kept_assignment(stmt):
+            body.append(_shorten_assignment(stmt))
+        elif _is_cli_statement(stmt) or _is_main_guard(stmt) or _is_import_block(stmt):
+            body.append(stmt)
+    module.body = body
+
+    try:
+        skeleton = SKELETON_NOTICE + ast.unparse(module) + "\n"
+    except (ValueError, RecursionError):
+        return None
+    if len(skeleton) >= len(text):
+        return None
+    return skeleton
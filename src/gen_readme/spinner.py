@@ -0,0 +1,49 @@
+import sys
+from typing import TextIO
+
+
+class _LineSpinner:
+    """
+    터미널이 아닐 때(git hook, CI, 로그 파일로 리다이렉트) 사용하는 진행 표시.
+    애니메이션 없이 완료/경고/실패 메시지만 한 줄씩 출력하며, halo를 import하지 않는다.
+    """
+
+    def __init__(self, text: str, stream: TextIO):
+        self.text = text
+        self.stream = stream
+
+    def start(self) -> "_LineSpinner":
+        return self
+
+    def stop(self) -> "_LineSpinner":
+        return self
+
+    def _print(self, prefix: str, text: str | None) -> "_LineSpinner":
+        print(f"{prefix} {text if text is not None else self.text}", file=self.stream)
+        return self
+
+    def succeed(self, text: str | None = None) -> "_LineSpinner":
+        return self._print("[정보]", text)
+
+    def info(self, text: str | None = None) -> "_LineSpinner":
+        return self._print("[정보]", text)
+
+    def warn(self, text: str | None = None) -> "_LineSpinner":
+        return self._print("[경고]", text)
+
+    def fail(self, text: str | None = None) -> "_LineSpinner":
+        return self._print("[에러]", text)
+
+
+def start_spinner(text: str, stream: TextIO | None = None):
+    """
+    진행 표시를 시작한다. (README가 stdout으로 스트리밍될 수 있으므로 기본값은 stderr)
+    stream이 터미널일 때만 halo를 import해 애니메이션 spinner를 사용하므로,
+    --help나 캐시 적중처럼 LLM을 호출하지 않는 실행은 halo를 불러오는 비용을 내지 않는다.
+    """
+    stream = stream or sys.stderr
+    if not stream.isatty():
+        return _LineSpinner(text, stream)
+    from halo import Halo
+
+    return Halo(text=text, spinner="dots", stream=stream).start()
@@ -0,0 +1,380 @@
+import asyncio
+import posixpath
+import sys
+from dataclasses import dataclass, field
+
+from .config import DEFAULT_SUMMARY_JOBS
+from .context_planner import BYTES_PER_TOKEN, TIER_HIGH, classify, context_limit, estimate_tokens, plan_files
+from .dedupe import drop_dangling_duplicates
+from .dir_text_collector import format_file_stream
+from .providers import LLMCallStats, ReadmeProvider
+from .readme_validator import HeadingValidator
+from .response_cache import merkle_root
+from .sections import call_llm_limited
+from .summary_cache import SummaryCache, file_digest, summary_key
+from .temp_utils import TempDirManager
+
+# 요약 모드의 컨텍스트 중 원문 그대로 보내는 핵심 파일(패키지 메타데이터, 진입점, 문서)의 비율
+ENTRY_FILES_SHARE = 0.2
+# 요약 호출 하나에 보내는 최대 토큰 수. 이보다 작은 디렉터리는 하위 디렉터리까지 한 번에 요약한다.
+SUMMARY_UNIT_TOKENS = 32_000
+# 컨텍스트 창을 아주 작게 지정해도 요약 단위는 이보다 작아지지 않는다.
+MIN_SUMMARY_UNIT_TOKENS = 1_000
+
+ROOT_SCOPE = "(패키지 루트)"
+SUMMARY_NOTICE_PATH = "(디렉터리 요약 안내)"
+
+
+@dataclass
+class SummarizedContext:
+    """
+    README 생성 대화에 넣을 (경로, 내용) 목록.
+    summarized가 False이면 요약하지 않고 미리 수집만 한 원본 파일이다.
+    """
+
+    files: list[tuple[str, str]]
+    summarized: bool = False
+    source_tokens: int = 0  # 원본 컨텍스트의 추정 토큰 수
+    turns: int = 0  # 요약 호출들의 LLM 대화 턴 수
+    calls: int = 0
+    cache_hits: int = 0
+    failures: list[str] = field(default_factory=list)  # 요약에 실패해 파일 목록으로 대신한 범위
+
+
+@dataclass
+class _Node:
+    """디렉터리 하나. tokens는 하위 디렉터리까지 포함한 합이다."""
+
+    path: str  # 패키지 기준 posix 경로, 루트는 ""
+    files: list[tuple[str, str]] = field(default_factory=list)
+    children: dict[str, "_Node"] = field(default_factory=dict)
+    tokens: int = 0
+    digest: bytes = b""  # 하위 디렉터리까지 포함한 Merkle 해시 (요약 캐시 키)
+
+    @property
+    def scope(self) -> str:
+        return f"{self.path}/" if self.path else ROOT_SCOPE
+
+    def iter_files(self):
+        yield from self.files
+        for name in sorted(self.children):
+            yield from self.children[name].iter_files()
+
+
+def build_tree(files: list[tuple[str, str]]) -> _Node:
+    """(상대 경로, 내용) 목록을 디렉터리 트리로 묶는다. 디렉터리 안의 파일 순서는 원래 순서를 따른다."""
+    root = _Node("")
+    for relative_path, text in files:
+        tokens = estimate_tokens(text)
+        parts = relative_path.replace("\\", "/").split("/")
+        node = root
+        node.tokens += tokens
+        for part in parts[:-1]:
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _Node(posixpath.join(node.path, part))
+            node = child
+            node.tokens += tokens
+        node.files.append((relative_path, text))
+    _set_digests(root)
+    return root
+
+
+def _set_digests(node: _Node) -> bytes:
+    """
+    디렉터리마다 자기 파일과 하위 디렉터리 해시로 Merkle 해시를 계산한다.
+    파일 하나가 바뀌면 그 파일에서 루트까지의 디렉터리 해시만 바뀐다.
+    """
+    leaves = [file_digest(relative_path, text) for relative_path, text in node.files]
+    for name in sorted(node.children):
+        child_digest = _set_digests(node.children[name])
+        leaves.append(file_digest(name + "/", child_digest.hex()))
+    node.digest = merkle_root(leaves)
+    return node.digest
+
+
+def _split_text(relative_path: str, text: str, unit_tokens: int) -> list[tuple[str, str]]:
+    """unit_tokens보다 큰 파일을 줄 단위로 나눈다. 나눈 조각의 경로에는 "(i/n)"을 붙인다."""
+    max_bytes = unit_tokens * BYTES_PER_TOKEN
+    pieces: list[str] = []
+    current: list[str] = []
+    size = 0
+    for line in text.splitlines(keepends=True):
+        line_bytes = len(line.encode("utf-8"))
+        if line_bytes > max_bytes:
+            # 한 줄이 단위보다 긴 경우(minified 등): 글자 수로 자른다. (UTF-8 한 글자는 최대 4바이트)
+            step = max(1, max_bytes // 4)
+            segments = [line[i:i + step] for i in range(0, len(line), step)]
+        else:
+            segments = [line]
+        for segment in segments:
+            segment_bytes = len(segment.encode("utf-8"))
+            if current and size + segment_bytes > max_bytes:
+                pieces.append("".join(current))
+                current, size = [], 0
+            current.append(segment)
+            size += segment_bytes
+    if current:
+        pieces.append("".join(current))
+    if len(pieces) <= 1:
+        return [(relative_path, text)]
+    return [(f"{relative_path} ({i}/{len(pieces)})", piece) for i, piece in enumerate(pieces, 1)]
+
+
+def _pack(groups: list[list[tuple[str, str]]], unit_tokens: int) -> list[list[tuple[str, str]]]:
+    """파일 묶음들을 순서대로 unit_tokens 이하의 덩어리로 채운다. 묶음 하나는 나누지 않는다."""
+    chunks: list[list[tuple[str, str]]] = []
+    current: list[tuple[str, str]] = []
+    size = 0
+    for group in groups:
+        tokens = sum(estimate_tokens(text) for _, text in group)
+        if current and size + tokens > unit_tokens:
+            chunks.append(current)
+            current, size = [], 0
+        current += group
+        size += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _summary_blocks(summaries: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    return [(f"{scope} (요약)", text) for scope, text in summaries]
+
+
+def _fallback(scope: str, blocks: list[tuple[str, str]], merge: bool) -> str:
+    """요약 호출이 실패했을 때 대신 쓸 내용. 하위 요약은 그대로 잇고, 파일은 목록만 남긴다."""
+    if merge:
+        return f"## {scope}\n\n" + "\n\n".join(text for _, text in blocks)
+    listing = "\n".join(f"- {path} (약 {estimate_tokens(text)}토큰)" for path, text in blocks)
+    return f"## {scope}\n\n(요약하지 못해 파일 목록만 남김)\n\n{listing}"
+
+
+class _Summarizer:
+    """디렉터리 트리를 아래에서 위로 요약한다. (map: 파일 묶음 요약, reduce: 하위 요약 합치기)"""
+
+    def __init__(
+        self,
+        provider: ReadmeProvider,
+        request: str | None,
+        temp_manager: TempDirManager,
+        unit_tokens: int,
+        slots: list,
+        cache: SummaryCache | None = None,
+        cache_prefix: str = "",
+    ):
+        # 요약 응답은 README 전체가 아니므로 제목으로 시작하는지만 확인한다.
+        self.provider = provider.with_validator(HeadingValidator())
+        self.request = request
+        self.temp_manager = temp_manager
+        self.unit_tokens = unit_tokens
+        self.slots = slots
+        self.stats = LLMCallStats()
+        self.calls = 0
+        self.failures: list[str] = []
+        self.cache = cache
+        self.cache_prefix = cache_prefix
+        self.cache_hits = 0
+        # 실패를 대신한 내용과 그것을 합친 요약. 캐시에 넣지 않아 다음 실행에서 다시 요약한다.
+        self._degraded: set[str] = set()
+
+    def _key(self, kind: str, scope: str, digest: bytes) -> str:
+        return summary_key(self.cache_prefix, self.request or "", kind, scope, str(self.unit_tokens), digest.hex())
+
+    def _cached(self, key: str) -> str | None:
+        if self.cache is None:
+            return None
+        summary = self.cache.get(key)
+        if summary is not None:
+            self.cache_hits += 1
+        return summary
+
+    def _store(self, key: str, summary: str, scope: str, kind: str, tokens: int, files: int) -> None:
+        if self.cache is not None and summary not in self._degraded:
+            self.cache.put(key, summary, scope, kind, tokens, files)
+
+    async def summarize(
+        self, scope: str, blocks: list[tuple[str, str]], merge: bool, digest: bytes | None = None
+    ) -> tuple[str, str]:
+        """
+        blocks(파일 또는 하위 요약)의 요약 하나를 만든다. 실패하면 경고를 출력하고 대체 내용을 쓴다.
+        같은 입력(digest, 기본값은 blocks의 Merkle 해시)을 요약한 적이 있으면 캐시된 요약을 쓴다.
+        """
+        kind = "merge" if merge else ("chunk" if digest is None else "dir")
+        if not merge:
+            # 대표 파일이 다른 묶음에 들어가 참조만 남은 중복 파일은 뺀다. (모두 빠지면 그대로 둔다)
+            blocks = drop_dangling_duplicates(blocks)[0] or blocks
+        if digest is None:
+            digest = merkle_root([file_digest(path, text) for path, text in blocks])
+        key = self._key(kind, scope, digest)
+        cached = self._cached(key)
+        if cached is not None:
+            return scope, cached
+
+        paths = self.temp_manager.save_content_to_temp_files(format_file_stream(blocks), announce=False)
+        prompt = self.provider.build_prompt_summary(paths, self.request, scope, merge)
+        self.calls += 1
+        try:
+            content = await call_llm_limited(
+                self.provider,
+                prompt,
+                self.temp_manager.temp_dir,
+                self.stats,
+                self.slots,
+                "llm.summary",
+                scope=scope,
+                merge=merge,
+            )
+        except Exception as e:
+            self.failures.append(scope)
+            print(f"[경고] '{scope}' 요약 실패: {e} (요약 대신 {'하위 요약' if merge else '파일 목록'}을 사용합니다)", file=sys.stderr)
+            content = _fallback(scope, blocks, merge)
+            self._degraded.add(content.strip())
+        content = content.strip()
+        if any(text in self._degraded for _, text in blocks):
+            self._degraded.add(content)
+        tokens = sum(estimate_tokens(text) for _, text in blocks)
+        self._store(key, content, scope, kind, tokens, len(blocks))
+        return scope, content
+
+    async def parts(self, node: _Node) -> list[tuple[str, str]]:
+        """
+        node 바로 아래의 요약들. 단위보다 큰 하위 디렉터리는 각각 재귀적으로 요약하고,
+        node의 파일과 작은 하위 디렉터리는 단위 크기의 묶음으로 채워 한 번에 요약한다.
+        """
+        small: list[list[tuple[str, str]]] = []
+        for relative_path, text in node.files:
+            if estimate_tokens(text) > self.unit_tokens:
+                small += [[piece] for piece in _split_text(relative_path, text, self.unit_tokens)]
+            else:
+                small.append([(relative_path, text)])
+        large = []
+        for name in sorted(node.children):
+            child = node.children[name]
+            if child.tokens > self.unit_tokens:
+                large.append(child)
+            else:
+                small.append(list(child.iter_files()))
+
+        chunks = _pack(small, self.unit_tokens)
+        tasks = [
+            self.summarize(node.scope if len(chunks) == 1 else f"{node.scope} 일부 {i}/{len(chunks)}", chunk, False)
+            for i, chunk in enumerate(chunks, 1)
+        ]
+        tasks += [self.subtree(child) for child in large]
+        return list(await asyncio.gather(*tasks))
+
+    async def subtree(self, node: _Node) -> tuple[str, str]:
+        """
+        node 전체의 요약 하나. 디렉터리의 Merkle 해시가 같으면 하위 디렉터리를 훑지 않고 캐시된 요약을 쓴다.
+        """
+        if node.tokens <= self.unit_tokens:
+            return await self.summarize(node.scope, list(node.iter_files()), False, node.digest)
+        key = self._key("dir", node.scope, node.digest)
+        cached = self._cached(key)
+        if cached is not None:
+            return node.scope, cached
+        scope, summary = await self.reduce(node.scope, await self.parts(node))
+        self._store(key, summary, scope, "dir", node.tokens, sum(1 for _ in node.iter_files()))
+        return scope, summary
+
+    async def reduce(self, scope: str, summaries: list[tuple[str, str]]) -> tuple[str, str]:
+        """
+        요약들을 하나로 합친다. 한 번에 보내기에 너무 많으면 단위 크기로 나누어 합친 뒤 다시 합친다.
+        더 나눌 수 없으면(요약 하나가 단위만큼 큰 경우) 그대로 마지막 호출에 보낸다.
+        """
+        round_no = 0
+        while len(summaries) > 1 and sum(estimate_tokens(text) for _, text in summaries) > self.unit_tokens:
+            groups = _pack([[s] for s in summaries], self.unit_tokens)
+            if len(groups) == len(summaries):
+                break
+            round_no += 1
+            summaries = list(
+                await asyncio.gather(
+                    *(
+                        self.summarize(f"{scope} 부분 {round_no}-{i}", _summary_blocks(group), True)
+                        if len(group) > 1
+                        else asyncio.sleep(0, result=group[0])
+                        for i, group in enumerate(groups, 1)
+                    )
+                )
+            )
+        if len(summaries) == 1:
+            return scope, summaries[0][1]
+        return await self.summarize(scope, _summary_blocks(summaries), True)
+
+
+async def summarize_files(
+    provider: ReadmeProvider,
+    files: list[tuple[str, str]],
+    request: str | None,
+    temp_manager: TempDirManager,
+    window_tokens: int,
+    entry_modules: set[str] = frozenset(),
+    jobs: int = DEFAULT_SUMMARY_JOBS,
+    llm_slots: "asyncio.Semaphore | None" = None,
+    unit_tokens: int = SUMMARY_UNIT_TOKENS,
+    cache: SummaryCache | None = None,
+    cache_prefix: str = "",
+) -> SummarizedContext:
+    """
+    컨텍스트 창에 담을 수 없는 저장소를 디렉터리 단위로 요약한다. (map-reduce)
+    단위보다 작은 디렉터리는 한 번에, 큰 디렉터리는 파일 묶음과 하위 디렉터리를 동시에 요약한 뒤
+    디렉터리 트리를 따라 위로 합친다. 최종 컨텍스트는 핵심 파일(원문)과 최상위 요약들이다.
+    요약 호출이 실패해도 중단하지 않고 그 범위는 파일 목록(또는 하위 요약)으로 대신한다.
+    cache를 넘기면 입력이 같은 요약(바뀐 파일이 없는 디렉터리)은 다시 요약하지 않는다.
+    cache_prefix는 캐시 키에 넣어 제공자/모델별 요약을 구분한다.
+    """
+    source_tokens = sum(estimate_tokens(text) for _, text in files)
+    budget = context_limit(window_tokens)
+    entry_budget = int(budget * ENTRY_FILES_SHARE)
+    summary_budget = budget - entry_budget
+    unit_tokens = max(MIN_SUMMARY_UNIT_TOKENS, min(unit_tokens, summary_budget))
+
+    root = build_tree(files)
+    # src/pkg처럼 파일 없이 하위 디렉터리 하나만 있는 단계는 건너뛴다.
+    top = root
+    while not top.files and len(top.children) == 1:
+        top = next(iter(top.children.values()))
+
+    print(
+        f"[정보] 컨텍스트(약 {source_tokens}토큰)를 디렉터리별로 요약합니다. "
+        f"(한도 {budget}토큰, 요약 단위 {unit_tokens}토큰, 동시 {max(1, jobs)}개)",
+        file=sys.stderr,
+    )
+    slots = [asyncio.Semaphore(max(1, jobs))] + ([llm_slots] if llm_slots else [])
+    summarizer = _Summarizer(provider, request, temp_manager, unit_tokens, slots, cache, cache_prefix)
+    if top.tokens <= unit_tokens:
+        summaries = [await summarizer.subtree(top)]
+    else:
+        summaries = await summarizer.parts(top)
+    if sum(estimate_tokens(text) for _, text in summaries) > summary_budget:
+        summaries = [await summarizer.reduce(top.scope, summaries)]
+
+    # 핵심 파일은 요약 대신 원문을 보낸다. (설치 방법, 명령 이름 등은 요약에서 빠지기 쉽다)
+    important = [(path, text) for path, text in files if classify(path, entry_modules) >= TIER_HIGH]
+    entry_files = plan_files(important, entry_budget, entry_modules) if important and entry_budget else []
+
+    summary_tokens = sum(estimate_tokens(text) for _, text in summaries)
+    print(
+        f"[정보] 디렉터리 요약 완료: LLM 호출 {summarizer.calls}회, 캐시 적중 {summarizer.cache_hits}개, 요약 {len(summaries)}개(약 {summary_tokens}토큰), "
+        f"원문 핵심 파일 {len(entry_files)}개"
+        + (f", 실패 {len(summarizer.failures)}개" if summarizer.failures else ""),
+        file=sys.stderr,
+    )
+    notice = (
+        f"저장소가 커서(약 {source_tokens}토큰) 전체 코드 대신 핵심 파일의 원문과 디렉터리별 요약만 포함되어 있다.\n"
+        "경로 뒤에 '(디렉터리 요약)'이 붙은 항목은 해당 디렉터리의 코드를 미리 요약한 내용이다.\n"
+        "요약에 없는 세부 사항은 추측하지 말고, 요약과 핵심 파일에 나온 이름과 명령을 그대로 사용하라.\n"
+    )
+    return SummarizedContext(
+        files=[(SUMMARY_NOTICE_PATH, notice)]
+        + entry_files
+        + [(f"{scope} (디렉터리 요약)", text + "\n") for scope, text in summaries],
+        summarized=True,
+        source_tokens=source_tokens,
+        turns=summarizer.stats.turns,
+        calls=summarizer.calls,
+        cache_hits=summarizer.cache_hits,
+        failures=summarizer.failures,
+    )
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from .collect_cache import MISS, CollectionCache
+
+# 요약 캐시 전체 크기 상한. 요약 하나는 수 KB이므로 큰 모노레포 여러 개도 충분히 담는다.
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64MB
+NAMESPACE = "summaries"
+
+
+def file_digest(relative_path: str, text: str) -> bytes:
+    """Merkle 트리의 leaf. (경로, 수집한 내용)으로 만들므로 경로가 바뀌어도 다른 leaf가 된다."""
+    h = hashlib.blake2b(relative_path.encode("utf-8"), digest_size=32)
+    h.update(b"\0" + text.encode("utf-8"))
+    return h.digest()
+
+
+def summary_key(*parts: str) -> str:
+    """제공자, 추가 요청, 요약 범위, Merkle 해시 등으로 만든 요약 캐시 키."""
+    h = hashlib.blake2b(digest_size=32)
+    for part in parts:
+        data = part.encode("utf-8")
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return f"summary:{h.hexdigest()}"
+
+
+@dataclass
+class SummaryEntry:
+    """inspect용 요약 캐시 항목 하나."""
+
+    scope: str
+    kind: str  # "dir": 디렉터리 전체, "chunk": 파일 묶음, "merge": 하위 요약 합치기
+    tokens: int  # 요약한 입력의 추정 토큰 수
+    files: int  # 요약한 입력의 파일(또는 하위 요약) 수
+    size: int
+    last_used: float
+
+
+class SummaryCache:
+    """
+    디렉터리 요약(--summarize)의 LLM 결과를 보관하는 캐시.
+    키는 요약한 입력의 Merkle 해시이므로, 파일이 바뀌면 그 파일에서 루트까지의 디렉터리만 다시 요약하고
+    나머지 디렉터리는 이전 요약을 그대로 쓴다. 전체 크기는 max_bytes를 넘지 않도록
+    오래 사용하지 않은 항목부터 지운다.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._store = CollectionCache(cache_dir, max_bytes=max_bytes, namespace=NAMESPACE, auto_prune=False)
+
+    def get(self, key: str) -> str | None:
+        entry = self._store.get(key)
+        if entry is MISS:
+            return None
+        _, text = entry
+        return text
+
+    def put(self, key: str, summary: str, scope: str, kind: str, tokens: int, files: int) -> None:
+        meta = {"scope": scope, "kind": kind, "tokens": tokens, "files": files, "created": time.time()}
+        self._store.put(key, meta, summary)
+
+    def prune(self, max_bytes: Optional[int] = None, force: bool = False) -> int:
+        return self._store.prune(max_bytes, force)
+
+    def entries(self) -> list[SummaryEntry]:
+        """저장된 요약 목록. 헤더(메타데이터)만 읽는다."""
+        result = []
+        for path, size, last_used in self._store.entries():
+            try:
+                with open(path, "rb") as f:
+                    meta = json.loads(f.readline())
+            except (OSError, ValueError):
+                continue
+            result.append(
+                SummaryEntry(
+                    scope=meta.get("scope", "?"),
+                    kind=meta.get("kind", "?"),
+                    tokens=meta.get("tokens", 0),
+                    files=meta.get("files", 0),
+                    size=size,
+                    last_used=last_used,
+                )
+            )
+        return result
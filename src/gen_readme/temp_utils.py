@@ -1,15 +1,64 @@
+import contextlib
 import tempfile
 import os
 import shutil
 import sys
 from typing import List, Iterator, Optional
 
-CHUNK_SIZE = 16 * 1024  # 16KB
+from . import profiling
+
+# 샤드 하나의 기본 최대 크기. 파일 경계에서만 나누므로 큰 파일 하나는 이보다 클 수 있다.
+DEFAULT_SHARD_SIZE = 256 * 1024  # 256KB
+# 컨텍스트 스트림에서 파일 하나의 시작을 나타내는 헤더 접두사
+FILE_HEADER_PREFIX = "===== FILE: "
+# 기본 임시 디렉터리 후보 (메모리 기반 tmpfs)
+_TMPFS_DIR = "/dev/shm"
+
+
+def default_scratch_dir() -> Optional[str]:
+    """
+    샤드를 저장할 기본 디렉터리. 쓰기 가능한 /dev/shm(tmpfs)이 있으면 사용하고,
+    없으면 None을 반환하여 시스템 임시 디렉터리(TMPDIR 등)를 사용하게 한다.
+    """
+    if os.path.isdir(_TMPFS_DIR) and os.access(_TMPFS_DIR, os.W_OK | os.X_OK):
+        return _TMPFS_DIR
+    return None
+
+
+class FileHeader(str):
+    """
+    컨텍스트 스트림에서 파일 하나의 시작을 나타내는 헤더 조각.
+    내용 조각과 타입으로 구분하므로, 파일 내용이 "===== FILE: "로 시작해도 파일 경계로 보지 않는다.
+
+    :param text: 스트림에 쓰는 헤더 문자열
+    :param path: 샤드 목록에 적을 파일 경로(또는 설명)
+    """
+
+    path: str
+
+    def __new__(cls, text: str, path: str) -> "FileHeader":
+        header = super().__new__(cls, text)
+        header.path = path
+        return header
+
+
+def _format_shard_index(shard_number: int, paths: List[str]) -> str:
+    """샤드 맨 앞에 붙이는, 이 샤드에 담긴 파일 목록."""
+    lines = [f"===== CONTEXT PART {shard_number}: 포함된 파일 {len(paths)}개 ====="]
+    lines.extend(f"- {path}" for path in paths)
+    return "\n".join(lines) + "\n"
+
+
+def _shard_summary(paths: List[str]) -> dict:
+    """프로파일 구간 인자: 샤드 수와 저장한 바이트 수 (스트림 소비, 즉 수집 시간도 구간에 포함된다)."""
+    return {"shards": len(paths), "bytes": sum(os.path.getsize(p) for p in paths)}
 
 
 class TempDirManager:
     """
     임시 디렉터리 및 그 안의 파일 생성을 관리하고 사용 후 정리하는 컨텍스트 관리자.
+    임시 디렉터리는 분석 대상 패키지 밖(기본값: /dev/shm, 없으면 시스템 임시 디렉터리)에
+    만들어지므로 저장소를 더럽히거나 파일 감시기를 깨우지 않는다.
 
     사용 예시:
     with TempDirManager() as temp_manager:
@@ -18,14 +67,22 @@ class TempDirManager:
     # 'with' 블록을 빠져나가면 임시 디렉터리와 모든 파일이 자동으로 삭제됩니다.
     """
 
-    def __init__(self, root_dir: Optional[str] = None):
-        self._root_dir = root_dir
+    def __init__(
+        self,
+        scratch_dir: Optional[str] = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+    ):
+        self._scratch_dir = scratch_dir
+        self.shard_size = shard_size
         self.temp_dir: Optional[str] = None
         self.created_files: List[str] = []
+        # 정리할 임시 디렉터리들. tmpfs가 가득 차 시스템 임시 디렉터리로 옮기면 둘이 된다.
+        self._dirs: List[str] = []
 
     def __enter__(self) -> "TempDirManager":
+        scratch_dir = self._scratch_dir or default_scratch_dir()
         try:
-            self.temp_dir = tempfile.mkdtemp(dir=self._root_dir)
+            self._make_dir(scratch_dir)
             print(f"[정보] 임시 디렉터리가 생성되었습니다: {self.temp_dir}")
         except Exception as e:
             print(f"[에러] 임시 디렉터리 생성에 실패했습니다: {e}", file=sys.stderr)
@@ -35,77 +92,141 @@ class TempDirManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.cleanup()
 
+    def _make_dir(self, scratch_dir: Optional[str]) -> None:
+        self.temp_dir = tempfile.mkdtemp(prefix="gen-readme-", dir=scratch_dir)
+        self._dirs.append(self.temp_dir)
+
+    def _can_fall_back(self) -> bool:
+        """--scratch-dir를 지정하지 않아 기본 tmpfs를 쓰는 중이면 시스템 임시 디렉터리로 옮길 수 있다."""
+        if self._scratch_dir is not None or len(self._dirs) > 1:
+            return False
+        return os.path.dirname(self.temp_dir) != os.path.abspath(tempfile.gettempdir())
+
+    def _fall_back(self, start: int, error: OSError) -> None:
+        """
+        이번 호출에서 만든 샤드를 시스템 임시 디렉터리의 새 디렉터리로 옮기고, 이후 샤드도 그곳에 쓴다.
+        이전 호출의 샤드는 이미 프롬프트가 참조하고 있으므로 원래 디렉터리에 그대로 둔다.
+        """
+        print(
+            f"[경고] {self.temp_dir}에 컨텍스트를 저장하지 못해 ({error}) 시스템 임시 디렉터리에 저장합니다.",
+            file=sys.stderr,
+        )
+        self._make_dir(None)
+        for index in range(start, len(self.created_files)):
+            moved = os.path.join(self.temp_dir, os.path.basename(self.created_files[index]))
+            shutil.move(self.created_files[index], moved)
+            self.created_files[index] = moved
+
+    def _write_shard(self, paths: List[str], blocks: List[str], start: int) -> None:
+        shard_number = len(self.created_files) + 1
+        try:
+            path = self._write_shard_file(shard_number, paths, blocks)
+        except OSError as e:
+            if not self._can_fall_back():
+                raise
+            with contextlib.suppress(OSError):
+                os.remove(os.path.join(self.temp_dir, f"context_part_{shard_number}.txt"))
+            self._fall_back(start, e)
+            path = self._write_shard_file(shard_number, paths, blocks)
+        self.created_files.append(path)
+
+    def _write_shard_file(self, shard_number: int, paths: List[str], blocks: List[str]) -> str:
+        path = os.path.join(self.temp_dir, f"context_part_{shard_number}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_format_shard_index(shard_number, paths))
+            f.writelines(blocks)
+        return path
+
+    @profiling.traced("context.save_content_to_temp_files", cat="context", summarize=_shard_summary)
     def save_content_to_temp_files(
-        self, content_iterator: Iterator[str]
+        self, content_iterator: Iterator[str], announce: bool = True
     ) -> List[str]:
         """
-        주어진 내용 스트림을 16KB 단위로 나누어 임시 파일들로 저장합니다.
-        파일은 관리자 인스턴스에 의해 추적됩니다.
+        주어진 내용 스트림을 shard_size 이하의 샤드 파일들로 나누어 저장합니다.
+        샤드는 파일 헤더(FileHeader) 위치에서만 나뉘므로 파일 하나가 여러 샤드에 걸치지 않으며,
+        각 샤드의 맨 앞에는 그 샤드에 담긴 파일 목록이 붙습니다.
+        기본 tmpfs(/dev/shm)가 가득 차면 시스템 임시 디렉터리로 옮겨 계속 저장하고,
+        --scratch-dir로 지정한 디렉터리에 저장하지 못하면 RuntimeError를 발생시킵니다.
+        파일은 관리자 인스턴스에 의해 추적됩니다. 여러 번 호출하면 샤드 번호가 이어지며,
+        (섹션별 컨텍스트처럼) 호출마다 이번에 만든 샤드만 반환합니다.
 
         :param content_iterator: 파일에 저장할 문자열 내용 스트림
-        :return: 생성된 임시 파일들의 경로 리스트.
+        :param announce: False이면 저장 위치를 출력하지 않는다. (디렉터리 요약처럼 작은 컨텍스트를 많이 만들 때)
+        :return: 이번 호출에서 생성된 임시 파일들의 경로 리스트.
         """
         if not self.temp_dir:
             raise Exception("임시 디렉터리가 설정되지 않았습니다. 'with' 구문 안에서 사용해야 합니다.")
-
-        f = None
-        file_count = 0
+        start = len(self.created_files)
+
+        # 현재 샤드에 담을 파일 블록들과, 아직 끝나지 않은 파일 블록
+        shard_paths: List[str] = []
+        shard_blocks: List[str] = []
+        shard_bytes = 0
+        block_path: Optional[str] = None
+        block: List[str] = []
+        block_bytes = 0
+
+        def flush_block():
+            nonlocal shard_bytes
+            if not block:
+                return
+            if shard_blocks and shard_bytes + block_bytes > self.shard_size:
+                self._write_shard(shard_paths, shard_blocks, start)
+                shard_paths.clear()
+                shard_blocks.clear()
+                shard_bytes = 0
+            if block_path is not None:
+                shard_paths.append(block_path)
+            shard_blocks.append("".join(block))
+            shard_bytes += block_bytes
 
         try:
             for chunk in content_iterator:
-                if f is None:
-                    file_count += 1
-                    f = tempfile.NamedTemporaryFile(
-                        "w",
-                        encoding="utf-8",
-                        suffix=f"_part_{file_count}.txt",
-                        delete=False,
-                        dir=self.temp_dir,
-                    )
-                    self.created_files.append(f.name)
-
-                f.write(chunk)
-
-                if f.tell() > CHUNK_SIZE:
-                    f.close()
-                    f = None
-
-            if f is not None:
-                f.close()
-
-            if len(self.created_files) > 1:
+                if isinstance(chunk, FileHeader):
+                    flush_block()
+                    block_path, block, block_bytes = chunk.path, [], 0
+                block.append(chunk)
+                block_bytes += len(chunk.encode("utf-8"))
+            flush_block()
+            if shard_blocks:
+                self._write_shard(shard_paths, shard_blocks, start)
+
+            created = self.created_files[start:]
+            if not announce:
+                return created
+            if len(created) > 1:
                 print(
-                    f"[정보] 수집된 컨텍스트가 {len(self.created_files)}개의 임시 파일로 분할 저장되었습니다."
+                    f"[정보] 수집된 컨텍스트가 {len(created)}개의 임시 파일로 분할 저장되었습니다."
                 )
-                for path in self.created_files:
+                for path in created:
                     print(f"  - {path}")
-            elif self.created_files:
+            elif created:
                 print(
-                    f"[정보] 수집된 컨텍스트가 임시 파일에 저장되었습니다: {self.created_files[0]}"
+                    f"[정보] 수집된 컨텍스트가 임시 파일에 저장되었습니다: {created[0]}"
                 )
 
-            return self.created_files
+            return created
 
-        except Exception as e:
-            if f:
-                f.close()
-            print(f"[경고] 임시 파일 생성에 실패했습니다: {e}", file=sys.stderr)
-            # 실패 시에도 __exit__에서 정리되므로 여기서 즉시 삭제할 필요는 없음
-            return []
+        except OSError as e:
+            # 이미 만든 샤드는 __exit__에서 정리되므로 여기서 즉시 삭제할 필요는 없음
+            raise RuntimeError(f"컨텍스트를 임시 파일에 저장하지 못했습니다: {e}") from e
 
     def cleanup(self):
         """임시 디렉터리와 그 안의 모든 파일을 삭제합니다."""
-        if self.temp_dir and os.path.exists(self.temp_dir):
+        for temp_dir in self._dirs:
+            if not os.path.exists(temp_dir):
+                continue
             try:
-                shutil.rmtree(self.temp_dir)
-                print(f"[정보] 임시 디렉터리 및 모든 파일이 삭제되었습니다: {self.temp_dir}")
+                shutil.rmtree(temp_dir)
+                print(f"[정보] 임시 디렉터리 및 모든 파일이 삭제되었습니다: {temp_dir}")
             except OSError as e:
                 print(
-                    f"[에러] 임시 디렉터리 삭제 중 오류가 발생했습니다: {self.temp_dir} ({e})",
+                    f"[에러] 임시 디렉터리 삭제 중 오류가 발생했습니다: {temp_dir} ({e})",
                     file=sys.stderr,
                 )
         self.temp_dir = None
         self.created_files = []
+        self._dirs = []
 
 
 def read_content_from_files(file_paths: List[str]) -> str:
@@ -0,0 +1,274 @@
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Iterator
+
+from . import git_utils
+from .dir_text_collector import (
+    DEFAULT_JOBS,
+    FileText,
+    _collect_ordered,
+    _repo_relative_entries,
+    read_text_file,
+)
+from .response_cache import merkle_root
+
+
+@dataclass
+class _Entry:
+    """메모리에 보관한 파일 하나. text가 None이면 바이너리/링크 등 수집 대상이 아닌 파일이다."""
+
+    relative_path: str
+    signature: tuple[int, int, int]  # (inode, mtime_ns, 크기)
+    text: FileText | None = None
+    digest: bytes = b""
+
+
+def _signature(st: os.stat_result) -> tuple[int, int, int]:
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _walk_order(relative_path: str) -> tuple:
+    """
+    os.walk 수집 순서(디렉터리마다 파일을 먼저, 하위 디렉터리는 이름순)와 같은 정렬 키.
+    감시 모드의 컨텍스트가 일반 실행과 같은 순서가 되어 응답 캐시를 함께 쓸 수 있다.
+    """
+    parts = relative_path.split(os.sep)
+    return tuple((1, part) for part in parts[:-1]) + ((0, parts[-1]),)
+
+
+class TreeSnapshot:
+    """
+    패키지의 수집 대상 파일 내용을 메모리에 보관하고, 바뀐 파일만 다시 읽어 갱신한다.
+    파일 선택 기준은 dir_text_collector와 같다. (git 저장소면 추적 파일, 아니면 숨김 파일을 제외한 모든 파일)
+
+    변경 감지는 디렉터리를 다시 탐색하지 않고 알고 있는 경로만 stat한다.
+    git 저장소는 인덱스 파일이 바뀌었을 때만 추적 파일 목록을 다시 조회하고,
+    git 저장소가 아니면 수정 시각이 바뀐 디렉터리만 다시 읽어 추가/삭제된 파일을 찾는다.
+
+    :param ignore: 변경되어도 재생성을 일으키지 않는 패키지 기준 상대 경로 (생성 결과인 README.md 등)
+    """
+
+    def __init__(
+        self,
+        repo_ctx: git_utils.RepoContext,
+        skip_hidden: bool = True,
+        ignore: tuple[str, ...] = (),
+    ):
+        self.repo_ctx = repo_ctx
+        self.root = str(repo_ctx.package_dir)
+        self.skip_hidden = skip_hidden
+        self.ignore = frozenset(ignore)
+        self._entries: dict[str, _Entry] = {}  # {절대 경로: 항목}
+        self._order: list[str] | None = None
+        self._dirs: dict[str, int] = {}  # git 저장소가 아닐 때 {디렉터리 절대 경로: mtime_ns}
+        self._index_path: str | None = None
+        self._index_mtime = 0
+
+    # ----- 파일 목록 -----
+
+    def _list_git_files(self) -> list[str]:
+        tracked = git_utils.get_tracked_files(self.repo_ctx)
+        return [path for path, _ in _repo_relative_entries(self.repo_ctx, tracked)]
+
+    def _scan_dir(self, directory: str) -> tuple[list[str], list[str]]:
+        """디렉터리 하나의 (파일 경로 목록, 하위 디렉터리 경로 목록). 숨김 항목과 링크 디렉터리는 제외한다."""
+        files, subdirs = [], []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if self.skip_hidden and entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            pass
+        return files, subdirs
+
+    def _walk_dirs(self, top: str) -> list[str]:
+        """top 아래의 파일을 모두 찾고, 방문한 디렉터리의 수정 시각을 기록한다."""
+        found = []
+        stack = [top]
+        while stack:
+            directory = stack.pop()
+            try:
+                self._dirs[directory] = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            files, subdirs = self._scan_dir(directory)
+            found += files
+            stack += subdirs
+        return found
+
+    def _index_file(self) -> str | None:
+        git_dir = os.path.join(str(self.repo_ctx.git_root), ".git")
+        if os.path.isfile(git_dir):  # worktree/submodule: "gitdir: <경로>"
+            with open(git_dir, "r", encoding="utf-8", errors="ignore") as f:
+                pointer = f.read().strip()
+            git_dir = os.path.join(str(self.repo_ctx.git_root), pointer[len("gitdir: "):])
+        index = os.path.join(git_dir, "index")
+        return index if os.path.exists(index) else None
+
+    def _index_changed(self) -> bool:
+        if self._index_path is None:
+            return False
+        try:
+            mtime = os.stat(self._index_path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self._index_mtime:
+            return False
+        self._index_mtime = mtime
+        return True
+
+    # ----- 읽기 -----
+
+    def _relative(self, path: str) -> str:
+        return os.path.relpath(path, self.root)
+
+    def _read(self, paths: list[str], jobs: int) -> None:
+        """paths를 병렬로 읽어 항목을 만든다. (사라졌거나 읽을 수 없는 파일은 목록에서 제외)"""
+        # 읽는 도중 파일이 바뀌어도 다음 poll에서 알아챌 수 있도록 stat을 먼저 한다.
+        signatures = {}
+        for path in paths:
+            try:
+                signatures[path] = _signature(os.lstat(path))
+            except OSError:
+                self._entries.pop(path, None)
+        entries = iter([(path, self._relative(path)) for path in signatures])
+        for path, relative, future in _collect_ordered(entries, read_text_file, jobs):
+            error = future.exception()
+            if error is not None:
+                print(f"[경고] 파일 읽기 실패: {path} ({error})")
+                result = None
+            else:
+                result = future.result()
+            digest = b""
+            if result is not None:
+                h = hashlib.blake2b(relative.encode("utf-8"), digest_size=32)
+                h.update(b"\0" + result.text.encode("utf-8"))
+                digest = h.digest()
+            self._entries[path] = _Entry(relative, signatures[path], result, digest)
+        self._order = None
+
+    def load(self, jobs: int | None = None) -> "TreeSnapshot":
+        """파일 목록을 한 번 조회하고 모든 파일을 읽는다."""
+        if self.repo_ctx.is_git:
+            self._index_path = self._index_file()
+            self._index_changed()
+            paths = self._list_git_files()
+            print(f"[정보] .gitignore를 기준으로 {len(paths)}개의 파일을 감시합니다.")
+        else:
+            paths = self._walk_dirs(self.root)
+            print(f"[정보] Git 저장소가 아니므로, 숨김 파일을 제외한 {len(paths)}개의 파일을 감시합니다.")
+        self._read(paths, jobs or DEFAULT_JOBS)
+        return self
+
+    # ----- 변경 감지 -----
+
+    def poll(self) -> set[str]:
+        """
+        마지막 확인 이후 추가/수정/삭제된 파일의 절대 경로를 반환한다. 내용은 아직 읽지 않는다.
+        반환한 경로는 apply로 다시 읽어야 하며, 그 전까지는 같은 경로를 다시 보고하지 않는다.
+        """
+        changed: set[str] = set()
+        if self.repo_ctx.is_git:
+            if self._index_changed():
+                current = set(self._list_git_files())
+                known = set(self._entries)
+                changed |= current ^ known
+                for path in known - current:
+                    self._entries.pop(path, None)
+                for path in current - known:
+                    self._entries[path] = _Entry(self._relative(path), (0, 0, -1))
+                self._order = None
+        else:
+            for directory, mtime in list(self._dirs.items()):
+                try:
+                    current_mtime = os.stat(directory).st_mtime_ns
+                except OSError:
+                    self._dirs.pop(directory, None)
+                    continue
+                if current_mtime == mtime:
+                    continue
+                self._dirs[directory] = current_mtime
+                files, subdirs = self._scan_dir(directory)
+                for path in files:
+                    if path not in self._entries:
+                        changed.add(path)
+                        self._entries[path] = _Entry(self._relative(path), (0, 0, -1))
+                        self._order = None
+                for subdir in subdirs:
+                    if subdir not in self._dirs:
+                        for path in self._walk_dirs(subdir):
+                            changed.add(path)
+                            self._entries[path] = _Entry(self._relative(path), (0, 0, -1))
+                        self._order = None
+
+        for path, entry in list(self._entries.items()):
+            try:
+                signature = _signature(os.lstat(path))
+            except (FileNotFoundError, NotADirectoryError):
+                changed.add(path)
+                del self._entries[path]
+                self._order = None
+                continue
+            if signature != entry.signature:
+                changed.add(path)
+                entry.signature = signature
+        if not self.repo_ctx.is_git:
+            for directory in [d for d in self._dirs if not os.path.isdir(d)]:
+                del self._dirs[directory]
+        return changed
+
+    def apply(self, changed: set[str], jobs: int | None = None) -> list[str]:
+        """
+        poll이 보고한 경로를 다시 읽고, 내용이 실제로 바뀌었거나 추가/삭제된 파일의 상대 경로를 반환한다.
+        저장만 다시 하거나 수정 후 되돌린 파일, ignore에 해당하는 파일은 다시 읽기만 하고 반환하지 않는다.
+        """
+        before = {path: self._entries[path].digest for path in changed if path in self._entries}
+        removed = [self._relative(path) for path in changed if path not in self._entries]
+        self._read(list(before), jobs or DEFAULT_JOBS)
+        modified = [
+            self._entries[path].relative_path
+            for path, digest in before.items()
+            if path in self._entries and self._entries[path].digest != digest
+        ]
+        return sorted(path for path in modified + removed if path not in self.ignore)
+
+    # ----- 수집 -----
+
+    def _ordered_paths(self) -> list[str]:
+        if self._order is None:
+            if self.repo_ctx.is_git:
+                # git ls-files와 같은 순서 (git 루트 기준 경로의 바이트 순)
+                key = lambda path: os.path.relpath(path, str(self.repo_ctx.git_root)).encode("utf-8")
+            else:
+                key = lambda path: _walk_order(self._entries[path].relative_path)
+            self._order = sorted(self._entries, key=key)
+        return self._order
+
+    def entries(self) -> Iterator[tuple[str, str]]:
+        """collect_files의 파일 목록과 같은 형식의 (절대 경로, 상대 경로)를 수집 순서대로 반환한다."""
+        for path in self._ordered_paths():
+            yield path, self._entries[path].relative_path
+
+    def read(self, file_path: str) -> FileText | None:
+        """메모리에 보관한 파일 내용. collect_files의 reader로 사용한다."""
+        entry = self._entries.get(file_path)
+        return entry.text if entry is not None else None
+
+    def fingerprint(self) -> str:
+        """ignore를 제외한 수집 대상 파일 내용의 Merkle 루트."""
+        leaves = [
+            self._entries[path].digest
+            for path in self._ordered_paths()
+            if self._entries[path].digest and self._entries[path].relative_path not in self.ignore
+        ]
+        return merkle_root(leaves).hex()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
@@ -0,0 +1,106 @@
+import pathlib
+import sys
+import time
+from typing import Callable
+
+from . import git_utils
+from .app import generate_readme
+from .config import DEFAULT_README_NAME
+from .providers import ReadmeProvider
+from .response_cache import ResponseCache
+from .tree_snapshot import TreeSnapshot
+
+# 변경이 끊이지 않아도 debounce의 이 배수만큼 기다린 뒤에는 재생성한다.
+MAX_DEBOUNCE_FACTOR = 10
+# 변경 목록을 출력할 때 보여 줄 최대 파일 수
+_PREVIEW_FILES = 5
+
+
+def wait_for_changes(
+    snapshot: TreeSnapshot,
+    poll_interval: float,
+    debounce: float,
+    sleep: Callable[[float], None] = time.sleep,
+) -> set[str]:
+    """
+    첫 변경이 생길 때까지 poll_interval마다 확인하고, 그 뒤 debounce(초) 동안 추가 변경이 없을 때까지
+    변경을 모아 한 번에 반환한다. (저장 한 번에 여러 파일이 바뀌거나 편집기가 여러 번 쓰는 경우)
+    """
+    changed: set[str] = set()
+    while not changed:
+        sleep(poll_interval)
+        changed = snapshot.poll()
+
+    step = min(poll_interval, debounce) if debounce > 0 else 0
+    first = last_change = time.monotonic()
+    while debounce > 0:
+        now = time.monotonic()
+        if now - last_change >= debounce or now - first >= debounce * MAX_DEBOUNCE_FACTOR:
+            break
+        sleep(step)
+        more = snapshot.poll()
+        if more:
+            changed |= more
+            last_change = time.monotonic()
+    return changed
+
+
+def _describe(paths: list[str]) -> str:
+    shown = ", ".join(paths[:_PREVIEW_FILES])
+    if len(paths) > _PREVIEW_FILES:
+        shown += f" 외 {len(paths) - _PREVIEW_FILES}개"
+    return shown
+
+
+def watch_package(
+    args,
+    pkg: pathlib.Path,
+    provider: ReadmeProvider,
+    repo_ctx: git_utils.RepoContext,
+    responses: ResponseCache | None = None,
+) -> int:
+    """
+    패키지를 감시하면서 코드가 바뀔 때마다 README를 다시 생성한다. Ctrl+C로 끝낸다.
+    파일 목록 조회와 git 루트 탐색은 시작할 때 한 번만 하고, 이후에는 바뀐 파일만 다시 읽어
+    메모리의 컨텍스트를 갱신한다. 수집 대상 파일 내용의 fingerprint가 마지막 생성 때와 같으면
+    (저장만 다시 했거나 수정 후 되돌린 경우) 다시 생성하지 않는다.
+    생성 중 오류가 나도 감시는 계속하며, 다음 변경 때 다시 시도한다.
+    """
+    # 생성 결과인 README가 바뀌는 것은 재생성 사유가 아니다. (자기 출력으로 무한히 다시 생성하지 않도록)
+    snapshot = TreeSnapshot(repo_ctx, ignore=(DEFAULT_README_NAME,)).load(args.jobs)
+    print(
+        f"[정보] {pkg} 감시를 시작합니다. (확인 간격 {args.poll_interval}초, debounce {args.debounce}초, Ctrl+C로 종료)",
+        file=sys.stderr,
+    )
+
+    last_fingerprint: str | None = None
+    cycle = 0
+    try:
+        while True:
+            fingerprint = snapshot.fingerprint()
+            if fingerprint == last_fingerprint:
+                print("[정보] 컨텍스트 fingerprint가 같아 README를 다시 생성하지 않습니다.", file=sys.stderr)
+            else:
+                last_fingerprint = fingerprint
+                cycle += 1
+                started = time.monotonic()
+                try:
+                    result = generate_readme(args, pkg, provider, repo_ctx, responses=responses, snapshot=snapshot)
+                except (ValueError, RuntimeError) as e:
+                    print(f"[에러] {cycle}번째 생성 실패: {e} (다음 변경 때 다시 시도합니다)", file=sys.stderr)
+                else:
+                    print(
+                        f"[정보] {cycle}번째 생성 완료: {result.action}"
+                        f"{' (캐시)' if result.cached else ''}, LLM 대화 턴 {result.llm_turns}회, "
+                        f"{time.monotonic() - started:.1f}초",
+                        file=sys.stderr,
+                    )
+
+            while True:
+                changed = snapshot.apply(wait_for_changes(snapshot, args.poll_interval, args.debounce), args.jobs)
+                if changed:
+                    break
+            print(f"[정보] 변경된 파일 {len(changed)}개: {_describe(changed)}", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("\n[정보] 감시를 종료합니다.", file=sys.stderr)
+        return 0